@@ -0,0 +1,90 @@
+"""
+Benchmark: batched contact extraction vs the previous per-page functions.
+
+Builds a corpus of page texts from the saved pages (with a varying contact
+block per page) and extracts emails and phones from all of them.
+
+Usage:
+    python benchmarks/bench_contacts.py [--corpus DIR] [--pages N] [--batch-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from pathlib import Path
+from time import perf_counter
+
+from contacts_parser.parser.extractor import extract_from_html
+from contacts_parser.parser.utils import _is_valid_email, extract_contacts_batch, phone_variants
+
+DEFAULT_CORPUS = Path(__file__).parent / "corpus"
+
+_LEGACY_NON_DIGITS = re.compile(r"\D")
+_LEGACY_PHONE_PATTERN = re.compile(r"(?:\+7|7|8)?[\s\-()]*\d{3}[\s\-()]*\d{3}[\s\-]*\d{2}[\s\-]*\d{2}")
+_LEGACY_EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+
+def legacy_normalize_phone(raw_digits: str) -> set[str]:
+    # Previous implementation: re.sub and three variants per match
+    digits = _LEGACY_NON_DIGITS.sub("", raw_digits)
+    if len(digits) == 11 and digits[0] in {"7", "8"}:
+        core = digits[1:]
+    elif len(digits) == 10 and digits[0] in {"9", "4", "8"}:
+        core = digits
+    else:
+        return set()
+    return {f"+7{core}", f"7{core}", f"8{core}"}
+
+
+def legacy_contacts(text: str) -> tuple[set[str], set[str]]:
+    emails = set(filter(_is_valid_email, _LEGACY_EMAIL_PATTERN.findall(text)))
+    phones: set[str] = set()
+    for match in _LEGACY_PHONE_PATTERN.findall(text):
+        phones.update(legacy_normalize_phone(match))
+    return emails, phones
+
+
+def build_texts(corpus: Path, pages: int) -> list[str]:
+    paths = sorted(corpus.glob("*.html"))
+    bases = ["".join(extract_from_html(path.read_text(encoding="utf-8")).text) for path in paths]
+    if not bases:
+        raise SystemExit(f"No *.html pages in {corpus}")
+    texts = []
+    for i in range(pages):
+        phone = f"+7 (9{i % 100:02d}) {i % 1000:03d}-{i % 97:02d}-{i % 89:02d}"
+        texts.append(f"{bases[i % len(bases)]} Отдел {i}: dept{i}@example.com, {phone}")
+    return texts
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="directory with saved *.html pages")
+    arg_parser.add_argument("--pages", type=int, default=10_000)
+    arg_parser.add_argument("--batch-size", type=int, default=1000)
+    args = arg_parser.parse_args()
+
+    texts = build_texts(args.corpus, args.pages)
+    megabytes = sum(len(text) for text in texts) / 1024 / 1024
+    print(f"{len(texts)} texts, {megabytes:.1f} MB\n")
+
+    started = perf_counter()
+    legacy = [legacy_contacts(text) for text in texts]
+    baseline = perf_counter() - started
+    print(f"{'per page (legacy)':<32} {baseline:8.3f}s  {len(texts) / baseline:10.0f} texts/s")
+
+    started = perf_counter()
+    batched = []
+    for offset in range(0, len(texts), args.batch_size):
+        batched.extend(extract_contacts_batch(texts[offset : offset + args.batch_size]))
+    elapsed = perf_counter() - started
+    print(f"{f'batched ({args.batch_size} per call)':<32} {elapsed:8.3f}s  {len(texts) / elapsed:10.0f} texts/s")
+    print(f"{'speedup':<32} {baseline / elapsed:8.2f}x")
+
+    for (emails, phones), contacts in zip(legacy, batched):
+        assert emails == contacts.emails, "email mismatch"
+        assert phones == {variant for phone in contacts.phones for variant in phone_variants(phone)}, "phone mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+End-to-end crawl benchmark against a local fake site.
+
+Each scenario starts a synthetic site (see fake_site.py) in this process and
+crawls it from a fresh child process, through `Parser.run` or the `/parse`
+API, so peak RSS and CPU time belong to the crawl alone. Results are
+written as JSON; `--compare` checks pages/s against an earlier results file.
+
+Usage:
+    python benchmarks/bench_crawl.py [--scenario NAME ...] [--mode parser|api] [--engine threads|async]
+                                     [--output results.json] [--compare baseline.json] [--tolerance 0.1]
+    python benchmarks/bench_crawl.py --scenario custom --pages 1000 --fanout 8 --latency-ms 20 --error-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields, replace
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from fake_site import FakeSite, SiteConfig
+
+SCENARIOS: dict[str, SiteConfig] = {
+    "baseline": SiteConfig(pages=300, fanout=5, page_size=10_000, latency_ms=5.0),
+    "large-pages": SiteConfig(pages=150, fanout=4, page_size=200_000, latency_ms=5.0),
+    "slow-host": SiteConfig(pages=150, fanout=6, page_size=10_000, latency_ms=50.0),
+    "flaky": SiteConfig(pages=200, fanout=5, page_size=10_000, latency_ms=5.0, error_rate=0.05, rate_limit_rate=0.05),
+    "contact-dense": SiteConfig(pages=300, fanout=5, page_size=20_000, latency_ms=2.0, contact_density=1.0),
+}
+
+
+def _percentile(values: list[float], q: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def _crawl(url: str, mode: str) -> dict[str, Any]:
+    """Runs in the child process"""
+    logging.basicConfig(level=logging.ERROR)
+    from contacts_parser.parser import parser as parser_module
+    from contacts_parser.parser.parser import Parser
+
+    # Time every page fetch at the client entry points of both engines
+    latencies: list[float] = []
+    fetch, afetch = parser_module.request_data, parser_module.request_data_async
+
+    def timed_fetch(*args: Any, **kwargs: Any) -> Any:
+        started = perf_counter()
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            latencies.append(perf_counter() - started)
+
+    async def atimed_fetch(*args: Any, **kwargs: Any) -> Any:
+        started = perf_counter()
+        try:
+            return await afetch(*args, **kwargs)
+        finally:
+            latencies.append(perf_counter() - started)
+
+    parser_module.request_data = timed_fetch
+    parser_module.request_data_async = atimed_fetch
+    if mode == "api":
+        from fastapi.testclient import TestClient
+
+        from contacts_parser.api.main import app
+
+        client = TestClient(app)
+        client.get("/metrics")
+
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    started = perf_counter()
+    if mode == "api":
+        response = client.post("/parse", json={"url": url})
+        response.raise_for_status()
+        body = response.json()
+        emails, phones, metrics = body["emails"], body["phones"], {}
+        pages = len(latencies)
+    else:
+        result = Parser(url).run()
+        emails, phones, metrics = result.emails, result.phones, result.metrics
+        pages = result.pages_parsed
+    elapsed = perf_counter() - started
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    cpu = (usage.ru_utime - usage_before.ru_utime) + (usage.ru_stime - usage_before.ru_stime)
+    latencies_ms = sorted(value * 1000 for value in latencies)
+    return {
+        "pages_parsed": pages,
+        "requests": len(latencies),
+        "emails_found": len(emails),
+        "phones_found": len(phones),
+        "duration_seconds": round(elapsed, 3),
+        "pages_per_second": round(pages / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(latencies_ms, 50), 2),
+            "p99": round(_percentile(latencies_ms, 99), 2),
+        },
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        "peak_rss_mb": round(usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_percent": round(cpu / elapsed * 100, 1) if elapsed else 0.0,
+        "metrics": metrics,
+    }
+
+
+def run_scenario(name: str, config: SiteConfig, mode: str, engine: str) -> dict[str, Any]:
+    env = {
+        "CRAWLER_ENGINE": engine,
+        "MAX_PAGES_DEEP": str(config.pages + 1),
+        "HTTP_MIN_DELAY_SECONDS": "0",
+        "HTTP_CACHE_ENABLED": "false",
+    }
+    os.environ.update(env)
+
+    with FakeSite(config) as site:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            measured = executor.submit(_crawl, site.url, mode).result()
+
+    return {"scenario": name, "mode": mode, "engine": engine, "site": asdict(config), **measured}
+
+
+def compare(results: list[dict[str, Any]], baseline_path: Path, tolerance: float) -> bool:
+    previous = json.loads(baseline_path.read_text())
+    baseline = {(item["scenario"], item["mode"], item["engine"]): item for item in previous}
+    ok = True
+    for item in results:
+        before = baseline.get((item["scenario"], item["mode"], item["engine"]))
+        if before is None or not before["pages_per_second"]:
+            continue
+        ratio = item["pages_per_second"] / before["pages_per_second"]
+        regressed = ratio < 1 - tolerance
+        ok &= not regressed
+        flag = "REGRESSION" if regressed else "ok"
+        print(
+            f"{item['scenario']:<16} {before['pages_per_second']:9.1f} -> "
+            f"{item['pages_per_second']:9.1f} pages/s  {flag}"
+        )
+    return ok
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--scenario", nargs="*", default=list(SCENARIOS), help=f"{', '.join(SCENARIOS)} or custom")
+    arg_parser.add_argument("--mode", choices=("parser", "api"), default="parser")
+    arg_parser.add_argument("--engine", choices=("threads", "async"), default="threads")
+    arg_parser.add_argument("--output", type=Path, help="write results as JSON")
+    arg_parser.add_argument("--compare", type=Path, help="earlier results JSON; exit 1 on a pages/s regression")
+    arg_parser.add_argument("--tolerance", type=float, default=0.1, help="allowed pages/s drop for --compare")
+    for field in fields(SiteConfig):
+        arg_parser.add_argument(f"--{field.name.replace('_', '-')}", type=type(field.default), default=None)
+    args = arg_parser.parse_args()
+
+    overrides = {field.name: getattr(args, field.name) for field in fields(SiteConfig)}
+    overrides = {name: value for name, value in overrides.items() if value is not None}
+
+    results = []
+    for name in args.scenario:
+        config = replace(SCENARIOS.get(name, SiteConfig()), **overrides)
+        result = run_scenario(name, config, args.mode, args.engine)
+        results.append(result)
+        print(
+            f"{name:<16} {result['pages_parsed']:6d} pages  {result['pages_per_second']:9.1f} pages/s  "
+            f"p50 {result['latency_ms']['p50']:7.1f} ms  p99 {result['latency_ms']['p99']:7.1f} ms  "
+            f"rss {result['peak_rss_mb']:6.1f} MB  cpu {result['cpu_percent']:5.1f}%"
+        )
+
+    if args.output:
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        }
+        args.output.write_text(json.dumps([{**report, **item} for item in results], indent=2, ensure_ascii=False))
+
+    if args.compare and not compare(results, args.compare, args.tolerance):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
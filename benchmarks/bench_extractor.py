@@ -0,0 +1,139 @@
+"""
+Micro-benchmark: single-pass extraction vs the previous CSS-select based grab_contacts.
+
+Usage:
+    python benchmarks/bench_extractor.py [--corpus DIR] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+from bs4 import BeautifulSoup
+
+from contacts_parser.parser.backends import available_backends, get_backend
+from contacts_parser.parser.extractor import extract_from_html, extract_from_soup
+from contacts_parser.parser.utils import (
+    _is_valid_email,
+    _normalize_russian_phone_variants,
+    contacts_from_extracted,
+)
+
+DEFAULT_CORPUS = Path(__file__).parent / "corpus"
+
+
+def legacy_grab_contacts(page: BeautifulSoup) -> dict[str, list[str]]:
+    # Previous implementation, kept verbatim as the baseline: four selects plus
+    # get_text(), with the patterns compiled on every call.
+    email_pattern = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+    phone_pattern = re.compile(r"(?:\+7|7|8)?[\s\-()]*\d{3}[\s\-()]*\d{3}[\s\-]*\d{2}[\s\-]*\d{2}")
+
+    attribute_values: list[str] = []
+    for element in page.select("[href], [src]"):
+        href_value = element.get("href")
+        src_value = element.get("src")
+        if href_value:
+            attribute_values.append(href_value)
+        if src_value:
+            attribute_values.append(src_value)
+
+    emails = set(
+        filter(
+            None,
+            [
+                email_link.get("href").removeprefix("mailto:").split("?")[0].strip()
+                for email_link in page.select("[href^='mailto:']")
+            ],
+        )
+    )
+
+    combined_text = " ".join([page.get_text(), *attribute_values])
+    emails.update(filter(_is_valid_email, email_pattern.findall(combined_text)))
+
+    phones: set[str] = set()
+    for element in page.select("[href^='tel:'], [src^='tel:']"):
+        value = element.get("href") or element.get("src")
+        if value:
+            phones.update(_normalize_russian_phone_variants(value.removeprefix("tel:").split("?")[0]))
+
+    for match in phone_pattern.findall(combined_text):
+        phones.update(_normalize_russian_phone_variants(match))
+
+    return {"emails": list(emails), "phones": list(phones)}
+
+
+def legacy_links(page: BeautifulSoup) -> list[str]:
+    return [link.get("href") for link in page.select("[href], [src]") if link.get("href")]
+
+
+def _legacy_pass(page: BeautifulSoup) -> None:
+    legacy_grab_contacts(page)
+    legacy_links(page)
+
+
+def _timed(label: str, rounds: int, pages: list, func: Callable) -> float:
+    started = perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            func(page)
+    elapsed = perf_counter() - started
+    per_page_ms = elapsed / (rounds * len(pages)) * 1000
+    print(f"{label:<42} {elapsed:8.3f}s  {per_page_ms:8.3f} ms/page")
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="directory with saved *.html pages")
+    arg_parser.add_argument("--rounds", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    markups = [path.read_text(encoding="utf-8") for path in sorted(args.corpus.glob("*.html"))]
+    if not markups:
+        raise SystemExit(f"No *.html pages in {args.corpus}")
+    soups = [BeautifulSoup(markup, "html.parser") for markup in markups]
+
+    for soup, markup in zip(soups, markups):
+        legacy = legacy_grab_contacts(soup)
+        current = contacts_from_extracted(extract_from_html(markup))
+        assert set(legacy["emails"]) == set(current["emails"]), "email mismatch"
+        assert set(legacy["phones"]) == set(current["phones"]), "phone mismatch"
+
+    print(f"{len(markups)} pages x {args.rounds} rounds\n")
+
+    print("Extraction on an already parsed tree:")
+    baseline = _timed("legacy grab_contacts + link select", args.rounds, soups, _legacy_pass)
+    single = _timed(
+        "single walk (extract_from_soup)", args.rounds, soups, lambda s: contacts_from_extracted(extract_from_soup(s))
+    )
+    print(f"{'speedup':<42} {baseline / single:8.2f}x\n")
+
+    print("End to end from markup:")
+    baseline = _timed(
+        "BeautifulSoup + legacy grab_contacts",
+        args.rounds,
+        markups,
+        lambda m: _legacy_pass(BeautifulSoup(m, "html.parser")),
+    )
+    callbacks = _timed(
+        "HTMLParser callbacks (extract_from_html)",
+        args.rounds,
+        markups,
+        lambda m: contacts_from_extracted(extract_from_html(m)),
+    )
+    print(f"{'speedup':<42} {baseline / callbacks:8.2f}x\n")
+
+    print("HTML backends from bytes (PARSER_BACKEND):")
+    bodies = [markup.encode("utf-8") for markup in markups]
+    for name in available_backends():
+        backend = get_backend(name)
+        elapsed = _timed(name, args.rounds, bodies, lambda b: contacts_from_extracted(backend.extract(b)))
+        print(f"{'speedup vs BeautifulSoup + legacy':<42} {baseline / elapsed:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Throughput benchmark: parsing in the I/O threads vs a process pool.
+
+Every page costs a simulated network wait (in the I/O thread) plus a real
+parse + extract of a corpus page, inline or in PARSER_PROCESSES workers.
+
+Usage:
+    python benchmarks/bench_process_pool.py [--corpus DIR] [--pages N] [--io-workers N] [--latency MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter, sleep
+
+from contacts_parser.parser.process_pool import parse_content
+
+DEFAULT_CORPUS = Path(__file__).parent / "corpus"
+
+
+def _crawl(bodies: list[bytes], io_workers: int, latency: float, pool: ProcessPoolExecutor | None) -> float:
+    def fetch_and_parse(body: bytes) -> None:
+        sleep(latency)
+        if pool is None:
+            parse_content(body)
+        else:
+            pool.submit(parse_content, body).result()
+
+    started = perf_counter()
+    with ThreadPoolExecutor(max_workers=io_workers) as executor:
+        list(executor.map(fetch_and_parse, bodies))
+    return len(bodies) / (perf_counter() - started)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="directory with saved *.html pages")
+    arg_parser.add_argument("--pages", type=int, default=600)
+    arg_parser.add_argument("--io-workers", type=int, default=16)
+    arg_parser.add_argument("--latency", type=float, default=5.0, help="simulated fetch time per page, ms")
+    args = arg_parser.parse_args()
+
+    corpus = [path.read_bytes() for path in sorted(args.corpus.glob("*.html"))]
+    if not corpus:
+        raise SystemExit(f"No *.html pages in {args.corpus}")
+    bodies = [corpus[i % len(corpus)] for i in range(args.pages)]
+    latency = args.latency / 1000
+
+    print(f"{args.pages} pages, {args.io_workers} I/O threads, {args.latency:.1f} ms latency\n")
+    baseline = _crawl(bodies, args.io_workers, latency, None)
+    print(f"{'inline (threads only)':<24} {baseline:9.1f} pages/s")
+
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    for processes in counts:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            pool.submit(parse_content, corpus[0]).result()  # warm up workers
+            rate = _crawl(bodies, args.io_workers, latency, pool)
+        print(f"{f'{processes} processes':<24} {rate:9.1f} pages/s  {rate / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Local HTTP server generating a synthetic, deterministic site for crawl benchmarks.
+
+Page `i` lives at `/page/<i>` (page 0 is `/`) and links to its `fanout`
+children in a breadth-first tree plus a few seeded cross links. Latency,
+error and 429 rates, page size and contact density are configurable;
+injected failures depend only on the path and its request count, so runs
+are reproducible.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+
+_FILLER = (
+    "Компания занимается поставками оборудования и сервисным обслуживанием по всей России. "
+    "Our team ships orders within two business days and supports customers in every region. "
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SiteConfig:
+    pages: int = 200
+    fanout: int = 5
+    page_size: int = 10_000
+    latency_ms: float = 5.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    contact_density: float = 0.2
+    seed: int = 42
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # Crawlers drop connections early (size caps, shutdown); that is not a server failure
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class FakeSite:
+    """Serves one synthetic site on 127.0.0.1 from a background thread"""
+
+    def __init__(self, config: SiteConfig) -> None:
+        self.config = config
+        self._hits: dict[str, int] = {}
+        self._lock = Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> FakeSite:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def page(self, index: int) -> bytes:
+        config = self.config
+        rng = random.Random(config.seed * 1_000_003 + index)
+        children = range(index * config.fanout + 1, min(index * config.fanout + config.fanout, config.pages - 1) + 1)
+        cross = [rng.randrange(config.pages) for _ in range(2)]
+
+        parts = [f"<html><head><title>Page {index}</title></head><body><nav>"]
+        base = self.url.rstrip("/")
+        parts += [f'<a href="{base}{_path(target)}">Page {target}</a>' for target in (*children, *cross)]
+        parts.append("</nav><main>")
+        if rng.random() < config.contact_density:
+            parts.append(
+                f'<p>Email: <a href="mailto:office{index}@site.example">office{index}@site.example</a>, '
+                f"phone: +7 (9{index % 100:02d}) {index % 1000:03d}-{index % 90 + 10}-{index % 80 + 20}</p>"
+            )
+        size = sum(len(part) for part in parts)
+        filler_repeats = max(0, config.page_size - size) // len(_FILLER.encode()) + 1
+        parts.append(f"<p>{_FILLER * filler_repeats}</p></main></body></html>")
+        return "".join(parts).encode()
+
+    def _failure(self, path: str) -> int | None:
+        with self._lock:
+            attempt = self._hits[path] = self._hits.get(path, 0) + 1
+        roll = zlib.crc32(f"{self.config.seed}:{path}:{attempt}".encode()) / 0xFFFFFFFF
+        if roll < self.config.error_rate:
+            return 500
+        if roll < self.config.error_rate + self.config.rate_limit_rate:
+            return 429
+        return None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                if site.config.latency_ms:
+                    sleep(site.config.latency_ms / 1000)
+
+                index = _index(self.path)
+                if index is None or index >= site.config.pages:
+                    self._reply(404, b"not found")
+                    return
+
+                status = site._failure(self.path)
+                if status is not None:
+                    self._reply(status, b"try again", {"Retry-After": "0"} if status == 429 else None)
+                    return
+                self._reply(200, site.page(index))
+
+            def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def _path(index: int) -> str:
+    return "/" if index == 0 else f"/page/{index}"
+
+
+def _index(path: str) -> int | None:
+    if path == "/":
+        return 0
+    prefix, _, number = path.partition("/page/")
+    return int(number) if not prefix and number.isdigit() else None
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from threading import Condition, Lock
+from typing import Any, Literal
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.errors import ParserError
+from contacts_parser.parser.models import PageRecord, ParserResult
+from contacts_parser.parser.parser import Parser
+
+JobStatus = Literal["queued", "running", "finished", "failed"]
+
+
+class JobQueueFullError(Exception):
+    """Every worker is busy and the queue is at its depth limit"""
+
+    pass
+
+
+@dataclass(slots=True)
+class Job:
+    id: str
+    url: str
+    status: JobStatus = "queued"
+    pages_parsed: int = 0
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+    error: str | None = None
+    truncated: bool = False
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+    events: list[dict[str, Any]] = field(default_factory=list)
+    changed: Condition = field(default_factory=Condition)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("finished", "failed")
+
+
+class JobManager:
+    """Runs crawls on a bounded in-process executor and tracks their progress"""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int | None = None,
+        max_history: int | None = None,
+    ) -> None:
+        self._max_workers = max_workers or settings.jobs_max_workers
+        self._max_queue = settings.jobs_max_queue if max_queue is None else max_queue
+        self._max_history = max_history or settings.jobs_max_history
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="job")
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._active = 0
+        self._lock = Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def submit(self, url: str, deadline_seconds: float | None = None) -> Job:
+        job = Job(id=uuid.uuid4().hex, url=url)
+        # Built eagerly so an invalid URL fails the request instead of the job
+        parser = Parser(url, on_page=partial(self._on_page, job), deadline_seconds=deadline_seconds)
+
+        with self._lock:
+            if self._active >= self._max_workers + self._max_queue:
+                raise JobQueueFullError("Job queue is full, retry later")
+            self._active += 1
+            self._jobs[job.id] = job
+            self._evict_finished()
+
+        self._executor.submit(self._run, job, parser)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        return self._jobs[job_id]
+
+    def stream(self, job_id: str, poll_seconds: float = 1.0) -> Iterator[dict[str, Any]]:
+        return self._follow(self.get(job_id), poll_seconds)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Drop queued jobs; with `wait`, also block until running ones finish"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _follow(self, job: Job, poll_seconds: float) -> Iterator[dict[str, Any]]:
+        sent = 0
+
+        while True:
+            with job.changed:
+                while sent == len(job.events) and not job.done:
+                    job.changed.wait(poll_seconds)
+                pending = job.events[sent:]
+                done = job.done
+            sent += len(pending)
+            yield from pending
+
+            if done and sent == len(job.events):
+                return
+
+    def _run(self, job: Job, parser: Parser) -> None:
+        self._publish(job, {"type": "status", "status": "running"}, status="running")
+        try:
+            result = parser.run()
+        except ParserError as e:
+            self._logger.warning("Job failed", extra={"job_id": job.id, "url": job.url, "error": str(e)})
+            self._finish(job, "failed", error=str(e))
+        except Exception as e:
+            self._logger.exception("Job crashed", extra={"job_id": job.id, "url": job.url})
+            self._finish(job, "failed", error=str(e))
+        else:
+            self._finish(job, "finished", result=result)
+
+    def _on_page(self, job: Job, record: PageRecord, new_emails: set[str], new_phones: set[str]) -> None:
+        with job.changed:
+            job.pages_parsed += 1
+            job.emails.extend(new_emails)
+            job.phones.extend(new_phones)
+            job.events.extend({"type": "email", "value": email, "page": record.url} for email in new_emails)
+            job.events.extend({"type": "phone", "value": phone, "page": record.url} for phone in new_phones)
+            job.changed.notify_all()
+
+    def _finish(
+        self,
+        job: Job,
+        status: JobStatus,
+        result: ParserResult | None = None,
+        error: str | None = None,
+    ) -> None:
+        with job.changed:
+            if result is not None:
+                job.pages_parsed = result.pages_parsed
+                job.truncated = result.truncated
+            job.error = error
+            job.finished_at = datetime.utcnow()
+        event = {"type": "status", "status": status, "error": error, "truncated": job.truncated}
+        self._publish(job, event, status=status)
+
+        with self._lock:
+            self._active -= 1
+
+    def _publish(self, job: Job, event: dict[str, Any], status: JobStatus) -> None:
+        with job.changed:
+            job.status = status
+            job.events.append(event)
+            job.changed.notify_all()
+
+    def _evict_finished(self) -> None:
+        overflow = len(self._jobs) - self._max_history
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done][: max(overflow, 0)]:
+            del self._jobs[job_id]
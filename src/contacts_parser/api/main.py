@@ -1,31 +1,193 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, HttpUrl
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from datetime import datetime
 
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl
+
+from contacts_parser.api.jobs import Job, JobManager, JobQueueFullError
+from contacts_parser.core.config import settings
+from contacts_parser.infra.http import aclose_async_client, connection_stats
+from contacts_parser.infra.metrics import metrics_registry, render_connection_stats
+from contacts_parser.infra.store import ResultStore, get_result_store
+from contacts_parser.parser.batch import BatchCrawler
 from contacts_parser.parser.errors import ParserError, PermanentParserError
 from contacts_parser.parser.parser import Parser
+from contacts_parser.parser.process_pool import shutdown_process_pool
 
 
 class ParseRequest(BaseModel):
     url: HttpUrl
+    deadline_seconds: float | None = Field(default=None, gt=0)
 
 
 class ParseResponse(BaseModel):
     url: str
     emails: list[str]
     phones: list[str]
+    truncated: bool = False
+
+
+class BatchParseRequest(BaseModel):
+    urls: list[HttpUrl] = Field(min_length=1)
+
+
+class BatchParseItem(BaseModel):
+    url: str
+    emails: list[str] = []
+    phones: list[str] = []
+    error: str | None = None
 
 
-app = FastAPI(title="contacts-parser")
+class DomainHitResponse(BaseModel):
+    domain: str
+    first_seen: datetime
+    last_seen: datetime
+
+
+class DomainContactsResponse(BaseModel):
+    domain: str
+    emails: list[str]
+    phones: list[str]
+
+
+class JobResponse(BaseModel):
+    id: str
+    url: str
+    status: str
+    pages_parsed: int
+    emails: list[str]
+    phones: list[str]
+    error: str | None = None
+    truncated: bool = False
+    created_at: datetime
+    finished_at: datetime | None = None
+
+    @classmethod
+    def from_job(cls, job: Job) -> JobResponse:
+        with job.changed:
+            return cls(
+                id=job.id,
+                url=job.url,
+                status=job.status,
+                pages_parsed=job.pages_parsed,
+                emails=list(job.emails),
+                phones=list(job.phones),
+                error=job.error,
+                truncated=job.truncated,
+                created_at=job.created_at,
+                finished_at=job.finished_at,
+            )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Queued jobs are dropped first so none starts against a closed client or pool
+    jobs.shutdown(wait=False)
+    await aclose_async_client()
+    shutdown_process_pool()
+
+
+app = FastAPI(title="contacts-parser", lifespan=lifespan)
+jobs = JobManager()
+
+
+async def _cancel_on_disconnect(http_request: Request, parser: Parser, poll_seconds: float = 0.5) -> None:
+    while not await http_request.is_disconnected():
+        await asyncio.sleep(poll_seconds)
+    parser.cancel("client disconnected")
 
 
 @app.post("/parse", response_model=ParseResponse)
-def parse_contacts(request: ParseRequest) -> ParseResponse:
+async def parse_contacts(request: ParseRequest, http_request: Request) -> ParseResponse:
     try:
-        result = Parser(str(request.url)).run()
-        return ParseResponse(url=result.url, emails=result.emails, phones=result.phones)
+        parser = Parser(str(request.url), deadline_seconds=request.deadline_seconds)
+        watcher = asyncio.create_task(_cancel_on_disconnect(http_request, parser))
+        try:
+            if settings.crawler_engine == "async":
+                result = await parser.arun()
+            else:
+                result = await run_in_threadpool(parser.run)
+        finally:
+            watcher.cancel()
+        return ParseResponse(url=result.url, emails=result.emails, phones=result.phones, truncated=result.truncated)
     except PermanentParserError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ParserError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+
+@app.post("/parse/batch")
+def parse_contacts_batch(request: BatchParseRequest) -> StreamingResponse:
+    crawler = BatchCrawler(str(url) for url in request.urls)
+
+    def stream() -> Iterator[str]:
+        for item in crawler.run():
+            if item.result is None:
+                line = BatchParseItem(url=item.url, error=item.error)
+            else:
+                line = BatchParseItem(url=item.result.url, emails=item.result.emails, phones=item.result.phones)
+            yield line.model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@app.post("/jobs", response_model=JobResponse, status_code=202)
+def submit_job(request: ParseRequest) -> JobResponse:
+    try:
+        job = jobs.submit(str(request.url), request.deadline_seconds)
+    except PermanentParserError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except JobQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "5"}) from exc
+    return JobResponse.from_job(job)
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str) -> JobResponse:
+    try:
+        return JobResponse.from_job(jobs.get(job_id))
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Job not found") from exc
+
+
+@app.get("/jobs/{job_id}/stream")
+def stream_job(job_id: str) -> StreamingResponse:
+    try:
+        events = jobs.stream(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Job not found") from exc
+
+    return StreamingResponse(
+        (json.dumps(event, ensure_ascii=False) + "\n" for event in events),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> str:
+    return metrics_registry.render() + render_connection_stats(connection_stats())
+
+
+def _result_store() -> ResultStore:
+    if not settings.result_store_enabled:
+        raise HTTPException(status_code=503, detail="Result store is disabled")
+    return get_result_store()
+
+
+@app.get("/domains", response_model=list[DomainHitResponse])
+def find_contact(contact: str) -> list[DomainHitResponse]:
+    hits = _result_store().domains_for(contact)
+    return [DomainHitResponse(domain=hit.domain, first_seen=hit.first_seen, last_seen=hit.last_seen) for hit in hits]
+
+
+@app.get("/contacts", response_model=DomainContactsResponse)
+def domain_contacts(domain: str) -> DomainContactsResponse:
+    return DomainContactsResponse(domain=domain, **_result_store().contacts_for(domain))
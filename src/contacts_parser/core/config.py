@@ -30,43 +30,156 @@ class Settings(BaseSettings):
     http_timeout_seconds: float = Field(default=5.0, validation_alias="HTTP_TIMEOUT_SECONDS")
     http_max_retries: int = Field(default=3, validation_alias="HTTP_MAX_RETRIES")
     http_backoff_seconds: float = Field(default=0.2, validation_alias="HTTP_BACKOFF_SECONDS")
+    http_backoff_max_seconds: float = Field(default=10.0, validation_alias="HTTP_BACKOFF_MAX_SECONDS")
+    http_retry_budget: int = Field(default=100, validation_alias="HTTP_RETRY_BUDGET")
     http_user_agent: str = Field(default="contacts-parser/0.1", validation_alias="HTTP_USER_AGENT")
+    http_max_body_bytes: int = Field(default=5 * 1024 * 1024, validation_alias="HTTP_MAX_BODY_BYTES")
+    http_read_deadline_seconds: float = Field(default=30.0, validation_alias="HTTP_READ_DEADLINE_SECONDS")
     http_min_delay_seconds: float = Field(default=0.0, validation_alias="HTTP_MIN_DELAY_SECONDS")
-    pool_connections: int = Field(default=10, validation_alias="POOL_CONNECTIONS")
-    pool_maxsize: int = Field(default=10, validation_alias="POOL_MAXSIZE")
-    lru_maxsize: int = Field(default=1, validation_alias="LRU_MAXSIZE")
+    http_max_delay_seconds: float = Field(default=30.0, validation_alias="HTTP_MAX_DELAY_SECONDS")
+    # 0 sizes the pools from the worker settings
+    pool_connections: int = Field(default=0, validation_alias="POOL_CONNECTIONS")
+    pool_maxsize: int = Field(default=0, validation_alias="POOL_MAXSIZE")
+    http_max_connections_per_host: int = Field(default=0, validation_alias="HTTP_MAX_CONNECTIONS_PER_HOST")
+    http_http2_enabled: bool = Field(default=False, validation_alias="HTTP_HTTP2_ENABLED")
+
+    # HTTP cache
+    http_cache_enabled: bool = Field(default=False, validation_alias="HTTP_CACHE_ENABLED")
+    http_cache_path: str = Field(default=".cache/http.sqlite3", validation_alias="HTTP_CACHE_PATH")
+    http_cache_ttl_seconds: float = Field(default=86400.0, validation_alias="HTTP_CACHE_TTL_SECONDS")
+    http_cache_max_bytes: int = Field(default=512 * 1024 * 1024, validation_alias="HTTP_CACHE_MAX_BYTES")
+
+    # Result store
+    result_store_enabled: bool = Field(default=False, validation_alias="RESULT_STORE_ENABLED")
+    result_store_path: str = Field(default=".cache/results.sqlite3", validation_alias="RESULT_STORE_PATH")
+    result_store_batch_size: int = Field(default=500, validation_alias="RESULT_STORE_BATCH_SIZE")
+
+    # Distributed work queue
+    queue_visibility_timeout_seconds: float = Field(
+        default=300.0, validation_alias="QUEUE_VISIBILITY_TIMEOUT_SECONDS"
+    )
+    queue_max_attempts: int = Field(default=3, validation_alias="QUEUE_MAX_ATTEMPTS")
+    queue_poll_seconds: float = Field(default=1.0, validation_alias="QUEUE_POLL_SECONDS")
+
+    # Circuit breaker (per host)
+    breaker_failure_threshold: float = Field(default=0.5, validation_alias="BREAKER_FAILURE_THRESHOLD")
+    breaker_window: int = Field(default=20, validation_alias="BREAKER_WINDOW")
+    breaker_min_calls: int = Field(default=5, validation_alias="BREAKER_MIN_CALLS")
+    breaker_cooldown_seconds: float = Field(default=30.0, validation_alias="BREAKER_COOLDOWN_SECONDS")
 
     # Parser settings
     parser_type: str = Field(default="html.parser", validation_alias="PARSER_TYPE")
+    parser_backend: Literal["auto", "selectolax", "lxml", "bs4-lxml", "bs4"] = Field(
+        default="auto", validation_alias="PARSER_BACKEND"
+    )
+    parser_keep_pages: bool = Field(default=False, validation_alias="PARSER_KEEP_PAGES")
+    parser_processes: int = Field(default=0, validation_alias="PARSER_PROCESSES")
+    parser_block_cache: bool = Field(default=True, validation_alias="PARSER_BLOCK_CACHE")
     max_pages_deep: int = Field(default=1000, validation_alias="MAX_PAGES_DEEP")
     crawler_max_workers: int = Field(default=8, validation_alias="CRAWLER_MAX_WORKERS")
+    crawler_engine: Literal["threads", "async"] = Field(default="threads", validation_alias="CRAWLER_ENGINE")
+    crawler_max_concurrency: int = Field(default=100, validation_alias="CRAWLER_MAX_CONCURRENCY")
+    crawler_frontier: Literal["fifo", "priority"] = Field(default="priority", validation_alias="CRAWLER_FRONTIER")
+    crawler_stale_pages_limit: int = Field(default=0, validation_alias="CRAWLER_STALE_PAGES_LIMIT")
+    crawler_deadline_seconds: float = Field(default=0.0, validation_alias="CRAWLER_DEADLINE_SECONDS")
+    crawler_checkpoint_interval_seconds: float = Field(
+        default=5.0, validation_alias="CRAWLER_CHECKPOINT_INTERVAL_SECONDS"
+    )
+    crawler_checkpoint_pages: int = Field(default=100, validation_alias="CRAWLER_CHECKPOINT_PAGES")
+    crawler_visited_set: Literal["exact", "bloom"] = Field(default="exact", validation_alias="CRAWLER_VISITED_SET")
+    crawler_bloom_capacity: int = Field(default=1_000_000, validation_alias="CRAWLER_BLOOM_CAPACITY")
+    crawler_bloom_error_rate: float = Field(default=0.001, validation_alias="CRAWLER_BLOOM_ERROR_RATE")
+    url_strip_params: str = Field(
+        default="utm_*,fbclid,gclid,yclid,_openstat,ysclid",
+        validation_alias="URL_STRIP_PARAMS",
+    )
+    url_cache_maxsize: int = Field(default=65536, validation_alias="URL_CACHE_MAXSIZE")
+    crawler_robots_enabled: bool = Field(default=False, validation_alias="CRAWLER_ROBOTS_ENABLED")
+    crawler_sitemaps_enabled: bool = Field(default=False, validation_alias="CRAWLER_SITEMAPS_ENABLED")
+    sitemap_max_files: int = Field(default=50, validation_alias="SITEMAP_MAX_FILES")
+    sitemap_max_urls: int = Field(default=10000, validation_alias="SITEMAP_MAX_URLS")
+
+    # Batch settings
+    batch_max_workers: int = Field(default=64, validation_alias="BATCH_MAX_WORKERS")
+    batch_max_sites: int = Field(default=16, validation_alias="BATCH_MAX_SITES")
+    batch_per_domain_workers: int = Field(default=4, validation_alias="BATCH_PER_DOMAIN_WORKERS")
 
-    @field_validator("http_timeout_seconds", "http_backoff_seconds")
+    # Job settings
+    jobs_max_workers: int = Field(default=4, validation_alias="JOBS_MAX_WORKERS")
+    jobs_max_queue: int = Field(default=32, validation_alias="JOBS_MAX_QUEUE")
+    jobs_max_history: int = Field(default=1000, validation_alias="JOBS_MAX_HISTORY")
+
+    @field_validator(
+        "http_timeout_seconds",
+        "http_backoff_seconds",
+        "http_backoff_max_seconds",
+        "http_max_delay_seconds",
+        "http_read_deadline_seconds",
+        "breaker_failure_threshold",
+        "crawler_bloom_error_rate",
+        "queue_visibility_timeout_seconds",
+        "queue_poll_seconds",
+    )
     @classmethod
     def positive_floats(cls, v: float) -> float:
         if v <= 0:
-            raise ValueError("Timeout/backoff must be > 0")
+            raise ValueError("Timeouts, delays and thresholds must be > 0")
         return v
 
-    @field_validator("http_min_delay_seconds")
+    @field_validator(
+        "http_min_delay_seconds",
+        "breaker_cooldown_seconds",
+        "http_cache_ttl_seconds",
+        "crawler_deadline_seconds",
+        "crawler_checkpoint_interval_seconds",
+    )
     @classmethod
     def non_negative_floats(cls, v: float) -> float:
         if v < 0:
-            raise ValueError("HTTP min delay must be >= 0")
+            raise ValueError("Delays, cooldowns, TTLs, deadlines and checkpoint intervals must be >= 0")
         return v
 
-    @field_validator("http_max_retries", "lru_maxsize", "max_pages_deep")
+    @field_validator(
+        "http_max_retries",
+        "http_retry_budget",
+        "pool_connections",
+        "pool_maxsize",
+        "http_max_connections_per_host",
+        "max_pages_deep",
+        "jobs_max_queue",
+        "sitemap_max_urls",
+        "crawler_stale_pages_limit",
+        "parser_processes",
+    )
     @classmethod
     def non_negative_ints(cls, v: int) -> int:
         if v < 0:
-            raise ValueError("Max retries/lru maxsize/max pages deep must be >= 0")
+            raise ValueError("Retries, budgets, sizes and page/URL limits must be >= 0")
         return v
 
-    @field_validator("crawler_max_workers")
+    @field_validator(
+        "http_max_body_bytes",
+        "crawler_bloom_capacity",
+        "url_cache_maxsize",
+        "result_store_batch_size",
+        "crawler_checkpoint_pages",
+        "queue_max_attempts",
+        "crawler_max_workers",
+        "crawler_max_concurrency",
+        "batch_max_workers",
+        "batch_max_sites",
+        "batch_per_domain_workers",
+        "jobs_max_workers",
+        "jobs_max_history",
+        "breaker_window",
+        "breaker_min_calls",
+        "http_cache_max_bytes",
+        "sitemap_max_files",
+    )
     @classmethod
     def positive_workers(cls, v: int) -> int:
         if v <= 0:
-            raise ValueError("Crawler max workers must be > 0")
+            raise ValueError("Worker, concurrency, size and capacity limits must be > 0")
         return v
 
 
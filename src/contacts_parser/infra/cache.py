@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any
+
+from contacts_parser.core.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content BLOB NOT NULL,
+    content_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    content_type TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS extractions (
+    content_hash TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+"""
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    url: str
+    status_code: int
+    content: bytes
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+    # Kept for its charset: pages that declare theirs only in the header must decode the same from the cache
+    content_type: str | None = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheStats:
+    """Per-crawl cache counters"""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.extraction_hits = 0
+        self._lock = Lock()
+
+    def record(self, kind: str) -> None:
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "extraction_hits": self.extraction_hits,
+            }
+
+
+class ResponseCache:
+    """
+    SQLite-backed HTTP response cache.
+
+    Responses are stored with their validators (ETag / Last-Modified) so
+    stale entries can be revalidated with a conditional request. Total body
+    size is capped; the least recently accessed entries are evicted first.
+    Extraction results are cached separately, keyed by content hash.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None, max_bytes: int | None = None) -> None:
+        self.ttl = settings.http_cache_ttl_seconds if ttl is None else ttl
+        self._max_bytes = settings.http_cache_max_bytes if max_bytes is None else max_bytes
+        self._lock = Lock()
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, content, content_hash, etag, last_modified, fetched_at, content_type "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time(), url))
+            self._conn.commit()
+
+        status_code, content, digest, etag, last_modified, fetched_at, content_type = row
+        return CachedResponse(url, status_code, content, digest, etag, last_modified, fetched_at, content_type)
+
+    def put(self, url: str, status_code: int, content: bytes, headers: Mapping[str, str]) -> None:
+        now = time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, status_code, etag, last_modified, content, content_hash, "
+                "size, fetched_at, accessed_at, content_type) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    status_code,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    content,
+                    content_hash(content),
+                    len(content),
+                    now,
+                    now,
+                    headers.get("Content-Type"),
+                ),
+            )
+            self._total_bytes += len(content) - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as freshly validated, e.g. after a 304"""
+        now = time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._conn.commit()
+
+    def get_extraction(self, digest: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM extractions WHERE content_hash = ?", (digest,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_extraction(self, digest: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO extractions VALUES (?, ?)", (digest, json.dumps(payload)))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _migrate(self) -> None:
+        # Caches written before content_type was stored
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "content_type" not in columns:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN content_type TEXT")
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self._max_bytes:
+            return
+
+        # Trim to 90% so eviction does not run again on every following write
+        target = self._max_bytes * 0.9
+        while self._total_bytes > target:
+            rows = self._conn.execute(
+                "SELECT url, size, content_hash FROM responses ORDER BY accessed_at LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+
+            for url, size, digest in rows:
+                if self._total_bytes <= target:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._conn.execute(
+                    "DELETE FROM extractions WHERE content_hash = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM responses WHERE content_hash = ?)",
+                    (digest, digest),
+                )
+                self._total_bytes -= size
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    return ResponseCache(settings.http_cache_path)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Event
+from time import monotonic
+
+from contacts_parser.parser.errors import CancelledParserError
+
+
+class CancelToken:
+    """
+    Cooperative cancellation for one crawl: an explicit `cancel()` or a deadline.
+
+    Workers check it between pages, while waiting and at every body read, so
+    a cancelled crawl stops within one chunk of each in-flight request.
+    """
+
+    def __init__(self, deadline_seconds: float | None = None) -> None:
+        self._event = Event()
+        self._deadline: float | None = None
+        self.reason: str | None = None
+        if deadline_seconds:
+            self.set_deadline(deadline_seconds)
+
+    def set_deadline(self, seconds: float) -> None:
+        """Deadline `seconds` from now; an earlier deadline is kept"""
+        deadline = monotonic() + seconds
+        if self._deadline is None or deadline < self._deadline:
+            self._deadline = deadline
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set() and self._deadline is not None and monotonic() >= self._deadline:
+            self.cancel("deadline")
+        return self._event.is_set()
+
+    def remaining(self) -> float | None:
+        """Seconds to the deadline, None without one"""
+        return None if self._deadline is None else max(0.0, self._deadline - monotonic())
+
+    def bound(self, seconds: float) -> float:
+        """`seconds`, shortened to the time left before the deadline"""
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise CancelledParserError(f"Crawl stopped: {self.reason}")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep that wakes up as soon as the crawl is cancelled"""
+        self._event.wait(self.bound(seconds))
+        self.raise_if_cancelled()
+
+    async def asleep(self, seconds: float) -> None:
+        # Explicit cancels reach async crawls through task cancellation
+        await asyncio.sleep(self.bound(seconds))
+        self.raise_if_cancelled()
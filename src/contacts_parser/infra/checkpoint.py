@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.visited import fingerprint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS visited (
+    fingerprint BLOB PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    depth INTEGER NOT NULL
+);
+"""
+
+
+@dataclass(slots=True)
+class CheckpointData:
+    """A crawl as of its last checkpoint"""
+
+    url: str
+    pages: dict[str, dict[str, Any]] = field(default_factory=dict)
+    visited: list[bytes] = field(default_factory=list)
+    frontier: list[tuple[str, int]] = field(default_factory=list)
+
+
+class Checkpoint:
+    """
+    SQLite checkpoint of one crawl.
+
+    Finished pages and visited fingerprints are buffered and appended in one
+    transaction together with a snapshot of the frontier, at most every
+    `interval` seconds or `batch_pages` pages, so the crawl loop mostly
+    just appends to lists.
+    """
+
+    def __init__(self, path: str | Path, interval: float | None = None, batch_pages: int | None = None) -> None:
+        self._interval = interval if interval is not None else settings.crawler_checkpoint_interval_seconds
+        self._batch_pages = batch_pages or settings.crawler_checkpoint_pages
+        self._visited: list[tuple[bytes]] = []
+        self._pages: list[tuple[str, str]] = []
+        self._last_saved = monotonic()
+        self._lock = Lock()
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def url(self) -> str | None:
+        """Seed URL of the saved crawl, None for a fresh checkpoint"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'url'").fetchone()
+        return row[0] if row else None
+
+    def load(self) -> CheckpointData | None:
+        """The saved crawl, None for a fresh checkpoint"""
+        url = self.url
+        if url is None:
+            return None
+        with self._lock:
+            pages = self._conn.execute("SELECT url, payload FROM pages")
+            return CheckpointData(
+                url=url,
+                pages={page_url: json.loads(payload) for page_url, payload in pages},
+                visited=[digest for (digest,) in self._conn.execute("SELECT fingerprint FROM visited")],
+                frontier=self._conn.execute("SELECT url, depth FROM frontier ORDER BY rowid").fetchall(),
+            )
+
+    def start(self, url: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO meta VALUES ('url', ?)", (url,))
+
+    def mark_visited(self, url: str) -> None:
+        with self._lock:
+            self._visited.append((fingerprint(url),))
+
+    def add_page(self, url: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._pages.append((url, json.dumps(payload, ensure_ascii=False)))
+
+    def due(self) -> bool:
+        with self._lock:
+            return len(self._pages) >= self._batch_pages or monotonic() - self._last_saved >= self._interval
+
+    def save(self, frontier: Iterable[tuple[str, int]]) -> None:
+        """Write buffered pages and fingerprints and replace the frontier snapshot"""
+        with self._lock, self._conn:
+            visited, self._visited = self._visited, []
+            pages, self._pages = self._pages, []
+            self._conn.executemany("INSERT OR IGNORE INTO visited VALUES (?)", visited)
+            self._conn.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?)", pages)
+            self._conn.execute("DELETE FROM frontier")
+            self._conn.executemany("INSERT OR IGNORE INTO frontier VALUES (?, ?)", frontier)
+            self._last_saved = monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
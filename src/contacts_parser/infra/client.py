@@ -1,37 +1,228 @@
-from time import sleep
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from time import monotonic, perf_counter, sleep
 
+import httpx
 import requests
 from requests.exceptions import (
     ConnectionError,
+    ContentDecodingError,
     HTTPError,
     RequestException,
     SSLError,
     Timeout,
 )
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
 
 from contacts_parser.core.config import settings
+from contacts_parser.infra.cancel import CancelToken
+from contacts_parser.infra.metrics import CrawlMetrics
+from contacts_parser.infra.politeness import host_scheduler, parse_retry_after
 from contacts_parser.parser.errors import NoContentParserError, PermanentParserError, TransientParserError
 
+_PARSEABLE_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+_CHUNK_SIZE = 64 * 1024
 
-def request_data(session: requests.Session, url: str, timeout: int) -> requests.Response:
-    if settings.http_min_delay_seconds > 0:
-        sleep(settings.http_min_delay_seconds)
+
+@dataclass(frozen=True, slots=True)
+class FetchedResponse:
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str]
+
+
+def _check_headers(status: int, headers: Mapping[str, str], max_bytes: int) -> None:
+    """Reject bodies that are not worth downloading before reading them"""
+    if status != 200:
+        return
+
+    content_type = headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+    if content_type and content_type not in _PARSEABLE_CONTENT_TYPES:
+        raise NoContentParserError(f"Unsupported content type: {content_type}")
+
+    length = headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise NoContentParserError(f"Body too large: {length} bytes")
+
+
+class _BodyReader:
+    """Accumulates streamed chunks within the size cap, the read deadline and the crawl's cancel token"""
+
+    def __init__(self, max_bytes: int, deadline: float, cancel: CancelToken | None = None) -> None:
+        self._max_bytes = max_bytes
+        self._deadline = monotonic() + deadline
+        self._cancel = cancel
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self._size += len(chunk)
+        if self._size > self._max_bytes:
+            raise NoContentParserError(f"Body exceeds {self._max_bytes} bytes")
+        self.check()
+        self._chunks.append(chunk)
+
+    def check(self) -> None:
+        if monotonic() > self._deadline:
+            raise TransientParserError("Read deadline exceeded")
+        if self._cancel is not None:
+            self._cancel.raise_if_cancelled()
+
+    def bound(self, seconds: float) -> float:
+        """`seconds` for one socket read, shortened to the read deadline and the crawl's deadline"""
+        seconds = min(seconds, max(0.0, self._deadline - monotonic()))
+        return self._cancel.bound(seconds) if self._cancel is not None else seconds
+
+    def content(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+def _read_body(resp: requests.Response, reader: _BodyReader, timeout: float) -> None:
+    # read1 returns whatever has arrived instead of waiting for a full chunk,
+    # so a trickled body hits the deadline after one socket read, not 64 KB.
+    raw = resp.raw
+    while True:
+        reader.check()
+        sock = getattr(raw.connection, "sock", None)
+        if sock is not None:
+            sock.settimeout(max(reader.bound(timeout), 0.001))
+        try:
+            chunk = raw.read1(_CHUNK_SIZE, decode_content=True)
+        except ReadTimeoutError as e:
+            reader.check()
+            raise Timeout(str(e)) from e
+        except ProtocolError as e:
+            raise ConnectionError(str(e)) from e
+        except DecodeError as e:
+            raise ContentDecodingError(str(e)) from e
+        if not chunk:
+            return
+        reader.feed(chunk)
+
+
+async def _aread_body(resp: httpx.Response, reader: _BodyReader, timeout: float) -> None:
+    # Without a chunk size httpx yields chunks as they arrive instead of buffering them
+    chunks = resp.aiter_bytes()
+    while True:
+        reader.check()
+        try:
+            async with asyncio.timeout(reader.bound(timeout)):
+                chunk = await anext(chunks, None)
+        except TimeoutError as e:
+            reader.check()
+            raise httpx.ReadTimeout(str(e)) from e
+        if chunk is None:
+            return
+        reader.feed(chunk)
+
+
+def _raise_for_status_code(url: str, status: int | None, headers: Mapping[str, str], error: Exception) -> None:
+    if status in (403, 404):
+        raise NoContentParserError(f"HTTP {status}") from error
+
+    if status in (429, 500, 502, 503, 504):
+        host_scheduler.record_failure(url)
+        retry_after = parse_retry_after(headers.get("Retry-After")) if status in (429, 503) else None
+        if retry_after is not None:
+            host_scheduler.defer(url, retry_after)
+        raise TransientParserError(f"HTTP {status}", retry_after=retry_after) from error
+
+    raise PermanentParserError(f"HTTP {status}") from error
+
+
+def request_data(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    headers: Mapping[str, str] | None = None,
+    metrics: CrawlMetrics | None = None,
+    cancel: CancelToken | None = None,
+) -> FetchedResponse:
+    """Stream the body, dropping non-HTML content, oversized bodies and slow reads"""
+    metrics = metrics or CrawlMetrics()
+    delay = host_scheduler.reserve(url)
+    if delay > 0:
+        with metrics.time("wait"):
+            if cancel is not None:
+                cancel.sleep(delay)
+            else:
+                sleep(delay)
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+        timeout = cancel.bound(timeout)
     try:
-        resp = session.get(url, timeout=timeout)
-        resp.raise_for_status()
+        started = perf_counter()
+        with session.get(url, timeout=timeout, headers=headers, stream=True) as resp:
+            metrics.observe("connect", perf_counter() - started)
+            metrics.record_status(resp.status_code)
+            resp.raise_for_status()
+            _check_headers(resp.status_code, resp.headers, settings.http_max_body_bytes)
+            reader = _BodyReader(settings.http_max_body_bytes, settings.http_read_deadline_seconds, cancel)
+            with metrics.time("download"):
+                _read_body(resp, reader, timeout)
     except (Timeout, ConnectionError, SSLError) as e:
+        metrics.record_status("error")
+        host_scheduler.record_failure(url)
         raise TransientParserError(str(e)) from e
     except HTTPError as e:
-        status = e.response.status_code if e.response is not None else None
+        failed = e.response
+        _raise_for_status_code(
+            url,
+            failed.status_code if failed is not None else None,
+            failed.headers if failed is not None else {},
+            e,
+        )
+    except RequestException as e:
+        metrics.record_status("error")
+        raise TransientParserError(str(e)) from e
 
-        if status in (403, 404):
-            raise NoContentParserError(f"HTTP {status}") from e
+    host_scheduler.record_success(url)
+    content = reader.content()
+    metrics.add_bytes(len(content))
+    return FetchedResponse(resp.status_code, content, resp.headers)
 
-        if status in (429, 500, 502, 503, 504):
-            raise TransientParserError(f"HTTP {status}") from e
 
-        raise PermanentParserError(f"HTTP {status}") from e
-    except RequestException as e:
+async def request_data_async(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: float,
+    headers: Mapping[str, str] | None = None,
+    metrics: CrawlMetrics | None = None,
+    cancel: CancelToken | None = None,
+) -> FetchedResponse:
+    metrics = metrics or CrawlMetrics()
+    delay = host_scheduler.reserve(url)
+    if delay > 0:
+        with metrics.time("wait"):
+            if cancel is not None:
+                await cancel.asleep(delay)
+            else:
+                await asyncio.sleep(delay)
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+        timeout = cancel.bound(timeout)
+    try:
+        started = perf_counter()
+        async with client.stream("GET", url, timeout=timeout, headers=headers) as resp:
+            metrics.observe("connect", perf_counter() - started)
+            metrics.record_status(resp.status_code)
+            resp.raise_for_status()
+            _check_headers(resp.status_code, resp.headers, settings.http_max_body_bytes)
+            reader = _BodyReader(settings.http_max_body_bytes, settings.http_read_deadline_seconds, cancel)
+            with metrics.time("download"):
+                await _aread_body(resp, reader, timeout)
+    except httpx.HTTPStatusError as e:
+        _raise_for_status_code(url, e.response.status_code, e.response.headers, e)
+    except httpx.TransportError as e:
+        metrics.record_status("error")
+        host_scheduler.record_failure(url)
+        raise TransientParserError(str(e)) from e
+    except httpx.TooManyRedirects as e:
+        metrics.record_status("error")
         raise TransientParserError(str(e)) from e
 
-    return resp
+    host_scheduler.record_success(url)
+    content = reader.content()
+    metrics.add_bytes(len(content))
+    return FetchedResponse(resp.status_code, content, resp.headers)
@@ -1,6 +1,13 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
 from functools import lru_cache
-from threading import local
+from threading import Lock, local
+from typing import Any
+from weakref import WeakKeyDictionary
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -8,13 +15,51 @@ from urllib3.util.retry import Retry
 from contacts_parser.core.config import settings
 
 _thread_state = local()
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = WeakKeyDictionary()
 
 
-@lru_cache(maxsize=settings.lru_maxsize)
-def get_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update({"User-Agent": settings.http_user_agent})
+@dataclass
+class ConnectionStats:
+    """Requests sent and connections opened by one engine's pool"""
+
+    requests: int = 0
+    connections: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def add(self, requests: int = 0, connections: int = 0) -> None:
+        with self._lock:
+            self.requests += requests
+            self.connections += connections
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "reused": max(0, self.requests - self.connections),
+            }
+
+
+# Counts of host pools urllib3 already evicted; live pools are read on demand
+_evicted_stats = ConnectionStats()
+_async_stats = ConnectionStats()
+
 
+def pool_sizes() -> tuple[int, int, bool]:
+    """(host pools kept, connections kept per host, block at the per-host limit)"""
+    pools = settings.pool_connections or max(10, settings.batch_max_sites)
+    if settings.http_max_connections_per_host:
+        return pools, settings.http_max_connections_per_host, True
+    # Every thread that may fetch from one host at the same time gets a kept-alive connection
+    per_host = settings.pool_maxsize or max(
+        settings.crawler_max_workers * settings.jobs_max_workers, settings.batch_max_workers
+    )
+    return pools, per_host, False
+
+
+@lru_cache(maxsize=1)
+def get_adapter() -> HTTPAdapter:
+    """Process-wide adapter: its urllib3 pools are thread-safe and outlive single crawls"""
     retry = Retry(
         total=0,
         connect=0,
@@ -26,21 +71,92 @@ def get_session() -> requests.Session:
         respect_retry_after_header=False,
     )
 
+    pool_connections, pool_maxsize, pool_block = pool_sizes()
     adapter = HTTPAdapter(
         max_retries=retry,
-        pool_connections=settings.pool_connections,
-        pool_maxsize=settings.pool_maxsize,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
     )
 
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
+    pools = adapter.poolmanager.pools
+    dispose = pools.dispose_func
+
+    def dispose_counted(pool: Any) -> None:
+        _evicted_stats.add(pool.num_requests, pool.num_connections)
+        dispose(pool)
 
-    return s
+    pools.dispose_func = dispose_counted
+    return adapter
 
 
-def get_thread_session() -> requests.Session:
+def get_session() -> requests.Session:
+    """
+    Session of the calling thread.
+
+    `requests.Session` is not thread-safe, so each thread gets its own; all of
+    them mount the shared adapter, so keep-alive connections are reused across
+    threads and successive crawls.
+    """
     session = getattr(_thread_state, "session", None)
     if session is None:
-        session = get_session()
+        session = requests.Session()
+        session.headers.update({"User-Agent": settings.http_user_agent})
+        adapter = get_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         _thread_state.session = session
     return session
+
+
+async def _count_request(request: httpx.Request) -> None:
+    _async_stats.add(requests=1)
+    request.extensions["trace"] = _trace_connections
+
+
+async def _trace_connections(event: str, info: dict[str, Any]) -> None:
+    if event.endswith("connect_tcp.complete"):
+        _async_stats.add(connections=1)
+
+
+def create_async_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.crawler_max_concurrency,
+        max_keepalive_connections=settings.crawler_max_concurrency,
+    )
+
+    return httpx.AsyncClient(
+        headers={"User-Agent": settings.http_user_agent},
+        limits=limits,
+        follow_redirects=True,
+        http2=settings.http_http2_enabled,
+        event_hooks={"request": [_count_request]},
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Client shared by every crawl on the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_clients[loop] = create_async_client()
+    return client
+
+
+async def aclose_async_client() -> None:
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def connection_stats() -> dict[str, dict[str, int]]:
+    """Requests and opened connections per engine since the process started"""
+    evicted = _evicted_stats.as_dict()
+    threads = ConnectionStats(evicted["requests"], evicted["connections"])
+    if get_adapter.cache_info().currsize:
+        pools = get_adapter().poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                threads.add(pool.num_requests, pool.num_connections)
+    return {"threads": threads.as_dict(), "async": _async_stats.as_dict()}
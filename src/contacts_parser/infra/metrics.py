@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+# wait: politeness delay before a request
+# connect: DNS, connect, TLS and time to response headers
+# download: reading the body
+# parse: HTML parsing and the extraction walk (the whole worker round trip with PARSER_PROCESSES)
+# extract: contact regexes over the extracted text
+# retry_sleep: backoff between attempts
+STAGES = ("wait", "connect", "download", "parse", "extract", "retry_sleep")
+
+
+class CrawlMetrics:
+    """Per-crawl stage timings and counters"""
+
+    def __init__(self) -> None:
+        self.stage_seconds: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.stage_calls: dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.bytes_downloaded = 0
+        self.retries = 0
+        self.status_codes: Counter[str] = Counter()
+        # Page text run through the contact regexes, and repeated boilerplate that was not
+        self.text_chars: Counter[str] = Counter(scanned=0, skipped=0)
+        self._lock = Lock()
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, perf_counter() - started)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] += seconds
+            self.stage_calls[stage] += 1
+
+    def add_bytes(self, size: int) -> None:
+        with self._lock:
+            self.bytes_downloaded += size
+
+    def record_status(self, status: int | str) -> None:
+        with self._lock:
+            self.status_codes[str(status)] += 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_text(self, scanned: int, skipped: int) -> None:
+        with self._lock:
+            self.text_chars["scanned"] += scanned
+            self.text_chars["skipped"] += skipped
+
+    def update(self, other: CrawlMetrics) -> None:
+        snapshot = other.as_dict()
+        with self._lock:
+            for stage, values in snapshot["stages"].items():
+                self.stage_seconds[stage] += values["seconds"]
+                self.stage_calls[stage] += values["calls"]
+            self.bytes_downloaded += snapshot["bytes_downloaded"]
+            self.retries += snapshot["retries"]
+            self.status_codes.update(snapshot["status_codes"])
+            self.text_chars["scanned"] += snapshot["text_chars"]["scanned"]
+            self.text_chars["skipped"] += snapshot["text_chars"]["skipped"]
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            scanned, skipped = self.text_chars["scanned"], self.text_chars["skipped"]
+            return {
+                "stages": {
+                    stage: {"seconds": round(self.stage_seconds[stage], 6), "calls": self.stage_calls[stage]}
+                    for stage in STAGES
+                },
+                "bytes_downloaded": self.bytes_downloaded,
+                "retries": self.retries,
+                "status_codes": dict(self.status_codes),
+                "text_chars": {
+                    "scanned": scanned,
+                    "skipped": skipped,
+                    "skipped_share": round(skipped / (scanned + skipped), 4) if scanned + skipped else 0.0,
+                },
+            }
+
+
+class MetricsRegistry:
+    """Process-wide totals over finished crawls, rendered for Prometheus"""
+
+    def __init__(self) -> None:
+        self._crawls = 0
+        self._pages = 0
+        self._totals = CrawlMetrics()
+        self._lock = Lock()
+
+    def merge(self, metrics: CrawlMetrics, pages: int) -> None:
+        with self._lock:
+            self._crawls += 1
+            self._pages += pages
+        self._totals.update(metrics)
+
+    def render(self) -> str:
+        totals = self._totals.as_dict()
+        with self._lock:
+            crawls, pages = self._crawls, self._pages
+
+        lines = [
+            "# HELP contacts_parser_crawls_total Finished crawls.",
+            "# TYPE contacts_parser_crawls_total counter",
+            f"contacts_parser_crawls_total {crawls}",
+            "# HELP contacts_parser_pages_total Parsed pages.",
+            "# TYPE contacts_parser_pages_total counter",
+            f"contacts_parser_pages_total {pages}",
+            "# HELP contacts_parser_stage_seconds_total Time spent per crawl stage.",
+            "# TYPE contacts_parser_stage_seconds_total counter",
+            *(
+                f'contacts_parser_stage_seconds_total{{stage="{stage}"}} {values["seconds"]}'
+                for stage, values in totals["stages"].items()
+            ),
+            "# HELP contacts_parser_stage_calls_total Timed calls per crawl stage.",
+            "# TYPE contacts_parser_stage_calls_total counter",
+            *(
+                f'contacts_parser_stage_calls_total{{stage="{stage}"}} {values["calls"]}'
+                for stage, values in totals["stages"].items()
+            ),
+            "# HELP contacts_parser_downloaded_bytes_total Response body bytes downloaded.",
+            "# TYPE contacts_parser_downloaded_bytes_total counter",
+            f"contacts_parser_downloaded_bytes_total {totals['bytes_downloaded']}",
+            "# HELP contacts_parser_retries_total Retried requests.",
+            "# TYPE contacts_parser_retries_total counter",
+            f"contacts_parser_retries_total {totals['retries']}",
+            "# HELP contacts_parser_responses_total Responses by HTTP status (error: no response).",
+            "# TYPE contacts_parser_responses_total counter",
+            *(
+                f'contacts_parser_responses_total{{status="{status}"}} {count}'
+                for status, count in sorted(totals["status_codes"].items())
+            ),
+            "# HELP contacts_parser_text_chars_total Page text characters scanned for contacts or skipped as "
+            "known boilerplate.",
+            "# TYPE contacts_parser_text_chars_total counter",
+            f'contacts_parser_text_chars_total{{kind="scanned"}} {totals["text_chars"]["scanned"]}',
+            f'contacts_parser_text_chars_total{{kind="skipped"}} {totals["text_chars"]["skipped"]}',
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def render_connection_stats(stats: dict[str, dict[str, int]]) -> str:
+    """Connection reuse per engine (see infra.http.connection_stats), for Prometheus"""
+    lines = [
+        "# HELP contacts_parser_http_requests_total Requests sent through the shared connection pools.",
+        "# TYPE contacts_parser_http_requests_total counter",
+        *(f'contacts_parser_http_requests_total{{engine="{engine}"}} {s["requests"]}' for engine, s in stats.items()),
+        "# HELP contacts_parser_http_connections_total Connections opened; the rest of the requests reused one.",
+        "# TYPE contacts_parser_http_connections_total counter",
+        *(
+            f'contacts_parser_http_connections_total{{engine="{engine}"}} {s["connections"]}'
+            for engine, s in stats.items()
+        ),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic
+from urllib.parse import urlsplit
+
+from contacts_parser.core.config import settings
+
+
+def host_key(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class HostScheduler:
+    """
+    Next-allowed-time scheduler keyed by host.
+
+    Each request reserves the next free slot of its host, so concurrent
+    workers are spread `delay` apart per host while other hosts are not
+    slowed down. The per-host delay grows on errors and decays back to
+    the configured minimum on success.
+
+    Concurrent requests to a failing host fail together, so the delay is
+    raised at most once per delay window; failures of requests already in
+    flight when it was raised do not compound it. When it shrinks again,
+    slots queued at the inflated delay are pulled in proportionally.
+    """
+
+    def __init__(self, min_delay: float | None = None, max_delay: float | None = None) -> None:
+        self._min_delay = settings.http_min_delay_seconds if min_delay is None else min_delay
+        self._max_delay = settings.http_max_delay_seconds if max_delay is None else max_delay
+        self._next_allowed: dict[str, float] = {}
+        self._delays: dict[str, float] = {}
+        # When each host's delay was last raised, and until when Retry-After holds it back
+        self._raised_at: dict[str, float] = {}
+        self._deferred_until: dict[str, float] = {}
+        self._host_min_delays: dict[str, float] = {}
+        self._lock = Lock()
+
+    def reserve(self, url: str) -> float:
+        """Claim the host's next slot and return how long to wait for it"""
+        host = host_key(url)
+        with self._lock:
+            now = monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self._delays.get(host, self._floor(host))
+            return slot - now
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold back the host for `seconds`, e.g. as asked by Retry-After"""
+        host = host_key(url)
+        seconds = min(seconds, self._max_delay)
+        with self._lock:
+            resume_at = monotonic() + seconds
+            self._next_allowed[host] = max(self._next_allowed.get(host, resume_at), resume_at)
+            self._deferred_until[host] = max(self._deferred_until.get(host, resume_at), resume_at)
+
+    def record_success(self, url: str) -> None:
+        host = host_key(url)
+        with self._lock:
+            delay = self._delays.get(host)
+            if delay is None:
+                return
+            shrunk = delay / 2
+            if shrunk <= self._floor(host):
+                del self._delays[host]
+                self._raised_at.pop(host, None)
+                shrunk = self._floor(host)
+            else:
+                self._delays[host] = shrunk
+            self._rescale_pending(host, shrunk / delay if delay else 1.0)
+
+    def record_failure(self, url: str) -> None:
+        host = host_key(url)
+        with self._lock:
+            now = monotonic()
+            delay = self._delays.get(host, self._floor(host))
+            if now - self._raised_at.get(host, float("-inf")) < delay:
+                return
+            self._delays[host] = min(max(delay * 2, settings.http_backoff_seconds), self._max_delay)
+            self._raised_at[host] = now
+
+    def set_min_delay(self, url: str, seconds: float) -> None:
+        """Raise the host's minimum interval, e.g. to honour a robots.txt Crawl-delay"""
+        with self._lock:
+            self._host_min_delays[host_key(url)] = min(seconds, self._max_delay)
+
+    def delay_for(self, url: str) -> float:
+        host = host_key(url)
+        with self._lock:
+            return self._delays.get(host, self._floor(host))
+
+    def _rescale_pending(self, host: str, factor: float) -> None:
+        # Slots already handed out keep their time; only later reservations come sooner,
+        # never before a Retry-After deferral ends
+        next_allowed = self._next_allowed.get(host)
+        now = monotonic()
+        if next_allowed is not None and next_allowed > now:
+            rescaled = now + (next_allowed - now) * factor
+            self._next_allowed[host] = max(rescaled, self._deferred_until.get(host, rescaled))
+
+    def _floor(self, host: str) -> float:
+        return max(self._min_delay, self._host_min_delays.get(host, 0.0))
+
+
+host_scheduler = HostScheduler()
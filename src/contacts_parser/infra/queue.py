@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Literal, Protocol
+
+from contacts_parser.core.config import settings
+
+TaskStatus = Literal["queued", "leased", "done", "failed"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    domain TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'leased', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    id: int
+    domain: str
+    url: str
+    attempts: int
+    status: TaskStatus = "queued"
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class TaskQueue(Protocol):
+    """Per-domain crawl tasks shared by a coordinator and any number of workers"""
+
+    def put(self, domain: str, url: str) -> bool: ...
+
+    def put_many(self, tasks: Iterable[tuple[str, str]]) -> int: ...
+
+    def lease(self, owner: str, visibility: float | None = None) -> Task | None: ...
+
+    def extend(self, task: Task, owner: str, visibility: float | None = None) -> bool: ...
+
+    def complete(self, task: Task, owner: str, result: dict[str, Any]) -> bool: ...
+
+    def fail(self, task: Task, owner: str, error: str) -> bool: ...
+
+    def counts(self) -> dict[str, int]: ...
+
+    def finished(self) -> Iterator[Task]: ...
+
+
+class SqliteTaskQueue:
+    """
+    Task queue in one SQLite file, shared by processes on a host.
+
+    A task is leased for `visibility` seconds; a worker that dies without
+    completing it loses the lease and the task goes to the next worker, up
+    to `max_attempts` leases. Completing or failing requires still holding
+    the lease, so a task taken over by another worker is recorded only once.
+    """
+
+    def __init__(self, path: str | Path, max_attempts: int | None = None) -> None:
+        self._max_attempts = max_attempts or settings.queue_max_attempts
+        self._lock = Lock()
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def put(self, domain: str, url: str) -> bool:
+        """Queue a crawl of `domain`; False when the domain is already queued"""
+        return self.put_many([(domain, url)]) == 1
+
+    def put_many(self, tasks: Iterable[tuple[str, str]]) -> int:
+        now = time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO tasks (domain, url, updated_at) VALUES (?, ?, ?)",
+                    ((domain, url, now) for domain, url in tasks),
+                )
+                added = self._conn.total_changes - before
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def lease(self, owner: str, visibility: float | None = None) -> Task | None:
+        """Take the oldest queued task, or one whose lease expired"""
+        now = time()
+        visibility = visibility or settings.queue_visibility_timeout_seconds
+        with self._lock:
+            # One UPDATE ... RETURNING is atomic across processes
+            row = self._conn.execute(
+                "UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? "
+                "WHERE id = (SELECT id FROM tasks WHERE attempts < ? AND "
+                "(status = 'queued' OR (status = 'leased' AND lease_expires < ?)) ORDER BY id LIMIT 1) "
+                "RETURNING id, domain, url, attempts",
+                (owner, now + visibility, now, self._max_attempts, now),
+            ).fetchone()
+            if row is None:
+                self._fail_exhausted(now)
+        return Task(*row, status="leased") if row else None
+
+    def extend(self, task: Task, owner: str, visibility: float | None = None) -> bool:
+        """Push the lease deadline out; False when the lease was lost"""
+        visibility = visibility or settings.queue_visibility_timeout_seconds
+        return self._update_leased(task, owner, "lease_expires = ?", time() + visibility)
+
+    def complete(self, task: Task, owner: str, result: dict[str, Any]) -> bool:
+        return self._update_leased(
+            task, owner, "status = 'done', lease_expires = NULL, result = ?", json.dumps(result, ensure_ascii=False)
+        )
+
+    def fail(self, task: Task, owner: str, error: str) -> bool:
+        """Give up on a task whose failure is not worth another lease"""
+        return self._update_leased(task, owner, "status = 'failed', lease_expires = NULL, error = ?", error)
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {"queued": 0, "leased": 0, "done": 0, "failed": 0, **dict(rows)}
+
+    def finished(self) -> Iterator[Task]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, domain, url, attempts, status, result, error FROM tasks "
+                "WHERE status IN ('done', 'failed') ORDER BY id"
+            ).fetchall()
+        for task_id, domain, url, attempts, status, result, error in rows:
+            yield Task(task_id, domain, url, attempts, status, json.loads(result) if result else None, error)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _update_leased(self, task: Task, owner: str, assignments: str, value: Any) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE tasks SET {assignments}, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ? AND attempts = ?",
+                (value, time(), task.id, owner, task.attempts),
+            )
+        return cursor.rowcount == 1
+
+    def _fail_exhausted(self, now: float) -> None:
+        # Tasks whose last lease expired with no attempts left
+        self._conn.execute(
+            "UPDATE tasks SET status = 'failed', error = 'Lease expired on every attempt', updated_at = ? "
+            "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, now, self._max_attempts),
+        )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import random
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Literal
+
+from contacts_parser.core.config import settings
+from contacts_parser.infra.politeness import host_key
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter and a retry budget shared by a crawl.
+
+    The budget bounds the total number of retries across all pages, so a
+    failing site cannot make every queued URL spend all of its attempts.
+    """
+
+    def __init__(
+        self,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        budget: int | None = None,
+    ) -> None:
+        self._base_delay = base_delay or settings.http_backoff_seconds
+        self._max_delay = max_delay or settings.http_backoff_max_seconds
+        self._budget = settings.http_retry_budget if budget is None else budget
+        self._retries = 0
+        self._lock = Lock()
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2**attempt))
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._retries >= self._budget:
+                return False
+            self._retries += 1
+            return True
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+
+class CircuitBreaker:
+    """
+    Failure-rate breaker over a sliding window of recent outcomes.
+
+    Opens once the window holds at least `min_calls` outcomes and the share
+    of failures reaches `threshold`. After `cooldown` seconds a single trial
+    request is let through (half-open) and its outcome closes or reopens it.
+    """
+
+    def __init__(
+        self,
+        threshold: float | None = None,
+        window: int | None = None,
+        min_calls: int | None = None,
+        cooldown: float | None = None,
+    ) -> None:
+        self._threshold = threshold or settings.breaker_failure_threshold
+        self._min_calls = min_calls or settings.breaker_min_calls
+        self._cooldown = settings.breaker_cooldown_seconds if cooldown is None else cooldown
+        self._outcomes: deque[bool] = deque(maxlen=window or settings.breaker_window)
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "closed":
+                return True
+
+            if self._state == "open":
+                if monotonic() - self._opened_at < self._cooldown:
+                    return False
+                self._state = "half_open"
+                self._trial_in_flight = False
+
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == "half_open":
+                self._state = "closed"
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def release(self) -> None:
+        """End a half-open trial that recorded no outcome (e.g. cancelled), so the next call may try again"""
+        with self._lock:
+            if self._state == "half_open":
+                self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == "half_open":
+                self._open()
+                return
+
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self._min_calls and failures / len(self._outcomes) >= self._threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = monotonic()
+        self._trial_in_flight = False
+
+
+class CircuitBreakers:
+    """Lazily created breaker per host"""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = Lock()
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = host_key(url)
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker()
+            return breaker
+
+    def states(self) -> dict[str, BreakerState]:
+        with self._lock:
+            return {host: breaker.state for host, breaker in self._breakers.items()}
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import atexit
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from time import time
+from urllib.parse import urlsplit
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.utils import normalize_phone
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL CHECK (kind IN ('email', 'phone')),
+    value TEXT NOT NULL,
+    UNIQUE (value, kind)
+);
+CREATE TABLE IF NOT EXISTS domain_contacts (
+    domain_id INTEGER NOT NULL REFERENCES domains (id),
+    contact_id INTEGER NOT NULL REFERENCES contacts (id),
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (domain_id, contact_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS domain_contacts_contact ON domain_contacts (contact_id, domain_id);
+"""
+
+# Stays well under SQLite's bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+
+def normalize_domain(url_or_domain: str) -> str:
+    netloc = urlsplit(url_or_domain).netloc if "://" in url_or_domain else url_or_domain
+    netloc = netloc.strip().lower().rstrip("/")
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+def normalize_contact(value: str) -> tuple[str, str] | None:
+    """(kind, canonical value): lowercased emails, +7XXXXXXXXXX phones"""
+    value = value.strip()
+    if "@" in value:
+        return "email", value.removeprefix("mailto:").lower()
+    phone = normalize_phone(value)
+    return ("phone", phone) if phone else None
+
+
+@dataclass(frozen=True, slots=True)
+class DomainHit:
+    domain: str
+    first_seen: datetime
+    last_seen: datetime
+
+
+def _chunks(values: list, size: int = _LOOKUP_CHUNK) -> Iterator[list]:
+    for offset in range(0, len(values), size):
+        yield values[offset : offset + size]
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class ResultStore:
+    """
+    SQLite store of contacts found per domain.
+
+    Domains and contacts are interned into their own tables and linked by
+    id, so a phone listed by thousands of domains is stored once. Writes are
+    buffered and flushed in one transaction per `batch_size` results; reads
+    flush first, so they always see everything added.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int | None = None) -> None:
+        self._batch_size = batch_size or settings.result_store_batch_size
+        self._pending: list[tuple[str, set[tuple[str, str]], float]] = []
+        self._lock = Lock()
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, url: str, emails: Iterable[str], phones: Iterable[str], seen_at: datetime | None = None) -> None:
+        contacts = {contact for value in (*emails, *phones) if (contact := normalize_contact(value))}
+        seen = seen_at.replace(tzinfo=seen_at.tzinfo or timezone.utc).timestamp() if seen_at else time()
+        with self._lock:
+            self._pending.append((normalize_domain(url), contacts, seen))
+            if len(self._pending) >= self._batch_size:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def domains_for(self, contact: str) -> list[DomainHit]:
+        """Domains that list a contact, in any spelling of it"""
+        normalized = normalize_contact(contact)
+        if normalized is None:
+            return []
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute(
+                "SELECT d.name, dc.first_seen, dc.last_seen FROM contacts c "
+                "JOIN domain_contacts dc ON dc.contact_id = c.id "
+                "JOIN domains d ON d.id = dc.domain_id "
+                "WHERE c.value = ? AND c.kind = ? ORDER BY d.name",
+                (normalized[1], normalized[0]),
+            ).fetchall()
+        return [DomainHit(name, _to_datetime(first), _to_datetime(last)) for name, first, last in rows]
+
+    def contacts_for(self, domain: str) -> dict[str, list[str]]:
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute(
+                "SELECT c.kind, c.value FROM domains d "
+                "JOIN domain_contacts dc ON dc.domain_id = d.id "
+                "JOIN contacts c ON c.id = dc.contact_id "
+                "WHERE d.name = ? ORDER BY c.kind, c.value",
+                (normalize_domain(domain),),
+            ).fetchall()
+        contacts: dict[str, list[str]] = {"emails": [], "phones": []}
+        for kind, value in rows:
+            contacts[f"{kind}s"].append(value)
+        return contacts
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        with self._conn:
+            domain_ids = self._intern_domains(sorted({domain for domain, _, _ in pending}))
+            contacts = sorted({contact for _, found, _ in pending for contact in found})
+            contact_ids = self._intern_contacts(contacts)
+            self._conn.executemany(
+                "INSERT INTO domain_contacts VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (domain_id, contact_id) DO UPDATE SET "
+                "first_seen = MIN(first_seen, excluded.first_seen), last_seen = MAX(last_seen, excluded.last_seen)",
+                (
+                    (domain_ids[domain], contact_ids[contact], seen, seen)
+                    for domain, found, seen in pending
+                    for contact in found
+                ),
+            )
+
+    def _intern_domains(self, names: list[str]) -> dict[str, int]:
+        self._conn.executemany("INSERT OR IGNORE INTO domains (name) VALUES (?)", ((name,) for name in names))
+        ids: dict[str, int] = {}
+        for chunk in _chunks(names):
+            placeholders = ",".join("?" * len(chunk))
+            ids.update(self._conn.execute(f"SELECT name, id FROM domains WHERE name IN ({placeholders})", chunk))
+        return ids
+
+    def _intern_contacts(self, contacts: list[tuple[str, str]]) -> dict[tuple[str, str], int]:
+        self._conn.executemany("INSERT OR IGNORE INTO contacts (kind, value) VALUES (?, ?)", contacts)
+        ids: dict[tuple[str, str], int] = {}
+        for chunk in _chunks(contacts):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT kind, value, id FROM contacts WHERE value IN ({placeholders})",
+                [value for _, value in chunk],
+            ).fetchall()
+            ids.update(((kind, value), contact_id) for kind, value, contact_id in rows)
+        return ids
+
+
+@lru_cache(maxsize=1)
+def get_result_store() -> ResultStore:
+    store = ResultStore(settings.result_store_path)
+    atexit.register(store.close)
+    return store
@@ -1,20 +1,141 @@
+import argparse
+import json
 import logging
 import sys
+from dataclasses import asdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import chain
 
 from contacts_parser.core.config import settings
+from contacts_parser.infra.checkpoint import Checkpoint
+from contacts_parser.infra.queue import SqliteTaskQueue
+from contacts_parser.infra.store import get_result_store
+from contacts_parser.parser.batch import BatchCrawler
+from contacts_parser.parser.distributed import CrawlWorker, enqueue_seeds
 from contacts_parser.parser.errors import PermanentParserError
+from contacts_parser.parser.models import CrawlState, ParserResult
 from contacts_parser.parser.parser import Parser
 
-logging.basicConfig(level=settings.log_level)
 
-if len(sys.argv) < 2:
-    raise PermanentParserError("Must provide URL")
+def main() -> None:
+    logging.basicConfig(level=settings.log_level)
 
-url = sys.argv[1]
+    arg_parser = argparse.ArgumentParser(prog="contacts_parser", description="Crawl sites and extract contacts")
+    arg_parser.add_argument("urls", nargs="*", help="seed URL(s); more than one runs a batch")
+    arg_parser.add_argument("--file", help="file with one seed URL per line ('-' for stdin); runs a batch")
+    arg_parser.add_argument("--state", help="JSON crawl state file: re-crawl incrementally and save the new state")
+    arg_parser.add_argument("--deadline", type=float, help="stop the crawl after this many seconds, keep results")
+    arg_parser.add_argument("--checkpoint", help="SQLite checkpoint file: save progress, resume it if it exists")
+    arg_parser.add_argument("--resume", metavar="CHECKPOINT", help="continue the crawl saved in a checkpoint file")
+    arg_parser.add_argument("--queue", help="SQLite work queue: enqueue the seed URLs as per-domain tasks")
+    arg_parser.add_argument("--worker", action="store_true", help="with --queue: crawl queued tasks until drained")
+    arg_parser.add_argument("--checkpoint-dir", help="with --worker: per-task checkpoints, resumed after a crash")
+    arg_parser.add_argument("--queue-results", action="store_true", help="with --queue: print finished tasks")
+    arg_parser.add_argument("--find-contact", metavar="CONTACT", help="print the stored domains listing a contact")
+    arg_parser.add_argument("--domain-contacts", metavar="DOMAIN", help="print the stored contacts of a domain")
+    args = arg_parser.parse_args()
 
-parser = Parser(url)
-result = parser.run()
+    if args.find_contact or args.domain_contacts:
+        query_store(args.find_contact, args.domain_contacts)
+        return
 
-print(f"Base url: {result.base_url}")
-print(f"Number of pages: {result.pages_parsed}")
-print(f"Contacts: {{'url': '{result.url}', 'emails': {result.emails}, 'phones': {result.phones}}}")
+    if args.queue:
+        run_queue(args)
+        return
+
+    if args.resume:
+        print_result(Parser.resume(args.resume, deadline_seconds=args.deadline).run())
+        return
+
+    if not args.urls and not args.file:
+        raise PermanentParserError("Must provide URL")
+
+    if args.file or len(args.urls) > 1:
+        run_batch(args.urls, args.file)
+        return
+
+    prior_state = load_state(args.state) if args.state else None
+    checkpoint = Checkpoint(args.checkpoint) if args.checkpoint else None
+    parser = Parser(args.urls[0], prior_state=prior_state, deadline_seconds=args.deadline, checkpoint=checkpoint)
+    result = parser.run()
+    print_result(result)
+
+    if args.state:
+        save_state(args.state, result.state)
+        print(f"Changes: {asdict(result.diff)}")
+
+
+def run_queue(args: argparse.Namespace) -> None:
+    queue = SqliteTaskQueue(args.queue)
+    if args.urls or args.file:
+        with open_seeds(args.urls, args.file) as seeds:
+            print(json.dumps({"enqueued": enqueue_seeds(queue, seeds)}))
+    if args.worker:
+        CrawlWorker(queue, checkpoint_dir=args.checkpoint_dir).run()
+    if args.queue_results:
+        for task in queue.finished():
+            line = {"url": task.url, "status": task.status, **(task.result or {}), "error": task.error}
+            print(json.dumps(line, ensure_ascii=False), flush=True)
+    print(json.dumps(queue.counts()))
+
+
+def print_result(result: ParserResult) -> None:
+    print(f"Base url: {result.base_url}")
+    print(f"Number of pages: {result.pages_parsed}{' (truncated)' if result.truncated else ''}")
+    print(f"Contacts: {{'url': '{result.url}', 'emails': {result.emails}, 'phones': {result.phones}}}")
+
+
+def query_store(contact: str | None, domain: str | None) -> None:
+    store = get_result_store()
+    if contact:
+        hits = [
+            {"domain": hit.domain, "first_seen": hit.first_seen.isoformat(), "last_seen": hit.last_seen.isoformat()}
+            for hit in store.domains_for(contact)
+        ]
+        print(json.dumps({"contact": contact, "domains": hits}, ensure_ascii=False))
+    if domain:
+        print(json.dumps({"domain": domain, **store.contacts_for(domain)}, ensure_ascii=False))
+
+
+def load_state(path: str) -> CrawlState:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return CrawlState.from_dict(json.load(f))
+    except FileNotFoundError:
+        return CrawlState()
+
+
+def save_state(path: str, state: CrawlState) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state.to_dict(), f, ensure_ascii=False)
+
+
+@contextmanager
+def open_seeds(urls: list[str], path: str | None) -> Iterator[Iterable[str]]:
+    """Seed URLs from the command line followed by those in `path` ('-' for stdin)"""
+    if path == "-":
+        yield chain(urls, sys.stdin)
+    elif path:
+        with open(path, encoding="utf-8") as f:
+            yield chain(urls, f)
+    else:
+        yield urls
+
+
+def run_batch(urls: list[str], path: str | None) -> None:
+    with open_seeds(urls, path) as seeds:
+        print_batch(seeds)
+
+
+def print_batch(seeds: Iterable[str]) -> None:
+    for item in BatchCrawler(seeds).run():
+        if item.result is None:
+            line = {"url": item.url, "error": item.error}
+        else:
+            line = {"url": item.result.url, "emails": item.result.emails, "phones": item.result.phones}
+        print(json.dumps(line, ensure_ascii=False), flush=True)
+
+
+if __name__ == "__main__":
+    main()
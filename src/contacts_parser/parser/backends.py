@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.charset import decode_html
+from contacts_parser.parser.extractor import (
+    _MAX_ANCHOR_TEXT,
+    _SKIPPED_TEXT_TAGS,
+    ExtractedPage,
+    extract_from_soup,
+    is_boilerplate_block,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fastest first; "auto" takes the first one that is installed
+_PREFERENCE = ("selectolax", "lxml", "bs4-lxml", "bs4")
+_REQUIREMENTS = {"selectolax": "selectolax", "lxml": "lxml", "bs4-lxml": "lxml", "bs4": "bs4"}
+
+
+@dataclass(frozen=True, slots=True)
+class HtmlBackend:
+    name: str
+    # Raw bytes are decoded with charset detection; pass text when the encoding is known (parser.charset)
+    extract: Callable[[bytes | str], ExtractedPage]
+
+
+def _decode(content: bytes | str) -> str:
+    # The same charset detection BeautifulSoup applies, so every backend sees the same text
+    return content if isinstance(content, str) else decode_html(content)[0]
+
+
+def _extract_bs4(parser_type: str) -> Callable[[bytes | str], ExtractedPage]:
+    def extract(content: bytes | str) -> ExtractedPage:
+        return extract_from_soup(BeautifulSoup(content, parser_type))
+
+    return extract
+
+
+def _extract_lxml(content: bytes | str) -> ExtractedPage:
+    import lxml.html
+    from lxml.etree import ParserError
+
+    extracted = ExtractedPage()
+    try:
+        root = lxml.html.fromstring(_decode(content))
+    except (ParserError, ValueError):
+        return extracted
+
+    # Explicit stack instead of recursion: text, then children, then the tail.
+    # An int entry closes the boilerplate block whose text started at that index.
+    stack: list = [(root, False, False)]
+    while stack:
+        node, skipped, in_block = stack.pop()
+        if isinstance(node, str):
+            if not skipped:
+                extracted.text.append(node)
+            continue
+        if isinstance(node, int):
+            extracted.close_block(node)
+            continue
+
+        if node.tail:
+            stack.append((node.tail, skipped, in_block))
+        tag = node.tag
+        if not isinstance(tag, str):
+            continue
+
+        href = node.get("href")
+        extracted.add_attributes(href, node.get("src"))
+        if href and tag == "a":
+            text = " ".join(part.strip() for part in node.itertext() if part.strip())
+            extracted.anchors.append((href, text[:_MAX_ANCHOR_TEXT]))
+
+        if not in_block and is_boilerplate_block(tag, node.get("id"), node.get("class")):
+            stack.append((len(extracted.text), skipped, in_block))
+            in_block = True
+        inner_skipped = skipped or tag in _SKIPPED_TEXT_TAGS
+        stack.extend((child, inner_skipped, in_block) for child in reversed(node))
+        if node.text:
+            stack.append((node.text, inner_skipped, in_block))
+
+    return extracted
+
+
+def _extract_selectolax(content: bytes | str) -> ExtractedPage:
+    from selectolax.lexbor import LexborHTMLParser
+
+    extracted = ExtractedPage()
+    tree = LexborHTMLParser(_decode(content))
+    if tree.root is None:
+        return extracted
+
+    block_start: int | None = None
+    block_end: int | None = None
+    for node in tree.root.traverse(include_text=True):
+        if block_start is not None and node.mem_id == block_end:
+            extracted.close_block(block_start)
+            block_start = None
+
+        tag = node.tag
+        if tag == "-text":
+            if node.parent is None or node.parent.tag not in _SKIPPED_TEXT_TAGS:
+                extracted.text.append(node.text_content or "")
+            continue
+        if tag.startswith("-"):
+            continue
+
+        attributes = node.attributes
+        href = attributes.get("href")
+        extracted.add_attributes(href, attributes.get("src"))
+        if href and tag == "a":
+            extracted.anchors.append((href, node.text(deep=True, separator=" ", strip=True)[:_MAX_ANCHOR_TEXT]))
+        if block_start is None and is_boilerplate_block(tag, attributes.get("id"), attributes.get("class")):
+            block_start, block_end = len(extracted.text), _following_id(node)
+
+    if block_start is not None:
+        extracted.close_block(block_start)
+    return extracted
+
+
+def _following_id(node) -> int | None:
+    """mem_id of the first node after `node` and its subtree"""
+    while node is not None:
+        if node.next is not None:
+            return node.next.mem_id
+        node = node.parent
+    return None
+
+
+def _build(name: str) -> HtmlBackend:
+    if name == "selectolax":
+        return HtmlBackend(name, _extract_selectolax)
+    if name == "lxml":
+        return HtmlBackend(name, _extract_lxml)
+    if name == "bs4-lxml":
+        return HtmlBackend(name, _extract_bs4("lxml"))
+    return HtmlBackend(name, _extract_bs4(settings.parser_type))
+
+
+def available_backends() -> list[str]:
+    return [name for name in _PREFERENCE if find_spec(_REQUIREMENTS[name]) is not None]
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: str | None = None) -> HtmlBackend:
+    """Named backend, or the fastest installed one for "auto" (PARSER_BACKEND)"""
+    name = name or settings.parser_backend
+    installed = available_backends()
+    if name == "auto":
+        name = installed[0]
+        logger.info("HTML backend selected", extra={"backend": name})
+    elif name not in installed:
+        raise ValueError(f"HTML backend {name!r} is not installed")
+    return _build(name)
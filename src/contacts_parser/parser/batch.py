@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.errors import ParserError
+from contacts_parser.parser.models import BatchItem
+from contacts_parser.parser.parser import Parser
+from contacts_parser.parser.validators import parse_base_url
+
+
+class BatchCrawler:
+    """
+    Crawls many sites over one shared page pool.
+
+    `max_workers` caps in-flight page fetches across the whole batch,
+    `per_domain_workers` caps them per site and `max_sites` bounds how many
+    sites are crawled at once. Results are yielded as each site finishes.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        max_workers: int | None = None,
+        max_sites: int | None = None,
+        per_domain_workers: int | None = None,
+    ) -> None:
+        self._urls = urls
+        self._max_workers = max_workers or settings.batch_max_workers
+        self._max_sites = max_sites or settings.batch_max_sites
+        self._per_domain_workers = per_domain_workers or settings.batch_per_domain_workers
+        self._logger = logging.getLogger(__name__)
+
+    def run(self) -> Iterator[BatchItem]:
+        urls = self._unique_seeds()
+
+        with (
+            ThreadPoolExecutor(max_workers=self._max_workers) as page_pool,
+            ThreadPoolExecutor(max_workers=self._max_sites) as site_pool,
+        ):
+            futures: dict[Future, str] = {}
+
+            while True:
+                # Seeds are pulled lazily so huge input files are never fully queued
+                while len(futures) < self._max_sites:
+                    url = next(urls, None)
+                    if url is None:
+                        break
+                    futures[site_pool.submit(self._crawl_site, url, page_pool)] = url
+
+                if not futures:
+                    return
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    futures.pop(future)
+                    yield future.result()
+
+    def _crawl_site(self, url: str, page_pool: ThreadPoolExecutor) -> BatchItem:
+        try:
+            result = Parser(url, executor=page_pool, max_workers=self._per_domain_workers).run()
+        except ParserError as e:
+            self._logger.warning("Batch site failed", extra={"url": url, "error": str(e)})
+            return BatchItem(url=url, error=str(e))
+
+        return BatchItem(url=url, result=result)
+
+    def _unique_seeds(self) -> Iterator[str]:
+        seen: set[str] = set()
+
+        for raw_url in self._urls:
+            url = raw_url.strip()
+            if not url or url.startswith("#"):
+                continue
+
+            try:
+                base_url = parse_base_url(url)
+            except ParserError:
+                # Let the site worker report the invalid URL like any other failure
+                yield url
+                continue
+
+            if base_url in seen:
+                self._logger.debug("Skipping duplicate batch domain", extra={"url": url})
+                continue
+            seen.add(base_url)
+            yield url
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from contacts_parser.parser.utils import TextContacts
+
+# Sites with per-page sidebars would otherwise grow the cache with every page
+_MAX_BLOCKS = 10_000
+
+
+def block_key(text: str) -> bytes:
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class BlockCache:
+    """
+    Contacts of the boilerplate blocks (see extractor.is_boilerplate_block)
+    already scanned during one crawl, keyed by a digest of their text.
+
+    Headers, footers and menus repeat on every page of a site, so only their
+    first occurrence goes through the contact regexes.
+    """
+
+    def __init__(self, max_blocks: int = _MAX_BLOCKS) -> None:
+        self._max_blocks = max_blocks
+        self._blocks: dict[bytes, TextContacts] = {}
+        self.scanned_chars = 0
+        self.skipped_chars = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def get(self, text: str) -> TextContacts | None:
+        with self._lock:
+            return self._blocks.get(block_key(text))
+
+    def put(self, text: str, contacts: TextContacts) -> None:
+        with self._lock:
+            if len(self._blocks) < self._max_blocks:
+                self._blocks[block_key(text)] = contacts
+
+    def count(self, scanned: int, skipped: int) -> None:
+        with self._lock:
+            self.scanned_chars += scanned
+            self.skipped_chars += skipped
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.errors import PermanentParserError
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _strip_patterns() -> tuple[str, ...]:
+    return tuple(p.strip().lower() for p in settings.url_strip_params.split(",") if p.strip())
+
+
+def _filter_query(query: str, patterns: tuple[str, ...]) -> str:
+    if not query or not patterns:
+        return query
+    kept = [
+        pair
+        for pair in query.split("&")
+        if pair and not any(fnmatchcase(pair.split("=", 1)[0].lower(), p) for p in patterns)
+    ]
+    return "&".join(kept)
+
+
+@lru_cache(maxsize=settings.url_cache_maxsize)
+def canonicalize(url: str) -> str:
+    """
+    Canonical form of an absolute http(s) URL.
+
+    Lowercases scheme and host, drops `www.`, default ports, the fragment,
+    trailing slashes and tracking query params (URL_STRIP_PARAMS), so
+    trivially different links map to one page. Memoized.
+    """
+    url = url.strip()
+    scheme, netloc, path, query, _ = urlsplit(url)
+    scheme = scheme.lower()
+
+    if scheme not in _DEFAULT_PORTS:
+        raise PermanentParserError("URL должен начинаться с http:// или https://")
+
+    if not netloc:
+        raise PermanentParserError("URL должен быть абсолютным и содержать домен типа https://example.com")
+
+    netloc = netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    host, sep, port = netloc.rpartition(":")
+    if sep and port == _DEFAULT_PORTS[scheme]:
+        netloc = host
+
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, netloc, path or "/", _filter_query(query, _strip_patterns()), ""))
+
+
+def base_url(url: str) -> str:
+    scheme, netloc, *_ = urlsplit(canonicalize(url))
+    return f"{scheme}://{netloc}/"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import codecs
+import re
+from collections import OrderedDict
+from threading import Lock
+
+from bs4 import UnicodeDammit
+
+from contacts_parser.infra.politeness import host_key
+
+# A <meta> charset must sit in the first 1024 bytes per the HTML spec; real pages are sloppier
+_SNIFF_BYTES = 4096
+_CONTENT_TYPE_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+# Both <meta charset="..."> and <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+# Hosts remembered per process, least recently used dropped first
+_MAX_HOSTS = 10_000
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _known(name: str | bytes | None) -> str | None:
+    """Python codec name of a charset label, None for unknown labels"""
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode("ascii", "ignore")
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def declared_encoding(content: bytes, content_type: str | None = None) -> str | None:
+    """Encoding from a byte order mark, the Content-Type header or a <meta> near the top"""
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+    if content_type:
+        match = _CONTENT_TYPE_CHARSET.search(content_type)
+        if match and (encoding := _known(match.group(1))):
+            return encoding
+    match = _META_CHARSET.search(content, 0, _SNIFF_BYTES)
+    return _known(match.group(1)) if match else None
+
+
+def decode_html(
+    content: bytes, encoding: str | None = None, host_encoding: str | None = None
+) -> tuple[str, str | None]:
+    """
+    Page text and the encoding it was decoded with.
+
+    The declared `encoding` is tried first, then strict UTF-8, then the
+    encoding the host used last. Single-byte encodings decode almost any
+    bytes, so a host hint tried before UTF-8 would turn undeclared UTF-8
+    pages into mojibake. BeautifulSoup's detection, which may run a
+    statistical charset detector over the whole page, is the last resort.
+    """
+    for candidate in dict.fromkeys(filter(None, (encoding, "utf-8", host_encoding))):
+        try:
+            return content.decode(candidate), candidate
+        except (LookupError, UnicodeDecodeError):
+            pass
+    dammit = UnicodeDammit(content, is_html=True)
+    return dammit.unicode_markup or "", dammit.original_encoding
+
+
+class HostCharsets:
+    """Last encoding each host's pages decoded with, for pages that declare none"""
+
+    def __init__(self, max_hosts: int = _MAX_HOSTS) -> None:
+        self._max_hosts = max_hosts
+        self._encodings: OrderedDict[str, str] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._encodings)
+
+    def get(self, url: str) -> str | None:
+        host = host_key(url)
+        with self._lock:
+            encoding = self._encodings.get(host)
+            if encoding is not None:
+                self._encodings.move_to_end(host)
+            return encoding
+
+    def remember(self, url: str, encoding: str | None) -> None:
+        encoding = _known(encoding)
+        # A byte order mark belongs to one document, not to the host
+        if encoding is None or encoding in ("utf-16", "utf-32"):
+            return
+        if encoding == "utf-8-sig":
+            encoding = "utf-8"
+        host = host_key(url)
+        with self._lock:
+            self._encodings[host] = encoding
+            self._encodings.move_to_end(host)
+            if len(self._encodings) > self._max_hosts:
+                self._encodings.popitem(last=False)
+
+
+host_charsets = HostCharsets()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import gzip
+import io
+import logging
+import xml.etree.ElementTree as ET
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from time import sleep
+from typing import IO
+from urllib.parse import urljoin
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from contacts_parser.core.config import settings
+from contacts_parser.infra.politeness import host_scheduler
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_MAX_ROBOTS_BYTES = 512 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _open_stream(
+    session: requests.Session, url: str, timeout: float
+) -> Iterator[tuple[int | None, IO[bytes] | None]]:
+    """(status, body) of a streamed GET; body is None unless the status is 200, status is None on network errors"""
+    delay = host_scheduler.reserve(url)
+    if delay > 0:
+        sleep(delay)
+    try:
+        resp = session.get(url, timeout=timeout, stream=True)
+    except requests.RequestException as e:
+        logger.debug("Discovery fetch failed", extra={"url": url, "error": str(e)})
+        yield None, None
+        return
+
+    with resp:
+        if resp.status_code != 200:
+            logger.debug("Discovery fetch skipped", extra={"url": url, "status": resp.status_code})
+            yield resp.status_code, None
+            return
+        resp.raw.decode_content = True
+        yield resp.status_code, resp.raw
+
+
+def _disallow_all(robots_url: str) -> RobotFileParser:
+    robots = RobotFileParser(robots_url)
+    robots.disallow_all = True
+    return robots
+
+
+def fetch_robots(session: requests.Session, base_url: str, timeout: float) -> RobotFileParser | None:
+    """
+    robots.txt rules for the site, or None when there is none to honour.
+
+    As RFC 9309 asks, a missing robots.txt (4xx) allows everything, while
+    an unreachable one (5xx, 429, network error) disallows everything: the
+    rules may exist and just could not be read.
+    """
+    robots_url = urljoin(base_url, "/robots.txt")
+    with _open_stream(session, robots_url, timeout) as (status, body):
+        if body is None:
+            if status is not None and 400 <= status < 500 and status != 429:
+                return None
+            logger.warning("robots.txt unreachable; not crawling", extra={"url": robots_url, "status": status})
+            return _disallow_all(robots_url)
+        try:
+            text = body.read(_MAX_ROBOTS_BYTES).decode("utf-8", errors="replace")
+        except (requests.RequestException, OSError) as e:
+            logger.warning("robots.txt read failed; not crawling", extra={"url": robots_url, "error": str(e)})
+            return _disallow_all(robots_url)
+
+    robots = RobotFileParser(robots_url)
+    robots.parse(text.splitlines())
+    return robots
+
+
+def iter_sitemap_entries(body: IO[bytes]) -> Iterator[tuple[str, str]]:
+    """
+    Stream ("url" | "sitemap", loc) pairs out of a sitemap or sitemap index.
+
+    Gzipped bodies are detected by their magic bytes. Parsed elements are
+    cleared as soon as they are read, so memory stays flat however large
+    the sitemap is.
+    """
+    buffered = io.BufferedReader(body) if not isinstance(body, io.BufferedReader) else body
+    if buffered.peek(2)[:2] == _GZIP_MAGIC:
+        buffered = gzip.GzipFile(fileobj=buffered)
+
+    root = None
+    for event, element in ET.iterparse(buffered, events=("start", "end")):
+        if root is None:
+            root = element
+            continue
+        if event != "end":
+            continue
+
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag in ("url", "sitemap"):
+            loc = element.findtext("{*}loc")
+            if loc:
+                yield tag, loc.strip()
+            root.clear()
+
+
+def iter_sitemap_urls(
+    session: requests.Session,
+    sitemap_urls: Iterable[str],
+    timeout: float,
+    max_files: int | None = None,
+) -> Iterator[str]:
+    """Page URLs from sitemaps, following sitemap indexes breadth-first"""
+    max_files = max_files or settings.sitemap_max_files
+    queue = deque(sitemap_urls)
+    seen = set(queue)
+    fetched = 0
+
+    while queue and fetched < max_files:
+        sitemap_url = queue.popleft()
+        fetched += 1
+
+        with _open_stream(session, sitemap_url, timeout) as (_, body):
+            if body is None:
+                continue
+            try:
+                for kind, loc in iter_sitemap_entries(body):
+                    if kind == "url":
+                        yield loc
+                    elif loc not in seen:
+                        seen.add(loc)
+                        queue.append(loc)
+            except (ET.ParseError, OSError, EOFError, requests.RequestException) as e:
+                logger.warning("Sitemap parse failed", extra={"url": sitemap_url, "error": str(e)})
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+from collections.abc import Iterable
+from pathlib import Path
+from threading import Event, Thread
+from time import sleep
+from typing import Any
+
+from contacts_parser.core.config import settings
+from contacts_parser.infra.checkpoint import Checkpoint
+from contacts_parser.infra.queue import Task, TaskQueue
+from contacts_parser.parser.errors import ParserError
+from contacts_parser.parser.models import ParserResult
+from contacts_parser.parser.parser import Parser
+from contacts_parser.parser.validators import parse_base_url
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_seeds(queue: TaskQueue, urls: Iterable[str]) -> int:
+    """Coordinator side: one task per domain; domains already queued are skipped"""
+
+    def tasks() -> Iterable[tuple[str, str]]:
+        for raw_url in urls:
+            url = raw_url.strip()
+            if not url or url.startswith("#"):
+                continue
+            try:
+                domain = parse_base_url(url)
+            except ParserError:
+                # Queued as is, so a worker reports the invalid URL like any other failure
+                domain = url
+            yield domain, url
+
+    return queue.put_many(tasks())
+
+
+def result_payload(result: ParserResult) -> dict[str, Any]:
+    return {
+        "url": result.url,
+        "emails": result.emails,
+        "phones": result.phones,
+        "pages_parsed": result.pages_parsed,
+        "truncated": result.truncated,
+    }
+
+
+class CrawlWorker:
+    """
+    Leases per-domain tasks from a shared queue and runs them with `Parser.run`.
+
+    The lease is extended in the background while a crawl runs; if it is lost
+    anyway, the crawl is cancelled so the domain is not crawled twice. With
+    `checkpoint_dir`, a task taken over after a crash resumes the previous
+    worker's checkpoint instead of starting over.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        worker_id: str | None = None,
+        checkpoint_dir: str | Path | None = None,
+        visibility: float | None = None,
+    ) -> None:
+        self._queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self._visibility = visibility or settings.queue_visibility_timeout_seconds
+
+    def run(self, wait_for_leased: bool = True) -> int:
+        """Work until the queue is drained; returns the number of tasks handled"""
+        handled = 0
+        while True:
+            task = self._queue.lease(self.worker_id, self._visibility)
+            if task is None:
+                # Leases held by other workers may still expire and come back
+                if wait_for_leased and self._queue.counts()["leased"]:
+                    sleep(settings.queue_poll_seconds)
+                    continue
+                return handled
+            self.run_task(task)
+            handled += 1
+
+    def run_task(self, task: Task) -> bool:
+        """Crawl one leased task; False when its lease was lost before the result was written"""
+        logger.info("Task leased", extra={"task": task.id, "url": task.url, "attempt": task.attempts})
+        checkpoint = self._checkpoint(task)
+        stop = Event()
+        heartbeat: Thread | None = None
+        try:
+            parser = Parser(task.url, checkpoint=checkpoint)
+            heartbeat = Thread(target=self._keep_lease, args=(task, parser, stop), daemon=True)
+            heartbeat.start()
+            result = parser.run()
+        except ParserError as e:
+            logger.warning("Task failed", extra={"task": task.id, "url": task.url, "error": str(e)})
+            return self._queue.fail(task, self.worker_id, str(e))
+        finally:
+            stop.set()
+            if heartbeat is not None:
+                heartbeat.join()
+            if checkpoint is not None:
+                checkpoint.close()
+
+        written = self._queue.complete(task, self.worker_id, result_payload(result))
+        if not written:
+            logger.warning("Task lease lost; result dropped", extra={"task": task.id, "url": task.url})
+        return written
+
+    def _checkpoint(self, task: Task) -> Checkpoint | None:
+        if self._checkpoint_dir is None:
+            return None
+        return Checkpoint(self._checkpoint_dir / f"task-{task.id}.sqlite3")
+
+    def _keep_lease(self, task: Task, parser: Parser, stop: Event) -> None:
+        while not stop.wait(self._visibility / 3):
+            if not self._queue.extend(task, self.worker_id, self._visibility):
+                parser.cancel("lease lost")
+                return
@@ -5,7 +5,9 @@ class ParserError(Exception):
 class TransientParserError(ParserError):
     """Temporary error. Safe to retry"""
 
-    pass
+    def __init__(self, message: str = "", retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class PermanentParserError(ParserError):
@@ -24,3 +26,9 @@ class MaxPagesParserError(ParserError):
     """Error for maximum number of pages"""
 
     pass
+
+
+class CancelledParserError(ParserError):
+    """Crawl deadline passed or the crawl was cancelled. Results so far are kept"""
+
+    pass
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup, PageElement, Tag
+
+_SKIPPED_TEXT_TAGS = frozenset({"script", "style", "template"})
+_MAX_ANCHOR_TEXT = 100
+
+# Subtrees that usually repeat on every page of a site (see parser.boilerplate)
+_BOILERPLATE_TAGS = frozenset({"header", "footer", "nav", "aside"})
+_BOILERPLATE_CONTAINERS = frozenset({"div", "section", "ul"})
+_BOILERPLATE_HINTS = ("header", "footer", "nav", "menu", "sidebar")
+
+
+def is_boilerplate_block(tag: str, element_id: str | None, element_class: str | list[str] | None) -> bool:
+    """Header, footer, nav and aside elements, and containers whose id or class names one"""
+    if tag in _BOILERPLATE_TAGS:
+        return True
+    if tag not in _BOILERPLATE_CONTAINERS or not (element_id or element_class):
+        return False
+    if isinstance(element_class, list):
+        element_class = " ".join(element_class)
+    marker = f"{element_id or ''} {element_class or ''}".lower()
+    return any(hint in marker for hint in _BOILERPLATE_HINTS)
+
+
+@dataclass(slots=True)
+class ExtractedPage:
+    """Everything contact and link extraction needs from one page"""
+
+    text: list[str] = field(default_factory=list)
+    hrefs: list[str] = field(default_factory=list)
+    srcs: list[str] = field(default_factory=list)
+    mailto: list[str] = field(default_factory=list)
+    tel: list[str] = field(default_factory=list)
+    anchors: list[tuple[str, str]] = field(default_factory=list)
+    # (start, end) slices of `text` that belong to one boilerplate block each
+    blocks: list[tuple[int, int]] = field(default_factory=list)
+
+    def close_block(self, start: int) -> None:
+        if len(self.text) > start:
+            self.blocks.append((start, len(self.text)))
+
+    def add_attributes(self, href: str | None, src: str | None) -> None:
+        if href:
+            self.hrefs.append(href)
+            if href.startswith("mailto:"):
+                self.mailto.append(href)
+            elif href.startswith("tel:"):
+                self.tel.append(href)
+        if src:
+            self.srcs.append(src)
+            if src.startswith("tel:"):
+                self.tel.append(src)
+
+
+def _following(node: PageElement) -> PageElement | None:
+    """First node after `node` and its subtree in document order"""
+    while node is not None:
+        if node.next_sibling is not None:
+            return node.next_sibling
+        node = node.parent
+    return None
+
+
+def extract_from_soup(page: BeautifulSoup) -> ExtractedPage:
+    """Collect text and link attributes in a single walk over a parsed tree"""
+    extracted = ExtractedPage()
+    text_types = page.interesting_string_types
+    block_start: int | None = None
+    block_end: PageElement | None = None
+
+    for node in page.descendants:
+        if block_start is not None and node is block_end:
+            extracted.close_block(block_start)
+            block_start = None
+
+        if isinstance(node, Tag):
+            href = node.get("href")
+            extracted.add_attributes(href, node.get("src"))
+            if href and node.name == "a":
+                extracted.anchors.append((href, node.get_text(" ", strip=True)[:_MAX_ANCHOR_TEXT]))
+            if block_start is None and is_boilerplate_block(node.name, node.get("id"), node.get("class")):
+                block_start, block_end = len(extracted.text), _following(node)
+        elif type(node) in text_types:
+            extracted.text.append(node)
+
+    if block_start is not None:
+        extracted.close_block(block_start)
+    return extracted
+
+
+class _CallbackExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.extracted = ExtractedPage()
+        self._skip_depth = 0
+        self._anchor_href: str | None = None
+        self._anchor_text: list[str] = []
+        # Open boilerplate block: its tag, how deep that tag is nested and where its text starts
+        self._block_tag: str | None = None
+        self._block_depth = 0
+        self._block_start = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        href = src = element_id = element_class = None
+        for name, value in attrs:
+            if name == "href":
+                href = value
+            elif name == "src":
+                src = value
+            elif name == "id":
+                element_id = value
+            elif name == "class":
+                element_class = value
+        self.extracted.add_attributes(href, src)
+
+        if self._block_tag is None and is_boilerplate_block(tag, element_id, element_class):
+            self._block_tag, self._block_depth, self._block_start = tag, 1, len(self.extracted.text)
+        elif tag == self._block_tag:
+            self._block_depth += 1
+
+        if tag in _SKIPPED_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "a" and href:
+            self._close_anchor()
+            self._anchor_href = href
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == self._block_tag:
+            self._block_depth -= 1
+            if not self._block_depth:
+                self._close_block()
+
+        if tag in _SKIPPED_TEXT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "a":
+            self._close_anchor()
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.extracted.text.append(data)
+            if self._anchor_href is not None:
+                self._anchor_text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._close_anchor()
+        self._close_block()
+
+    def _close_block(self) -> None:
+        if self._block_tag is not None:
+            self.extracted.close_block(self._block_start)
+            self._block_tag = None
+
+    def _close_anchor(self) -> None:
+        if self._anchor_href is None:
+            return
+        text = " ".join(" ".join(self._anchor_text).split())
+        self.extracted.anchors.append((self._anchor_href, text[:_MAX_ANCHOR_TEXT]))
+        self._anchor_href = None
+        self._anchor_text = []
+
+
+def extract_from_html(markup: str) -> ExtractedPage:
+    """Collect text and link attributes from parser callbacks, without building a tree"""
+    extractor = _CallbackExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return extractor.extracted
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import count
+from typing import Protocol
+from urllib.parse import unquote, urlsplit
+
+from contacts_parser.core.config import settings
+
+# Weights of path / anchor keywords that usually lead to contact details
+_CONTACT_KEYWORDS: dict[str, float] = {
+    "contact": 10.0,
+    "kontakt": 10.0,
+    "контакт": 10.0,
+    "svyaz": 6.0,
+    "связ": 6.0,
+    "about": 6.0,
+    "o-kompanii": 6.0,
+    "o_kompanii": 6.0,
+    "о компании": 6.0,
+    "o-nas": 6.0,
+    "о нас": 6.0,
+    "rekvizit": 5.0,
+    "реквизит": 5.0,
+    "company": 4.0,
+    "kompaniya": 4.0,
+    "компани": 4.0,
+    "office": 3.0,
+    "ofis": 3.0,
+    "офис": 3.0,
+    "support": 3.0,
+    "feedback": 3.0,
+}
+_DEPTH_PENALTY = 1.0
+
+
+def keyword_score(text: str) -> float:
+    lowered = text.lower()
+    return max((weight for keyword, weight in _CONTACT_KEYWORDS.items() if keyword in lowered), default=0.0)
+
+
+def score_url(url: str, depth: int, anchor_score: float = 0.0) -> float:
+    """Higher is crawled first: contact-like paths and anchors win, deep pages lose"""
+    return keyword_score(unquote(urlsplit(url).path)) + anchor_score - depth * _DEPTH_PENALTY
+
+
+@dataclass(frozen=True, slots=True)
+class FrontierEntry:
+    url: str
+    depth: int = 0
+
+
+class Frontier(Protocol):
+    def push(self, url: str, depth: int = 0, anchor_score: float = 0.0) -> None: ...
+
+    def pop(self) -> FrontierEntry: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[FrontierEntry]: ...
+
+
+class FifoFrontier:
+    """Discovery order, i.e. plain breadth-first crawling"""
+
+    def __init__(self) -> None:
+        self._queue: deque[FrontierEntry] = deque()
+
+    def push(self, url: str, depth: int = 0, anchor_score: float = 0.0) -> None:
+        self._queue.append(FrontierEntry(url, depth))
+
+    def pop(self) -> FrontierEntry:
+        return self._queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[FrontierEntry]:
+        return iter(self._queue)
+
+
+class PriorityFrontier:
+    """Max-heap on score_url; ties keep discovery order"""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, FrontierEntry]] = []
+        self._counter = count()
+
+    def push(self, url: str, depth: int = 0, anchor_score: float = 0.0) -> None:
+        priority = -score_url(url, depth, anchor_score)
+        heapq.heappush(self._heap, (priority, next(self._counter), FrontierEntry(url, depth)))
+
+    def pop(self) -> FrontierEntry:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[FrontierEntry]:
+        return (entry for _, _, entry in sorted(self._heap))
+
+
+def make_frontier(kind: str | None = None) -> Frontier:
+    kind = kind or settings.crawler_frontier
+    if kind == "priority":
+        return PriorityFrontier()
+    return FifoFrontier()
@@ -1,7 +1,70 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class PageRecord:
+    url: str
+    status_code: int
+    size_bytes: int
+    emails_found: int = 0
+    phones_found: int = 0
+    links_found: int = 0
+    unchanged: bool = False
+
+
+@dataclass(slots=True)
+class PageState:
+    fingerprint: str
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CrawlState:
+    """What a crawl learned about a site, reusable by the next incremental crawl"""
+
+    pages: dict[str, PageState] = field(default_factory=dict)
+    frontier: list[str] = field(default_factory=list)
+
+    def emails(self) -> set[str]:
+        return {email for page in self.pages.values() for email in page.emails}
+
+    def phones(self) -> set[str]:
+        return {phone for page in self.pages.values() for phone in page.phones}
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CrawlState:
+        return cls(
+            pages={url: PageState(**page) for url, page in data.get("pages", {}).items()},
+            frontier=list(data.get("frontier", [])),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ContactsDiff:
+    emails_added: list[str] = field(default_factory=list)
+    emails_removed: list[str] = field(default_factory=list)
+    phones_added: list[str] = field(default_factory=list)
+    phones_removed: list[str] = field(default_factory=list)
+
+    @classmethod
+    def between(cls, before: CrawlState, after: CrawlState) -> ContactsDiff:
+        previous_emails, emails = before.emails(), after.emails()
+        previous_phones, phones = before.phones(), after.phones()
+        return cls(
+            emails_added=sorted(emails - previous_emails),
+            emails_removed=sorted(previous_emails - emails),
+            phones_added=sorted(phones - previous_phones),
+            phones_removed=sorted(previous_phones - phones),
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -11,6 +74,15 @@ class ParserResult:
     pages_parsed: int
     emails: list[str] = field(default_factory=list)
     phones: list[str] = field(default_factory=list)
+    pages: list[PageRecord] = field(default_factory=list)
+    retries: int = 0
+    breakers: dict[str, str] = field(default_factory=dict)
+    cache_stats: dict[str, int] = field(default_factory=dict)
+    metrics: dict[str, Any] = field(default_factory=dict)
+    # Stopped by the deadline or a cancel before the frontier was exhausted
+    truncated: bool = False
+    state: CrawlState | None = None
+    diff: ContactsDiff | None = None
     started_at: datetime | None = None
     finished_at: datetime | None = None
 
@@ -19,3 +91,10 @@ class ParserResult:
         if not self.started_at or not self.finished_at:
             return None
         return (self.finished_at - self.started_at).total_seconds()
+
+
+@dataclass(frozen=True, slots=True)
+class BatchItem:
+    url: str
+    result: ParserResult | None = None
+    error: str | None = None
@@ -1,66 +1,262 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections import deque
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
 from datetime import datetime
+from pathlib import Path
 from threading import Lock
-from time import sleep
+from urllib.parse import urljoin
+from urllib.robotparser import RobotFileParser
 
+import httpx
 from bs4 import BeautifulSoup
 
 from contacts_parser.core.config import settings
-from contacts_parser.infra.client import request_data
-from contacts_parser.infra.http import get_thread_session
+from contacts_parser.infra.cache import CachedResponse, CacheStats, ResponseCache, content_hash, get_response_cache
+from contacts_parser.infra.cancel import CancelToken
+from contacts_parser.infra.checkpoint import Checkpoint, CheckpointData
+from contacts_parser.infra.client import request_data, request_data_async
+from contacts_parser.infra.http import aclose_async_client, get_async_client, get_session
+from contacts_parser.infra.metrics import CrawlMetrics, metrics_registry
+from contacts_parser.infra.politeness import host_scheduler
+from contacts_parser.infra.retry import CircuitBreaker, CircuitBreakers, RetryPolicy
+from contacts_parser.infra.store import ResultStore, get_result_store
+from contacts_parser.parser.backends import get_backend
+from contacts_parser.parser.boilerplate import BlockCache
+from contacts_parser.parser.canonical import canonicalize
+from contacts_parser.parser.charset import declared_encoding, decode_html, host_charsets
+from contacts_parser.parser.discovery import fetch_robots, iter_sitemap_urls
 from contacts_parser.parser.errors import (
+    CancelledParserError,
     MaxPagesParserError,
     NoContentParserError,
     PermanentParserError,
     TransientParserError,
 )
-from contacts_parser.parser.models import ParserResult
-from contacts_parser.parser.utils import grab_contacts
-from contacts_parser.parser.validators import parse_base_url, validate_and_normalize_url
+from contacts_parser.parser.extractor import extract_from_soup
+from contacts_parser.parser.frontier import Frontier, FrontierEntry, keyword_score, make_frontier
+from contacts_parser.parser.models import ContactsDiff, CrawlState, PageRecord, PageState, ParserResult
+from contacts_parser.parser.process_pool import ParsedContent, discard_process_pool, get_process_pool, parse_content
+from contacts_parser.parser.utils import contacts_from_extracted
+from contacts_parser.parser.validators import is_asset_url, parse_base_url, validate_and_normalize_url
+from contacts_parser.parser.visited import VisitedSet, make_visited_set
+
+
+# Called after every parsed page with its record and the contacts first seen on it
+PageCallback = Callable[[PageRecord, set[str], set[str]], None]
+
+# How often crawl loops wake up to check the cancel token while pages are in flight
+_CANCEL_POLL_SECONDS = 0.1
 
 
 class Parser:
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+        on_page: PageCallback | None = None,
+        cache: ResponseCache | None = None,
+        prior_state: CrawlState | None = None,
+        store: ResultStore | None = None,
+        cancel: CancelToken | None = None,
+        deadline_seconds: float | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> None:
         self._timeout = settings.http_timeout_seconds
+        # The deadline starts when the crawl does, not when it is queued
+        self._cancel = cancel or CancelToken()
+        self._deadline_seconds = deadline_seconds or settings.crawler_deadline_seconds
+        self._truncated = False
+        self._on_page = on_page
+        if cache is None and settings.http_cache_enabled:
+            cache = get_response_cache()
+        self._cache = cache
+        self._cache_stats = CacheStats()
+        if store is None and settings.result_store_enabled:
+            store = get_result_store()
+        self._store = store
+        self._metrics = CrawlMetrics()
+        # Contacts of header/footer/menu blocks already scanned on this site
+        self._block_cache = BlockCache() if settings.parser_block_cache else None
+        # Incremental mode: pages whose fingerprint matches the prior state are
+        # not parsed again, and the result carries the new state and a diff.
+        self._prior_state = prior_state
+        self._state = CrawlState() if prior_state is not None else None
+        # Prior pages that now answer 404/403 or no HTML; the rest stay in the state until fetched again
+        self._gone: set[str] = set()
+        self._pending: list[str] = []
+        self._robots: RobotFileParser | None = None
+        self._discovered: list[str] = []
+        # Keyword score of the best anchor text seen per discovered link
+        self._anchor_scores: dict[str, float] = {}
+        self._pages_without_new_contacts = 0
+        # A shared executor lets batch crawls run many sites on one pool;
+        # max_workers then caps how many of its slots this site may hold.
+        self._executor = executor
+        self._max_workers = max_workers or settings.crawler_max_workers
+        # The async engine multiplexes many more fetches; an explicit max_workers caps it as well
+        self._max_concurrency = max_workers or settings.crawler_max_concurrency
         self._pages = dict()
+        self._records: dict[str, PageRecord] = dict()
         self._emails = set()
         self._phones = set()
         self._state_lock = Lock()
+        self._retry_policy = RetryPolicy()
+        self._backend = get_backend()
+        self._breakers = CircuitBreakers()
         self._base_url = parse_base_url(url)
         self._init_url = validate_and_normalize_url(url)
         self._logger = logging.getLogger(__name__)
+        # A checkpoint that already holds this crawl resumes it: finished pages
+        # are restored and only its saved frontier is fetched.
+        self._checkpoint = checkpoint
+        self._resumed = checkpoint.load() if checkpoint is not None else None
+        if self._resumed is not None:
+            self._restore(self._resumed)
+
+    @classmethod
+    def resume(cls, path: str | Path, **kwargs) -> Parser:
+        """Continue the crawl saved in a checkpoint file"""
+        checkpoint = Checkpoint(path)
+        if checkpoint.url is None:
+            raise PermanentParserError(f"No crawl to resume in {path}")
+        return cls(checkpoint.url, checkpoint=checkpoint, **kwargs)
+
+    def _restore(self, data: CheckpointData) -> None:
+        if data.url != self._init_url:
+            raise PermanentParserError(f"Checkpoint belongs to another crawl: {data.url}")
+        for url, payload in data.pages.items():
+            self._records[url] = PageRecord(**payload["record"])
+            self._emails.update(payload["emails"])
+            self._phones.update(payload["phones"])
+        self._logger.info(
+            "Resuming crawl from checkpoint",
+            extra={"url": data.url, "pages_done": len(data.pages), "frontier": len(data.frontier)},
+        )
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Stop the crawl: queued pages are dropped and in-flight reads abort"""
+        self._cancel.cancel(reason)
 
     def run(self) -> ParserResult:
-        started_at = datetime.utcnow()
+        # A shared executor (batch crawls) is what caps fetches across sites, so those crawls stay on threads
+        if settings.crawler_engine == "async" and self._executor is None:
+            return asyncio.run(self._arun_in_new_loop())
+
+        started_at = self._log_start()
+        self.discover_frontier()
+
+        # Main loop: select related links and parse them
+        self.find_related_pages(self._init_url)
+
+        return self._build_result(started_at)
+
+    async def arun(self, client: httpx.AsyncClient | None = None) -> ParserResult:
+        started_at = self._log_start()
+        await asyncio.to_thread(self.discover_frontier)
+
+        # Without an explicit client, crawls on one event loop share a kept-alive pool
+        await self.afind_related_pages(self._init_url, client or get_async_client())
+
+        return self._build_result(started_at)
+
+    async def _arun_in_new_loop(self) -> ParserResult:
+        # The loop ends with this crawl, so its shared client goes too
+        try:
+            return await self.arun()
+        finally:
+            await aclose_async_client()
+
+    def discover_frontier(self) -> None:
+        """Load robots.txt rules and seed the frontier from sitemaps, when enabled"""
+        if not (settings.crawler_robots_enabled or settings.crawler_sitemaps_enabled):
+            return
+
+        session = get_session()
+        if settings.crawler_robots_enabled:
+            self._robots = fetch_robots(session, self._base_url, self._timeout)
+            crawl_delay = self._robots.crawl_delay(settings.http_user_agent) if self._robots else None
+            if crawl_delay:
+                host_scheduler.set_min_delay(self._base_url, float(crawl_delay))
+
+        # A resumed crawl already seeded its frontier from the sitemaps
+        if settings.crawler_sitemaps_enabled and self._resumed is None:
+            sitemaps = (self._robots.site_maps() if self._robots else None) or [urljoin(self._base_url, "/sitemap.xml")]
+            discovered: dict[str, None] = {}
+            for loc in iter_sitemap_urls(session, sitemaps, self._timeout):
+                if len(discovered) >= settings.sitemap_max_urls or self._cancel.cancelled:
+                    break
+                # Sitemaps usually list www. or mixed-case hosts; the base URL is canonical
+                url = self._canonical_link(loc.strip())
+                if url is not None:
+                    discovered[url] = None
+            self._discovered = list(discovered)
+
+        self._logger.info(
+            "Frontier discovery finished",
+            extra={"url": self._base_url, "robots": self._robots is not None, "sitemap_urls": len(self._discovered)},
+        )
+
+    def can_fetch(self, url: str) -> bool:
+        return self._robots is None or self._robots.can_fetch(settings.http_user_agent, url)
+
+    def _log_start(self) -> datetime:
+        if self._deadline_seconds:
+            self._cancel.set_deadline(self._deadline_seconds)
         self._logger.info(
             "Starting parser",
             extra={
                 "url": self._init_url,
                 "base_url": self._base_url,
+                "engine": settings.crawler_engine,
                 "max_pages": settings.max_pages_deep,
                 "max_retries": settings.http_max_retries,
+                "retry_budget": settings.http_retry_budget,
                 "timeout": settings.http_timeout_seconds,
                 "backoff": settings.http_backoff_seconds,
+                "deadline": self._deadline_seconds,
             },
         )
+        return datetime.utcnow()
 
-        # Main loop: select related links and parse them
-        self.find_related_pages(self._init_url)
-
+    def _build_result(self, started_at: datetime) -> ParserResult:
         finished_at = datetime.utcnow()
+        diff = None
+        if self._state is not None:
+            self._state.frontier = self._pending
+            # Pages a short or failing run did not reach keep their last known contacts,
+            # so they are neither reported as removed now nor as added by the next run
+            for url, page in self._prior_state.pages.items():
+                if url not in self._gone:
+                    self._state.pages.setdefault(url, page)
+            diff = ContactsDiff.between(self._prior_state, self._state)
+        if self._block_cache is not None:
+            self._metrics.record_text(self._block_cache.scanned_chars, self._block_cache.skipped_chars)
+        metrics_registry.merge(self._metrics, self.get_pages_len())
         result = ParserResult(
             url=self._init_url,
             base_url=self._base_url,
             pages_parsed=self.get_pages_len(),
             emails=self.get_emails(),
             phones=self.get_phones(),
+            pages=self.get_page_records(),
+            retries=self._retry_policy.retries,
+            breakers=self._breakers.states(),
+            cache_stats=self._cache_stats.as_dict(),
+            metrics=self._metrics.as_dict(),
+            truncated=self._truncated,
+            state=self._state,
+            diff=diff,
             started_at=started_at,
             finished_at=finished_at,
         )
+        if self._store is not None:
+            self._store.add(result.base_url, result.emails, result.phones, result.finished_at)
         self._logger.info(
             "Parser finished",
             extra={
@@ -69,100 +265,505 @@ class Parser:
                 "emails_found": len(result.emails),
                 "phones_found": len(result.phones),
                 "duration_seconds": result.duration_seconds,
+                "truncated": result.truncated,
             },
         )
         return result
 
-    def parse_page(self, url: str) -> None:
-        with self._state_lock:
-            if len(self._pages) >= settings.max_pages_deep:
-                raise MaxPagesParserError("You've reached limit on number of pages")
+    def parse_page(self, url: str) -> list[str]:
+        self._check_pages_limit()
 
         self._logger.debug("Parsing page", extra={"url": url})
+        cached = self._cached_response(url)
+        if cached is not None and cached.is_fresh(self._cache.ttl):
+            self._cache_stats.record("hits")
+            return self._process_page(
+                url, cached.status_code, cached.content, cached.content_hash, cached.content_type
+            )
+
+        headers = cached.conditional_headers() if cached else None
+        breaker = self._breakers.get(url)
         resp = None
-        for _ in range(settings.http_max_retries):
+        for attempt in range(settings.http_max_retries):
+            if not self._allow_request(breaker, url):
+                break
             try:
-                resp = request_data(get_thread_session(), url, self._timeout)
+                resp = request_data(
+                    get_session(), url, self._timeout, headers, metrics=self._metrics, cancel=self._cancel
+                )
+                breaker.record_success()
                 break
             except NoContentParserError:
+                breaker.record_success()
+                self._mark_gone(url)
                 break
             except TransientParserError as e:
-                self._logger.warning(
-                    "Transient parser error; retrying",
-                    extra={"error": str(e), "backoff": settings.http_backoff_seconds, "url": url},
+                breaker.record_failure()
+                backoff = self._retry_backoff(e, url, attempt)
+                if backoff is None:
+                    break
+                with self._metrics.time("retry_sleep"):
+                    self._cancel.sleep(backoff)
+            except PermanentParserError as e:
+                # The host answered, so it counts as healthy for the breaker
+                breaker.record_success()
+                raise e
+            finally:
+                breaker.release()
+
+        if not resp:
+            return []
+        return self._handle_response(url, resp.status_code, resp.content, resp.headers, cached)
+
+    async def aparse_page(self, client: httpx.AsyncClient, url: str) -> list[str]:
+        self._check_pages_limit()
+
+        self._logger.debug("Parsing page", extra={"url": url})
+        # Cache lookups, parsing and extraction are blocking; they run off the event loop
+        # so one CPU-heavy crawl does not stall every other request served by that loop
+        cached = await asyncio.to_thread(self._cached_response, url)
+        if cached is not None and cached.is_fresh(self._cache.ttl):
+            self._cache_stats.record("hits")
+            return await asyncio.to_thread(
+                self._process_page, url, cached.status_code, cached.content, cached.content_hash, cached.content_type
+            )
+
+        headers = cached.conditional_headers() if cached else None
+        breaker = self._breakers.get(url)
+        resp = None
+        for attempt in range(settings.http_max_retries):
+            if not self._allow_request(breaker, url):
+                break
+            try:
+                resp = await request_data_async(
+                    client, url, self._timeout, headers, metrics=self._metrics, cancel=self._cancel
                 )
-                sleep(settings.http_backoff_seconds)
-                continue
+                breaker.record_success()
+                break
+            except NoContentParserError:
+                breaker.record_success()
+                self._mark_gone(url)
+                break
+            except TransientParserError as e:
+                breaker.record_failure()
+                backoff = self._retry_backoff(e, url, attempt)
+                if backoff is None:
+                    break
+                with self._metrics.time("retry_sleep"):
+                    await self._cancel.asleep(backoff)
             except PermanentParserError as e:
+                # The host answered, so it counts as healthy for the breaker
+                breaker.record_success()
                 raise e
+            finally:
+                breaker.release()
+
+        if not resp:
+            return []
+        return await asyncio.to_thread(
+            self._handle_response, url, resp.status_code, resp.content, resp.headers, cached
+        )
 
+    def _mark_gone(self, url: str) -> None:
+        if self._state is not None:
+            with self._state_lock:
+                self._gone.add(url)
+
+    def _check_pages_limit(self) -> None:
+        self._cancel.raise_if_cancelled()
+        with self._state_lock:
+            if len(self._records) >= settings.max_pages_deep:
+                raise MaxPagesParserError("You've reached limit on number of pages")
+
+    def _allow_request(self, breaker: CircuitBreaker, url: str) -> bool:
+        if breaker.allow():
+            return True
+        self._logger.debug("Circuit open; skipping page", extra={"url": url})
+        return False
+
+    def _retry_backoff(self, error: TransientParserError, url: str, attempt: int) -> float | None:
+        """Backoff before the next attempt, or None when the page should be given up"""
+        if attempt + 1 >= settings.http_max_retries or not self._retry_policy.try_acquire():
+            self._logger.warning("Transient parser error; giving up", extra={"error": str(error), "url": url})
+            return None
+
+        backoff = self._retry_policy.backoff(attempt)
+        self._metrics.record_retry()
+        self._logger.warning(
+            "Transient parser error; retrying",
+            extra={
+                "error": str(error),
+                "backoff": backoff,
+                "retry_after": error.retry_after,
+                "url": url,
+            },
+        )
+        return backoff
+
+    def _cached_response(self, url: str) -> CachedResponse | None:
+        if self._cache is None:
+            return None
+        return self._cache.get(url)
+
+    def _handle_response(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        headers: Mapping[str, str],
+        cached: CachedResponse | None,
+    ) -> list[str]:
+        content_type = headers.get("Content-Type")
+        if self._cache is None:
+            return self._process_page(url, status_code, content, content_type=content_type)
+
+        if status_code == 304 and cached is not None:
+            self._cache.touch(url)
+            self._cache_stats.record("revalidated")
+            return self._process_page(
+                url, cached.status_code, cached.content, cached.content_hash, cached.content_type
+            )
+
+        self._cache_stats.record("misses")
+        if status_code == 200:
+            self._cache.put(url, status_code, content, headers)
+        return self._process_page(url, status_code, content, content_type=content_type)
+
+    def _parse_in_worker(
+        self, url: str, content: bytes, encoding: str | None, host_encoding: str | None
+    ) -> ParsedContent | None:
+        """Parse in the process pool; None when the pool broke and the page should be parsed inline"""
+        pool = get_process_pool()
         try:
-            if resp:
-                page = BeautifulSoup(resp.content, settings.parser_type)
-                contacts = grab_contacts(page)
-                with self._state_lock:
-                    self._pages[url] = page
-                    self._emails.update(contacts["emails"])
-                    self._phones.update(contacts["phones"])
+            future = pool.submit(
+                parse_content, content, self._backend.name, encoding, host_encoding, self._block_cache is not None
+            )
+            while not future.done():
+                if self._cancel.cancelled:
+                    # A page already in a worker still finishes there; nobody waits for it
+                    future.cancel()
+                    self._cancel.raise_if_cancelled()
+                wait([future], timeout=self._cancel.bound(_CANCEL_POLL_SECONDS))
+            return future.result()
+        except BrokenProcessPool:
+            # A worker died (OOM kill, crash in a C parser); later pages get a fresh pool
+            self._logger.warning("Parse worker pool broke; parsing inline", extra={"url": url})
+            discard_process_pool(pool)
+            return None
+
+    def _process_page(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        digest: str | None = None,
+        content_type: str | None = None,
+    ) -> list[str]:
+        # The parsed tree is dropped once contacts and links are extracted;
+        # only a compact PageRecord outlives this call unless debugging.
+        if digest is None and (self._cache is not None or self._state is not None):
+            digest = content_hash(content)
+
+        page = None
+        anchor_scores: dict[str, float] = {}
+        prior_page = self._prior_state.pages.get(url) if self._prior_state is not None else None
+        extraction = self._cache.get_extraction(digest) if self._cache is not None else None
+        unchanged = prior_page is not None and prior_page.fingerprint == digest
+
+        if unchanged:
+            contacts = {"emails": prior_page.emails, "phones": prior_page.phones}
+            links = prior_page.links
+        elif extraction is not None:
+            self._cache_stats.record("extraction_hits")
+            contacts = extraction
+            links = [link for link in extraction["links"] if link.startswith(self._base_url)]
+        else:
+            # Charset detection runs only for pages that neither declare an encoding nor decode as UTF-8
+            encoding = declared_encoding(content, content_type)
+            host_encoding = None if encoding else host_charsets.get(url)
+            try:
+                parsed = None
+                if settings.parser_processes:
+                    # Only bytes go to the worker and only contacts and links come back
+                    with self._metrics.time("parse"):
+                        parsed = self._parse_in_worker(url, content, encoding, host_encoding)
+                if parsed is not None:
+                    host_charsets.remember(url, parsed.encoding)
+                    if self._block_cache is not None:
+                        self._block_cache.count(parsed.scanned_chars, parsed.skipped_chars)
+                    contacts = {"emails": parsed.emails, "phones": parsed.phones}
+                    hrefs, anchors = parsed.hrefs, parsed.anchors
+                else:
+                    with self._metrics.time("parse"):
+                        markup, encoding = decode_html(content, encoding, host_encoding)
+                        host_charsets.remember(url, encoding)
+                        if settings.parser_keep_pages:
+                            page = BeautifulSoup(markup, settings.parser_type)
+                            extracted = extract_from_soup(page)
+                        else:
+                            extracted = self._backend.extract(markup)
+                    with self._metrics.time("extract"):
+                        contacts = contacts_from_extracted(extracted, self._block_cache)
+                    hrefs, anchors = extracted.hrefs, extracted.anchors
+                links = self._same_site_links(hrefs)
+                anchor_scores = self._score_anchors(anchors)
+            except CancelledParserError:
+                raise
+            except Exception as e:
+                raise PermanentParserError(str(e)) from e
+
+            if self._cache is not None:
+                self._cache.put_extraction(digest, {**contacts, "links": links})
+
+        record = PageRecord(
+            url=url,
+            status_code=status_code,
+            size_bytes=len(content),
+            emails_found=len(contacts["emails"]),
+            phones_found=len(contacts["phones"]),
+            links_found=len(links),
+            unchanged=unchanged,
+        )
+        with self._state_lock:
+            self._records[url] = record
+            if settings.parser_keep_pages and page is not None:
+                self._pages[url] = page
+            if self._state is not None:
+                self._state.pages[url] = PageState(digest, list(contacts["emails"]), list(contacts["phones"]), links)
+            if self._checkpoint is not None:
+                emails, phones = list(contacts["emails"]), list(contacts["phones"])
+                self._checkpoint.add_page(url, {"record": asdict(record), "emails": emails, "phones": phones})
+            new_emails = set(contacts["emails"]) - self._emails
+            new_phones = set(contacts["phones"]) - self._phones
+            self._emails.update(new_emails)
+            self._phones.update(new_phones)
+            if new_emails or new_phones:
+                self._pages_without_new_contacts = 0
+            else:
+                self._pages_without_new_contacts += 1
+            for link, score in anchor_scores.items():
+                if score > self._anchor_scores.get(link, 0.0):
+                    self._anchor_scores[link] = score
+
+        if self._on_page is not None:
+            self._on_page(record, new_emails, new_phones)
+
+        return links
 
-        except Exception as e:
-            raise PermanentParserError(str(e)) from e
+    def _seed_frontier(self, starting_url: str) -> tuple[Frontier, VisitedSet]:
+        if self._resumed is not None:
+            return self._resumed_frontier(self._resumed)
+        if self._checkpoint is not None:
+            self._checkpoint.start(starting_url)
+
+        seeds = [starting_url]
+        if self._prior_state is not None:
+            seeds.extend(self._prior_state.pages)
+            seeds.extend(self._prior_state.frontier)
+        seeds.extend(self._discovered)
+
+        frontier = make_frontier()
+        visited = make_visited_set()
+        for url in seeds:
+            if url in visited or not url.startswith(self._base_url) or is_asset_url(url) or not self.can_fetch(url):
+                continue
+            self._visit(url, visited)
+            frontier.push(url, depth=0 if url == starting_url else 1)
+        return frontier, visited
+
+    def _resumed_frontier(self, data: CheckpointData) -> tuple[Frontier, VisitedSet]:
+        # Pages in flight at the last checkpoint are in its frontier and are fetched again
+        frontier = make_frontier()
+        visited = make_visited_set()
+        for digest in data.visited:
+            visited.add_fingerprint(digest)
+        for url, depth in data.frontier:
+            frontier.push(url, depth=depth)
+        return frontier, visited
+
+    def _visit(self, url: str, visited: VisitedSet) -> None:
+        visited.add(url)
+        if self._checkpoint is not None:
+            self._checkpoint.mark_visited(url)
+
+    def _save_checkpoint(self, frontier: Frontier, in_flight: Iterable[FrontierEntry], force: bool = False) -> None:
+        if self._checkpoint is not None and (force or self._checkpoint.due()):
+            self._checkpoint.save((entry.url, entry.depth) for entry in (*in_flight, *frontier))
+
+    def _enqueue_links(self, links: list[str], depth: int, frontier: Frontier, visited: VisitedSet) -> None:
+        for next_url in links:
+            if next_url in visited:
+                continue
+            self._visit(next_url, visited)
+            if self.can_fetch(next_url):
+                frontier.push(next_url, depth=depth, anchor_score=self._anchor_scores.pop(next_url, 0.0))
+
+    def _stop_if_cancelled(self) -> bool:
+        if not self._cancel.cancelled:
+            return False
+        if not self._truncated:
+            self._truncated = True
+            self._logger.info("Crawl stopped early", extra={"url": self._init_url, "reason": self._cancel.reason})
+        return True
+
+    def _is_stale(self) -> bool:
+        """Contacts were found but the last pages brought nothing new"""
+        limit = settings.crawler_stale_pages_limit
+        with self._state_lock:
+            has_contacts = bool(self._emails or self._phones)
+            return limit > 0 and has_contacts and self._pages_without_new_contacts >= limit
 
     def find_related_pages(self, starting_url: str) -> None:
-        queue = deque([starting_url])
-        visited = {starting_url}
+        if self._executor is not None:
+            self._crawl(starting_url, self._executor)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            self._crawl(starting_url, executor)
+
+    def _crawl(self, starting_url: str, executor: Executor) -> None:
+        frontier, visited = self._seed_frontier(starting_url)
+        futures: dict = {}
+
+        try:
+            self._crawl_loop(executor, frontier, visited, futures)
+        finally:
+            self._pending = [entry.url for entry in (*futures.values(), *frontier)]
+            self._save_checkpoint(frontier, futures.values(), force=True)
+            # Pages still queued on the executor are dropped; running ones abort at their next read
+            for future in futures:
+                future.cancel()
+
+    def _crawl_loop(self, executor: Executor, frontier: Frontier, visited: VisitedSet, futures: dict) -> None:
+        while frontier or futures:
+            if self._stop_if_cancelled():
+                return
+
+            while frontier and len(futures) < self._max_workers:
+                entry = frontier.pop()
+                futures[executor.submit(self.parse_page, entry.url)] = entry
+
+            if not futures:
+                continue
+
+            done, _ = wait(futures, timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                entry = futures.pop(future)
+                try:
+                    links = future.result()
+                except MaxPagesParserError:
+                    frontier.push(entry.url, depth=entry.depth)
+                    # Pages still in flight are not needed; they abort at their next read
+                    self._cancel.cancel("max pages")
+                    return
+                except CancelledParserError:
+                    frontier.push(entry.url, depth=entry.depth)
+                    self._stop_if_cancelled()
+                    return
+                except PermanentParserError as e:
+                    raise e
 
-        with ThreadPoolExecutor(max_workers=settings.crawler_max_workers) as executor:
-            futures: dict = {}
+                self._enqueue_links(links, entry.depth + 1, frontier, visited)
 
-            while queue or futures:
-                while queue and len(futures) < settings.crawler_max_workers:
-                    url = queue.popleft()
-                    futures[executor.submit(self.parse_page, url)] = url
+            self._save_checkpoint(frontier, futures.values())
+            if self._is_stale():
+                self._logger.info("No new contacts recently; stopping early", extra={"url": self._init_url})
+                return
 
-                if not futures:
+    async def afind_related_pages(self, starting_url: str, client: httpx.AsyncClient) -> None:
+        frontier, visited = self._seed_frontier(starting_url)
+        tasks: dict[asyncio.Task, FrontierEntry] = {}
+
+        try:
+            while frontier or tasks:
+                if self._stop_if_cancelled():
+                    return
+
+                while frontier and len(tasks) < self._max_concurrency:
+                    entry = frontier.pop()
+                    tasks[asyncio.create_task(self.aparse_page(client, entry.url))] = entry
+
+                if not tasks:
                     continue
 
-                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                done, _ = await asyncio.wait(tasks, timeout=_CANCEL_POLL_SECONDS, return_when=asyncio.FIRST_COMPLETED)
 
-                for future in done:
-                    url = futures.pop(future)
+                for task in done:
+                    entry = tasks.pop(task)
                     try:
-                        future.result()
+                        links = task.result()
                     except MaxPagesParserError:
+                        frontier.push(entry.url, depth=entry.depth)
+                        # Pages still in flight are not needed; they abort at their next read
+                        self._cancel.cancel("max pages")
+                        return
+                    except CancelledParserError:
+                        frontier.push(entry.url, depth=entry.depth)
+                        self._stop_if_cancelled()
                         return
                     except PermanentParserError as e:
                         raise e
 
-                    for next_url in self.find_all_links(url):
-                        if next_url in visited:
-                            continue
-                        visited.add(next_url)
-                        queue.append(next_url)
+                    self._enqueue_links(links, entry.depth + 1, frontier, visited)
 
-    def find_all_links(self, url: str) -> list[str]:
-        try:
-            page_links = self.get_page(url).select("[href], [src]")
-        except KeyError:
-            self._logger.debug("No content on the page", extra={"url": url})
-            return []
+                self._save_checkpoint(frontier, tasks.values())
+                if self._is_stale():
+                    self._logger.info("No new contacts recently; stopping early", extra={"url": self._init_url})
+                    return
+        finally:
+            self._pending = [entry.url for entry in (*tasks.values(), *frontier)]
+            self._save_checkpoint(frontier, tasks.values(), force=True)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
+    def find_all_links(self, page: BeautifulSoup) -> list[str]:
+        return self._same_site_links(extract_from_soup(page).hrefs)
+
+    def _same_site_links(self, hrefs: list[str]) -> list[str]:
         url_list = set()
-        for page_link in page_links:
-            url = page_link.get("href")
-            if url and url.startswith(self._base_url):
-                url_list.add(validate_and_normalize_url(url))
+        for href in hrefs:
+            url = self._canonical_link(href)
+            if url is not None and not is_asset_url(url):
+                url_list.add(url)
 
         return list(url_list)
 
+    def _canonical_link(self, href: str) -> str | None:
+        """Canonical URL of a same-site http(s) link, None for anything else"""
+        if not href.startswith(("http://", "https://", "HTTP://", "HTTPS://")):
+            return None
+        try:
+            url = canonicalize(href)
+        except PermanentParserError:
+            return None
+        return url if url.startswith(self._base_url) else None
+
+    def _score_anchors(self, anchors: list[tuple[str, str]]) -> dict[str, float]:
+        if settings.crawler_frontier != "priority":
+            return {}
+
+        scores: dict[str, float] = {}
+        for href, text in anchors:
+            score = keyword_score(text)
+            link = self._canonical_link(href) if score else None
+            if link is not None:
+                scores[link] = max(score, scores.get(link, 0.0))
+        return scores
+
     def get_page(self, url: str) -> BeautifulSoup | None:
-        return self._pages[validate_and_normalize_url(url)]
+        return self._pages.get(validate_and_normalize_url(url))
 
     def get_pages(self) -> dict[str, BeautifulSoup]:
+        """Parsed trees by URL; only populated when PARSER_KEEP_PAGES is enabled"""
         return self._pages
 
+    def get_page_records(self) -> list[PageRecord]:
+        return list(self._records.values())
+
     def get_pages_len(self) -> int:
-        return len(self._pages)
+        return len(self._records)
 
     def get_base_url(self) -> str:
         return self._base_url
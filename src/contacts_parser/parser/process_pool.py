@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser.backends import get_backend
+from contacts_parser.parser.boilerplate import BlockCache
+from contacts_parser.parser.charset import decode_html
+from contacts_parser.parser.frontier import keyword_score
+from contacts_parser.parser.utils import contacts_from_extracted
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedContent:
+    """What a parse worker sends back: contacts and candidate links, no tree"""
+
+    emails: list[str]
+    phones: list[str]
+    hrefs: list[str]
+    anchors: list[tuple[str, str]]
+    encoding: str | None = None
+    scanned_chars: int = 0
+    skipped_chars: int = 0
+
+
+# One per worker process, shared by every crawl it serves: a block's contacts depend only on its text
+_block_cache = BlockCache()
+
+
+def parse_content(
+    content: bytes,
+    backend: str | None = None,
+    encoding: str | None = None,
+    host_encoding: str | None = None,
+    skip_known_blocks: bool = False,
+) -> ParsedContent:
+    """Decode, parse and extract one page; runs in a worker process"""
+    markup, encoding = decode_html(content, encoding, host_encoding)
+    extracted = get_backend(backend).extract(markup)
+    scanned, skipped = _block_cache.scanned_chars, _block_cache.skipped_chars
+    contacts = contacts_from_extracted(extracted, _block_cache if skip_known_blocks else None)
+    return ParsedContent(
+        emails=contacts["emails"],
+        phones=contacts["phones"],
+        # Only absolute http(s) links can become pages, so nothing else crosses the process boundary
+        hrefs=[href for href in extracted.hrefs if href.startswith(("http://", "https://", "HTTP://", "HTTPS://"))],
+        anchors=[(href, text) for href, text in extracted.anchors if keyword_score(text)],
+        encoding=encoding,
+        scanned_chars=_block_cache.scanned_chars - scanned,
+        skipped_chars=_block_cache.skipped_chars - skipped,
+    )
+
+
+_pool_lock = Lock()
+
+
+@lru_cache(maxsize=1)
+def get_process_pool() -> ProcessPoolExecutor:
+    # The pool is created from crawler threads; forking a process with live threads and held
+    # locks (logging, SQLite, connection pools) can deadlock the children, so they start clean
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    pool = ProcessPoolExecutor(max_workers=settings.parser_processes, mp_context=multiprocessing.get_context(method))
+    atexit.register(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+def shutdown_process_pool() -> None:
+    if get_process_pool.cache_info().currsize:
+        get_process_pool().shutdown(cancel_futures=True)
+        get_process_pool.cache_clear()
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_process_pool() starts a fresh one"""
+    with _pool_lock:
+        # Several threads see the same breakage; only the first replaces the pool
+        if get_process_pool.cache_info().currsize and get_process_pool() is pool:
+            get_process_pool.cache_clear()
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -1,90 +1,153 @@
 import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import accumulate
 
 from bs4 import BeautifulSoup
 
+from contacts_parser.parser.boilerplate import BlockCache
+from contacts_parser.parser.extractor import ExtractedPage, extract_from_soup
 
-def _normalize_russian_phone_variants(raw_digits: str) -> set[str]:
-    digits = re.sub(r"\D", "", raw_digits)
+_NON_DIGITS = re.compile(r"\D")
+# Groups: optional country/trunk prefix, then the 10 digits of the number. The
+# lookahead lets the scan skip positions that cannot start a number; a match
+# then begins at its first digit instead of a leading separator, same digits.
+_PHONE_PATTERN = re.compile(r"(?=[+\d])(\+7|7|8)?[\s\-()]*(\d{3})[\s\-()]*(\d{3})[\s\-]*(\d{2})[\s\-]*(\d{2})")
+_EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_INVALID_EMAIL_SUFFIXES = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".svg",
+    ".ico",
+    ".bmp",
+    ".tiff",
+)
+# Neither pattern can match across it, so texts can be scanned joined together
+_TEXT_SEPARATOR = "\x00"
 
-    if len(digits) == 11 and digits[0] in {"7", "8"}:
-        core = digits[1:]
-    elif len(digits) == 10 and digits[0] in {"9", "4", "8"}:
-        core = digits
-    else:
-        return set()
 
-    return {f"+7{core}", f"7{core}", f"8{core}"}
+@dataclass(slots=True)
+class TextContacts:
+    """Contacts of one text; phones are canonical (+7XXXXXXXXXX)"""
 
+    emails: set[str] = field(default_factory=set)
+    phones: set[str] = field(default_factory=set)
 
-def _extract_russian_phones(text: str) -> set[str]:
-    phone_pattern = re.compile(r"(?:\+7|7|8)?[\s\-()]*\d{3}[\s\-()]*\d{3}[\s\-]*\d{2}[\s\-]*\d{2}")
-    phones: set[str] = set()
 
-    for match in phone_pattern.findall(text):
-        phones.update(_normalize_russian_phone_variants(match))
+def _canonical_phone(digits: str) -> str | None:
+    if len(digits) == 11 and digits[0] in "78":
+        return f"+7{digits[1:]}"
+    if len(digits) == 10 and digits[0] in "948":
+        return f"+7{digits}"
+    return None
 
-    return phones
 
+def normalize_phone(raw: str) -> str | None:
+    """Canonical +7XXXXXXXXXX form of a phone in any accepted spelling"""
+    return _canonical_phone(_NON_DIGITS.sub("", raw))
+
+
+def phone_variants(canonical: str) -> tuple[str, str, str]:
+    core = canonical[2:]
+    return canonical, f"7{core}", f"8{core}"
 
-def _is_valid_email(email: str) -> bool:
-    invalid_suffixes = (
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".gif",
-        ".webp",
-        ".svg",
-        ".ico",
-        ".bmp",
-        ".tiff",
-    )
-    lowered = email.lower()
-
-    if lowered.endswith(invalid_suffixes):
-        return False
-
-    return True
-
-
-def grab_contacts(
-    page: BeautifulSoup,
-) -> dict[
-    dict[str, list[str]],
-    dict[str, list[str]],
-]:
-    email_pattern = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
-
-    attribute_values: list[str] = []
-    for element in page.select("[href], [src]"):
-        href_value = element.get("href")
-        src_value = element.get("src")
-        if href_value:
-            attribute_values.append(href_value)
-        if src_value:
-            attribute_values.append(src_value)
-
-    emails = set(
-        filter(
-            None,
-            [
-                email_link.get("href").removeprefix("mailto:").split("?")[0].strip()
-                for email_link in page.select("[href^='mailto:']")
-            ],
-        )
-    )
 
-    combined_text = " ".join([page.get_text(), *attribute_values])
-    emails.update(filter(_is_valid_email, email_pattern.findall(combined_text)))
+def _normalize_russian_phone_variants(raw_digits: str) -> set[str]:
+    canonical = normalize_phone(raw_digits)
+    return set(phone_variants(canonical)) if canonical else set()
 
-    phones: set[str] = set()
-    for element in page.select("[href^='tel:'], [src^='tel:']"):
-        value = element.get("href") or element.get("src")
-        if value:
-            phones.update(_normalize_russian_phone_variants(value.removeprefix("tel:").split("?")[0]))
 
-    phones.update(_extract_russian_phones(combined_text))
+def _is_valid_email(email: str) -> bool:
+    return not email.lower().endswith(_INVALID_EMAIL_SUFFIXES)
+
+
+def extract_contacts_batch(texts: Sequence[str]) -> list[TextContacts]:
+    """
+    Emails and canonical phones of many texts at once.
+
+    The texts are joined and each pattern runs once over the whole batch;
+    matches are mapped back to their text by offset.
+    """
+    results = [TextContacts() for _ in texts]
+    if not texts:
+        return results
+
+    corpus = _TEXT_SEPARATOR.join(texts)
+    # bounds[i] is the offset just past text i and its separator
+    bounds = list(accumulate(len(text) + 1 for text in texts))
+
+    for match in _EMAIL_PATTERN.finditer(corpus):
+        email = match.group()
+        if _is_valid_email(email):
+            results[bisect_right(bounds, match.start())].emails.add(email)
+
+    for match in _PHONE_PATTERN.finditer(corpus):
+        prefix, *groups = match.groups()
+        # The pattern already pins the digit count; only the unprefixed leading digit needs checking
+        if prefix or groups[0][0] in "948":
+            results[bisect_right(bounds, match.start())].phones.add("+7" + "".join(groups))
+
+    return results
+
+
+def _scan_with_blocks(extracted: ExtractedPage, block_cache: BlockCache) -> TextContacts:
+    """Scan the page text, reusing contacts of boilerplate blocks seen on earlier pages"""
+    contacts = TextContacts()
+    segments: list[str] = []
+    novel: list[str] = []
+    skipped = position = 0
+    for start, end in extracted.blocks:
+        segments.append("".join(extracted.text[position:start]))
+        position = end
+        block = "".join(extracted.text[start:end])
+        known = block_cache.get(block)
+        if known is None:
+            novel.append(block)
+        else:
+            contacts.emails |= known.emails
+            contacts.phones |= known.phones
+            skipped += len(block)
+    segments.append("".join(extracted.text[position:]))
+
+    # The separator keeps text on both sides of a removed block from matching as one
+    main_text = " ".join([_TEXT_SEPARATOR.join(segments), *extracted.hrefs, *extracted.srcs])
+    found = extract_contacts_batch([main_text, *novel])
+    for block, block_contacts in zip(novel, found[1:]):
+        block_cache.put(block, block_contacts)
+    for text_contacts in found:
+        contacts.emails |= text_contacts.emails
+        contacts.phones |= text_contacts.phones
+
+    block_cache.count(len(main_text) + sum(map(len, novel)), skipped)
+    return contacts
+
+
+def contacts_from_extracted(extracted: ExtractedPage, block_cache: BlockCache | None = None) -> dict[str, list[str]]:
+    if block_cache is not None and extracted.blocks:
+        contacts = _scan_with_blocks(extracted, block_cache)
+    else:
+        combined_text = " ".join(["".join(extracted.text), *extracted.hrefs, *extracted.srcs])
+        contacts = extract_contacts_batch([combined_text])[0]
+        if block_cache is not None:
+            block_cache.count(len(combined_text), 0)
+
+    contacts.emails.update(
+        filter(None, (value.removeprefix("mailto:").split("?")[0].strip() for value in extracted.mailto))
+    )
+    for value in extracted.tel:
+        canonical = normalize_phone(value.removeprefix("tel:").split("?")[0])
+        if canonical:
+            contacts.phones.add(canonical)
 
     return {
-        "emails": list(emails),
-        "phones": list(phones),
+        "emails": list(contacts.emails),
+        "phones": [variant for phone in contacts.phones for variant in phone_variants(phone)],
     }
+
+
+def grab_contacts(page: BeautifulSoup) -> dict[str, list[str]]:
+    return contacts_from_extracted(extract_from_soup(page))
@@ -1,45 +1,26 @@
-from urllib.parse import urlparse, urlunparse
+from posixpath import splitext
+from urllib.parse import urlsplit
 
-from contacts_parser.parser.errors import PermanentParserError
+from contacts_parser.parser.canonical import base_url, canonicalize
 
+# Links with these extensions never lead to an HTML page worth parsing
+ASSET_EXTENSIONS = frozenset(
+    {
+        ".7z", ".avi", ".bmp", ".css", ".csv", ".doc", ".docx", ".eot", ".exe", ".gif", ".gz", ".ico",
+        ".jpeg", ".jpg", ".js", ".json", ".m4a", ".mkv", ".mov", ".mp3", ".mp4", ".ogg", ".otf", ".pdf",
+        ".png", ".ppt", ".pptx", ".rar", ".rss", ".svg", ".tar", ".tif", ".tiff", ".ttf", ".wav", ".webm",
+        ".webp", ".woff", ".woff2", ".xls", ".xlsx", ".xml", ".zip",
+    }
+)  # fmt: skip
 
-def validate_and_normalize_url(url: str) -> str:
-    url = url.strip()
-
-    p = urlparse(url)
-
-    if p.scheme not in ("http", "https"):
-        raise PermanentParserError("URL должен начинаться с http:// или https://")
 
-    if not p.netloc:
-        raise PermanentParserError("URL должен быть абсолютным и содержать домен типа https://example.com")
+def validate_and_normalize_url(url: str) -> str:
+    return canonicalize(url)
 
-    normalized = urlunparse(
-        (
-            p.scheme,
-            p.netloc.replace("www.", "", 1) if p.netloc.startswith("www.") else p.netloc,
-            p.path or "/",
-            p.params,
-            p.query,
-            "",
-        )
-    )
 
-    return normalized
+def parse_base_url(url: str) -> str:
+    return base_url(url)
 
 
-def parse_base_url(url: str) -> str:
-    normilized_p = urlparse(validate_and_normalize_url(url))
-
-    base_url = urlunparse(
-        (
-            normilized_p.scheme,
-            normilized_p.netloc,
-            "/",
-            "",
-            "",
-            "",
-        )
-    )
-
-    return base_url
+def is_asset_url(url: str) -> bool:
+    return splitext(urlsplit(url).path)[1].lower() in ASSET_EXTENSIONS
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Protocol
+
+from contacts_parser.core.config import settings
+
+
+def fingerprint(url: str) -> bytes:
+    return hashlib.blake2b(url.encode(), digest_size=16).digest()
+
+
+class VisitedSet(Protocol):
+    def add(self, url: str) -> None: ...
+
+    def add_fingerprint(self, digest: bytes) -> None: ...
+
+    def __contains__(self, url: object) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+
+class FingerprintSet:
+    """Exact visited set keeping a 64-bit hash per URL instead of the URL string"""
+
+    def __init__(self) -> None:
+        self._hashes: set[int] = set()
+
+    def add(self, url: str) -> None:
+        self.add_fingerprint(fingerprint(url))
+
+    def add_fingerprint(self, digest: bytes) -> None:
+        self._hashes.add(int.from_bytes(digest[:8], "little"))
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and int.from_bytes(fingerprint(url)[:8], "little") in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic visited set.
+
+    Never reports a seen URL as new; a new URL is reported as seen (and
+    skipped) with probability about `error_rate` while under `capacity`.
+    """
+
+    def __init__(self, capacity: int | None = None, error_rate: float | None = None) -> None:
+        capacity = capacity or settings.crawler_bloom_capacity
+        error_rate = error_rate or settings.crawler_bloom_error_rate
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, digest: bytes) -> list[int]:
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, url: str) -> None:
+        self.add_fingerprint(fingerprint(url))
+
+    def add_fingerprint(self, digest: bytes) -> None:
+        for pos in self._positions(digest):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def __contains__(self, url: object) -> bool:
+        if not isinstance(url, str):
+            return False
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint(url)))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def make_visited_set(kind: str | None = None) -> VisitedSet:
+    kind = kind or settings.crawler_visited_set
+    if kind == "bloom":
+        return BloomFilter()
+    return FingerprintSet()
@@ -0,0 +1,39 @@
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
+import pytest
+
+
+class _TricklingHandler(BaseHTTPRequestHandler):
+    """2 KB page sent 100 bytes every 0.5 s"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", "2000")
+        self.end_headers()
+        try:
+            for _ in range(20):
+                self.wfile.write(b"x" * 100)
+                self.wfile.flush()
+                sleep(0.5)
+        except OSError:
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def trickling_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TricklingHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
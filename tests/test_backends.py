@@ -0,0 +1,49 @@
+import pytest
+
+from contacts_parser.parser.backends import available_backends, get_backend
+from contacts_parser.parser.utils import contacts_from_extracted
+
+BACKENDS = ["bs4", "bs4-lxml", "lxml", "selectolax"]
+
+FIXTURES = {
+    "contacts": (
+        "<html><head><title>Контакты</title><style>.tel{color:red}</style></head><body>"
+        "<p>Телефон: +7 (495) 123-45-67, 8 800 555-35-35</p>"
+        '<a href="mailto:sales@example.com?subject=hi">Почта</a>'
+        '<a href="tel:+79991234567">Позвонить</a>'
+        '<img src="https://example.com/logo@2x.png">'
+        "<script>var fake = 'noreply@script.example';</script>"
+        "</body></html>"
+    ),
+    "links": (
+        '<ul><li><a href="https://example.com/kontakty">Контакты <b>и реквизиты</b></a></li>'
+        '<li><a href="https://example.com/about">О&nbsp;компании</a> info@example.com</li></ul>'
+        "<!-- hidden@comment.example --><template><p>+7 111 222-33-44</p></template>"
+    ),
+    "broken": "<div><p>Почта: <b>office@example.ru<td>+7 912 000 11 22",
+    "cp1251": '<meta charset="windows-1251"><p>Контакты: mail@example.ru</p>',
+}
+
+
+def _contacts(backend: str, markup: str) -> tuple:
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    encoding = "cp1251" if "windows-1251" in markup else "utf-8"
+    extracted = get_backend(backend).extract(markup.encode(encoding))
+    contacts = contacts_from_extracted(extracted)
+    return (
+        sorted(contacts["emails"]),
+        sorted(contacts["phones"]),
+        sorted(set(extracted.hrefs)),
+        sorted(extracted.anchors),
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS[1:])
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_backends_extract_identical_contacts(backend: str, fixture: str) -> None:
+    assert _contacts(backend, FIXTURES[fixture]) == _contacts("bs4", FIXTURES[fixture])
+
+
+def test_auto_picks_fastest_installed_backend() -> None:
+    assert get_backend("auto").name == available_backends()[0]
@@ -0,0 +1,69 @@
+from threading import Lock
+from time import sleep
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from contacts_parser.api.main import app
+from contacts_parser.core.config import settings
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.batch import BatchCrawler
+
+PAGES = {
+    "https://one.example/": b'<a href="mailto:info@one.example">Mail</a>',
+    "https://two.example/": b"Call us: +7 (999) 123-45-67",
+}
+
+
+def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+    return SimpleNamespace(status_code=200, content=PAGES[url], headers={})
+
+
+def test_batch_crawler_yields_result_per_site(monkeypatch) -> None:
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+
+    items = list(
+        BatchCrawler(["https://one.example/", "https://www.one.example/dup", "not-a-url", "https://two.example/"]).run()
+    )
+
+    by_url = {item.url: item for item in items}
+    assert len(items) == 3
+    assert by_url["https://one.example/"].result.emails == ["info@one.example"]
+    assert "+79991234567" in by_url["https://two.example/"].result.phones
+    assert by_url["not-a-url"].result is None
+    assert by_url["not-a-url"].error
+
+
+def test_batch_caps_fetches_under_the_async_engine(monkeypatch) -> None:
+    in_flight = peak = 0
+    lock = Lock()
+
+    def slow_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        sleep(0.02)
+        with lock:
+            in_flight -= 1
+        links = "".join(f'<a href="{url.rstrip("/")}/page{n}">p</a>' for n in range(4)) if url.endswith("/") else ""
+        return SimpleNamespace(status_code=200, content=links.encode(), headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", slow_request_data)
+    monkeypatch.setattr(settings, "crawler_engine", "async")
+
+    items = list(BatchCrawler(["https://one.example/", "https://two.example/"], max_workers=2).run())
+
+    assert [item.result.pages_parsed for item in items] == [5, 5]
+    assert peak <= 2
+
+
+def test_parse_batch_streams_ndjson(monkeypatch) -> None:
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+    client = TestClient(app)
+
+    response = client.post("/parse/batch", json={"urls": ["https://one.example/", "https://two.example/"]})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(response.text.strip().splitlines()) == 2
@@ -0,0 +1,46 @@
+import pytest
+
+from contacts_parser.parser.backends import _build, available_backends
+from contacts_parser.parser.boilerplate import BlockCache
+from contacts_parser.parser.extractor import extract_from_html
+from contacts_parser.parser.utils import contacts_from_extracted
+
+_PAGE = """
+<html><body>
+    <header><p>Call us: +7 999 123-45-67</p></header>
+    <div class="main-menu"><a href="/about">About</a></div>
+    <main><p>{body}</p></main>
+    <footer><p>office@example.com</p></footer>
+</body></html>
+"""
+
+
+def _blocks(extracted) -> list[str]:
+    return ["".join(extracted.text[start:end]).strip() for start, end in extracted.blocks]
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_mark_boilerplate_blocks(backend: str) -> None:
+    extracted = _build(backend).extract(_PAGE.format(body="Welcome").encode())
+
+    assert _blocks(extracted) == ["Call us: +7 999 123-45-67", "About", "office@example.com"]
+
+
+def test_repeated_blocks_are_scanned_once() -> None:
+    cache = BlockCache()
+    first = contacts_from_extracted(extract_from_html(_PAGE.format(body="sales@example.com")), cache)
+    scanned = cache.scanned_chars
+    second = contacts_from_extracted(extract_from_html(_PAGE.format(body="hr@example.com")), cache)
+
+    assert set(first["emails"]) == {"sales@example.com", "office@example.com"}
+    assert set(second["emails"]) == {"hr@example.com", "office@example.com"}
+    assert "+79991234567" in second["phones"]
+    assert len(cache) == 3
+    assert cache.skipped_chars > 0
+    assert cache.scanned_chars - scanned < scanned
+
+
+def test_text_around_a_block_does_not_join_into_a_match() -> None:
+    extracted = extract_from_html("<p>999 123</p><nav>menu</nav><p>45 67</p>")
+
+    assert contacts_from_extracted(extracted, BlockCache())["phones"] == []
@@ -0,0 +1,66 @@
+import sqlite3
+from types import SimpleNamespace
+
+from contacts_parser.infra.cache import ResponseCache
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.parser import Parser
+
+
+def test_response_cache_stores_validators_and_evicts_lru() -> None:
+    cache = ResponseCache(":memory:", ttl=60, max_bytes=10)
+
+    cache.put("https://example.com/a", 200, b"12345", {"ETag": '"v1"'})
+    cache.get("https://example.com/a")
+    cache.put("https://example.com/b", 200, b"123456", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    assert cache.get("https://example.com/a") is None
+    cached = cache.get("https://example.com/b")
+    assert cached.is_fresh(60)
+    assert cached.conditional_headers() == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+
+def test_parser_revalidates_and_reuses_extraction(monkeypatch) -> None:
+    cache = ResponseCache(":memory:", ttl=0)
+    sent_headers = []
+
+    def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        sent_headers.append(headers)
+        if headers:
+            return SimpleNamespace(status_code=304, content=b"", headers={})
+        return SimpleNamespace(status_code=200, content=b"Mail: info@example.com", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+
+    first = Parser("https://example.com/", cache=cache).run()
+    second = Parser("https://example.com/", cache=cache).run()
+
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+    assert first.cache_stats["misses"] == 1
+    assert second.cache_stats == {"hits": 0, "misses": 0, "revalidated": 1, "extraction_hits": 1}
+    assert second.emails == ["info@example.com"]
+
+
+def test_fresh_hit_decodes_with_the_cached_header_charset(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    # A cache written before the content_type column existed
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE responses (url TEXT PRIMARY KEY, status_code INTEGER NOT NULL, etag TEXT, "
+            "last_modified TEXT, content BLOB NOT NULL, content_hash TEXT NOT NULL, size INTEGER NOT NULL, "
+            "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+    cache = ResponseCache(path, ttl=60)
+    page = "<p>Контакты: info@example.com</p>"
+    cache.put("https://example.com/", 200, page.encode("cp1251"), {"Content-Type": "text/html; charset=windows-1251"})
+    decoded = []
+    decode_html = parser_module.decode_html
+
+    def spy(content: bytes, encoding: str | None = None, host_encoding: str | None = None) -> tuple[str, str | None]:
+        decoded.append(decode_html(content, encoding, host_encoding))
+        return decoded[-1]
+
+    monkeypatch.setattr(parser_module, "decode_html", spy)
+    result = Parser("https://example.com/", cache=cache).run()
+
+    assert result.cache_stats["hits"] == 1
+    assert decoded == [(page, "cp1251")]
@@ -0,0 +1,111 @@
+import asyncio
+from threading import Timer
+from time import monotonic
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from contacts_parser.core.config import settings
+from contacts_parser.infra.cancel import CancelToken
+from contacts_parser.infra.client import request_data, request_data_async
+from contacts_parser.infra.http import get_session
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.errors import CancelledParserError
+from contacts_parser.parser.parser import Parser
+
+
+def _endless_site(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+    # Every page is slow and links to two more, so only the deadline ends the crawl
+    cancel.sleep(0.05)
+    page = int(url.rsplit("/", 1)[-1] or 0)
+    links = "".join(f'<a href="https://example.com/{page * 2 + n}">next</a>' for n in (1, 2))
+    return SimpleNamespace(status_code=200, content=f"{links} Mail: info@example.com".encode(), headers={})
+
+
+def test_deadline_returns_truncated_partial_result(monkeypatch) -> None:
+    monkeypatch.setattr(parser_module, "request_data", _endless_site)
+
+    started = monotonic()
+    result = Parser("https://example.com/", max_workers=4, deadline_seconds=0.3).run()
+
+    assert result.truncated
+    assert result.emails == ["info@example.com"]
+    assert monotonic() - started < 1.0
+    assert result.state is None
+
+
+def test_cancel_interrupts_in_flight_requests(monkeypatch) -> None:
+    def slow_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> None:
+        cancel.sleep(30)
+
+    monkeypatch.setattr(parser_module, "request_data", slow_request_data)
+    parser = Parser("https://example.com/")
+    Timer(0.1, parser.cancel).start()
+
+    started = monotonic()
+    result = parser.run()
+
+    assert result.truncated
+    assert result.pages_parsed == 0
+    assert monotonic() - started < 1.0
+
+
+@pytest.mark.parametrize("engine", ["threads", "async"])
+def test_max_pages_stops_slow_in_flight_fetches(monkeypatch, engine: str) -> None:
+    def site(url: str, cancel: CancelToken) -> SimpleNamespace:
+        if url.endswith("/slow"):
+            cancel.sleep(30)
+        links = {
+            "https://example.com/": ["https://example.com/fast", "https://example.com/slow"],
+            "https://example.com/fast": ["https://example.com/next"],
+        }.get(url, [])
+        body = "".join(f'<a href="{link}">x</a>' for link in links)
+        return SimpleNamespace(status_code=200, content=body.encode(), headers={})
+
+    async def site_async(client, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        if url.endswith("/slow"):
+            await cancel.asleep(30)
+        return site(url.replace("/slow", "/slow-done"), cancel)
+
+    def site_sync(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        return site(url, cancel)
+
+    monkeypatch.setattr(parser_module, "request_data", site_sync)
+    monkeypatch.setattr(parser_module, "request_data_async", site_async)
+    monkeypatch.setattr(settings, "max_pages_deep", 2)
+    monkeypatch.setattr(settings, "crawler_engine", engine)
+
+    started = monotonic()
+    result = Parser("https://example.com/").run()
+
+    assert result.pages_parsed == 2
+    assert monotonic() - started < 1.0
+
+
+def test_request_data_async_aborts_body_read_when_cancelled() -> None:
+    cancel = CancelToken()
+
+    async def body():
+        yield b"<p>first chunk</p>"
+        cancel.cancel()
+        yield b"<p>never read</p>"
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await request_data_async(client, "https://example.com/", 1.0, cancel=cancel)
+
+    with pytest.raises(CancelledParserError, match="cancelled"):
+        asyncio.run(fetch())
+
+
+def test_cancel_deadline_stops_trickled_body(trickling_url: str) -> None:
+    cancel = CancelToken(deadline_seconds=0.5)
+
+    started = monotonic()
+    with pytest.raises(CancelledParserError):
+        request_data(get_session(), trickling_url, 5.0, cancel=cancel)
+
+    assert monotonic() - started < 1.2
@@ -0,0 +1,26 @@
+import pytest
+
+from contacts_parser.parser.canonical import base_url, canonicalize
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/contacts",
+        "HTTPS://WWW.Example.com:443/contacts/",
+        "https://example.com/contacts#phones",
+        "https://example.com/contacts?utm_source=mail&utm_medium=email",
+        "https://example.com/contacts/?fbclid=abc",
+    ],
+)
+def test_canonicalize_collapses_trivial_variants(url: str) -> None:
+    assert canonicalize(url) == "https://example.com/contacts"
+
+
+def test_canonicalize_keeps_meaningful_parts() -> None:
+    assert canonicalize("http://example.com:8080/?page=2&utm_campaign=x") == "http://example.com:8080/?page=2"
+    assert canonicalize("http://example.com") == "http://example.com/"
+
+
+def test_base_url() -> None:
+    assert base_url("https://www.example.com:443/a/b?c=d") == "https://example.com/"
@@ -0,0 +1,47 @@
+from contacts_parser.parser.charset import HostCharsets, declared_encoding, decode_html
+
+_CYRILLIC = "Контакты: info@example.ru"
+
+
+def test_declared_encoding_prefers_header_then_meta() -> None:
+    body = b'<html><head><meta charset="windows-1251"></head><body>x</body></html>'
+
+    assert declared_encoding(body, "text/html; charset=UTF-8") == "utf-8"
+    assert declared_encoding(body, "text/html") == "cp1251"
+    assert declared_encoding(b"<p>x</p>", "text/html; charset=bogus") is None
+    assert declared_encoding(b"\xef\xbb\xbf<p>x</p>") == "utf-8-sig"
+
+
+def test_decode_html_falls_back_when_the_declared_charset_fails() -> None:
+    content = f"<p>{_CYRILLIC}</p>".encode("utf-8")
+
+    assert decode_html(content, "utf-8") == (f"<p>{_CYRILLIC}</p>", "utf-8")
+    text, encoding = decode_html(content, "ascii")
+    assert _CYRILLIC in text
+    assert encoding == "utf-8"
+
+
+def test_host_encoding_is_reused_for_pages_that_declare_none() -> None:
+    charsets = HostCharsets()
+    charsets.remember("https://a.example/", "windows-1251")
+    host_encoding = charsets.get("https://a.example/contacts")
+
+    assert host_encoding == "cp1251"
+    assert charsets.get("https://b.example/") is None
+    cp1251_page = f"<p>{_CYRILLIC}</p>".encode("cp1251")
+    assert decode_html(cp1251_page, None, host_encoding) == (f"<p>{_CYRILLIC}</p>", "cp1251")
+    # An undeclared UTF-8 page on the same host is not decoded as cp1251
+    utf8_page = f"<p>{_CYRILLIC}</p>".encode("utf-8")
+    assert decode_html(utf8_page, None, host_encoding) == (f"<p>{_CYRILLIC}</p>", "utf-8")
+
+
+def test_host_charsets_drop_least_recently_used_hosts() -> None:
+    charsets = HostCharsets(max_hosts=2)
+    charsets.remember("https://a.example/", "cp1251")
+    charsets.remember("https://b.example/", "koi8-r")
+    charsets.get("https://a.example/")
+    charsets.remember("https://c.example/", "utf-8")
+
+    assert len(charsets) == 2
+    assert charsets.get("https://b.example/") is None
+    assert charsets.get("https://a.example/") == "cp1251"
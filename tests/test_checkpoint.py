@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from contacts_parser.infra.checkpoint import Checkpoint
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.parser import Parser
+
+PAGES = {
+    "https://example.com/": b'<a href="https://example.com/a">A</a> <a href="https://example.com/b">B</a>',
+    "https://example.com/a": b"Mail: a@example.com",
+    "https://example.com/b": b"Mail: b@example.com",
+}
+
+
+def test_checkpoint_batches_writes_until_due() -> None:
+    checkpoint = Checkpoint(":memory:", interval=3600, batch_pages=2)
+    checkpoint.start("https://example.com/")
+
+    checkpoint.add_page("https://example.com/", {"record": {}, "emails": [], "phones": []})
+    assert not checkpoint.due()
+    checkpoint.add_page("https://example.com/a", {"record": {}, "emails": [], "phones": []})
+    assert checkpoint.due()
+
+    checkpoint.save([("https://example.com/b", 1)])
+    data = checkpoint.load()
+    assert set(data.pages) == {"https://example.com/", "https://example.com/a"}
+    assert data.frontier == [("https://example.com/b", 1)]
+
+
+def test_resume_continues_without_refetching_finished_pages(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "crawl.sqlite3"
+    fetched = []
+
+    def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None):
+        fetched.append(url)
+        return SimpleNamespace(status_code=200, content=PAGES[url], headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+    monkeypatch.setattr(parser_module.settings, "max_pages_deep", 2)
+    first = Parser("https://example.com/", max_workers=1, checkpoint=Checkpoint(path)).run()
+
+    monkeypatch.setattr(parser_module.settings, "max_pages_deep", 10)
+    fetched.clear()
+    resumed = Parser.resume(path).run()
+
+    assert first.pages_parsed == 2
+    assert len(fetched) == 1 and fetched[0] not in {page.url for page in first.pages}
+    assert resumed.pages_parsed == 3
+    assert sorted(resumed.emails) == ["a@example.com", "b@example.com"]
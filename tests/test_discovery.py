@@ -0,0 +1,115 @@
+import gzip
+import io
+
+import pytest
+import requests
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.discovery import fetch_robots, iter_sitemap_entries, iter_sitemap_urls
+from contacts_parser.parser.parser import Parser
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url><loc>https://example.com/contacts</loc></url>
+    <url><loc> https://example.com/about </loc></url>
+</urlset>"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <sitemap><loc>https://example.com/sitemap-pages.xml.gz</loc></sitemap>
+</sitemapindex>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: bytes) -> None:
+        self.status_code = status_code
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class FakeSession:
+    """Serves `bodies`; an int stands for a bare status code, an exception is raised"""
+
+    def __init__(self, bodies: dict[str, bytes | int | Exception]) -> None:
+        self._bodies = bodies
+
+    def get(self, url: str, timeout: float, stream: bool) -> FakeResponse:
+        body = self._bodies.get(url, 404)
+        if isinstance(body, Exception):
+            raise body
+        if isinstance(body, int):
+            return FakeResponse(body, b"")
+        return FakeResponse(200, body)
+
+
+def test_iter_sitemap_entries_streams_plain_and_gzipped_sitemaps() -> None:
+    expected = [("url", "https://example.com/contacts"), ("url", "https://example.com/about")]
+
+    assert list(iter_sitemap_entries(io.BytesIO(URLSET))) == expected
+    assert list(iter_sitemap_entries(io.BytesIO(gzip.compress(URLSET)))) == expected
+
+
+def test_iter_sitemap_urls_follows_indexes() -> None:
+    session = FakeSession(
+        {
+            "https://example.com/sitemap.xml": INDEX,
+            "https://example.com/sitemap-pages.xml.gz": gzip.compress(URLSET),
+        }
+    )
+
+    urls = list(iter_sitemap_urls(session, ["https://example.com/sitemap.xml"], timeout=1.0))
+
+    assert urls == ["https://example.com/contacts", "https://example.com/about"]
+
+
+def test_fetch_robots_reads_rules_delay_and_sitemaps() -> None:
+    session = FakeSession(
+        {
+            "https://example.com/robots.txt": (
+                b"User-agent: *\nDisallow: /private/\nCrawl-delay: 2\nSitemap: https://example.com/sitemap.xml\n"
+            )
+        }
+    )
+
+    robots = fetch_robots(session, "https://example.com/", timeout=1.0)
+
+    assert not robots.can_fetch("contacts-parser/0.1", "https://example.com/private/page")
+    assert robots.can_fetch("contacts-parser/0.1", "https://example.com/contacts")
+    assert robots.crawl_delay("contacts-parser/0.1") == 2
+    assert robots.site_maps() == ["https://example.com/sitemap.xml"]
+    assert fetch_robots(FakeSession({}), "https://example.com/", timeout=1.0) is None
+
+
+def test_fetch_robots_allows_all_when_missing() -> None:
+    assert fetch_robots(FakeSession({"https://example.com/robots.txt": 403}), "https://example.com/", 1.0) is None
+
+
+@pytest.mark.parametrize("failure", [503, 429, requests.ConnectionError("connection refused")])
+def test_fetch_robots_disallows_all_when_unreachable(failure) -> None:
+    robots = fetch_robots(FakeSession({"https://example.com/robots.txt": failure}), "https://example.com/", 1.0)
+
+    assert not robots.can_fetch("contacts-parser/0.1", "https://example.com/")
+    assert not robots.can_fetch("contacts-parser/0.1", "https://example.com/contacts")
+    assert robots.crawl_delay("contacts-parser/0.1") is None
+    assert robots.site_maps() is None
+
+
+def test_sitemap_www_urls_seed_the_canonical_site(monkeypatch) -> None:
+    sitemap = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <url><loc>https://www.Example.com/contacts</loc></url>
+        <url><loc>https://other.example/page</loc></url>
+    </urlset>"""
+    monkeypatch.setattr(settings, "crawler_robots_enabled", False)
+    monkeypatch.setattr(settings, "crawler_sitemaps_enabled", True)
+    monkeypatch.setattr(parser_module, "get_session", lambda: FakeSession({"https://example.com/sitemap.xml": sitemap}))
+
+    parser = Parser("https://www.example.com/")
+    parser.discover_frontier()
+
+    assert parser._discovered == ["https://example.com/contacts"]
@@ -0,0 +1,36 @@
+from contacts_parser.parser.frontier import FifoFrontier, PriorityFrontier, make_frontier
+
+
+def test_priority_frontier_pops_contact_pages_first() -> None:
+    frontier = PriorityFrontier()
+    frontier.push("https://example.com/catalog", depth=1)
+    frontier.push("https://example.com/news", depth=1)
+    frontier.push("https://example.com/kontakty", depth=1)
+    frontier.push("https://example.com/page-42", depth=1, anchor_score=6.0)
+
+    order = [frontier.pop().url for _ in range(len(frontier))]
+
+    assert order == [
+        "https://example.com/kontakty",
+        "https://example.com/page-42",
+        "https://example.com/catalog",
+        "https://example.com/news",
+    ]
+
+
+def test_priority_frontier_prefers_shallow_pages() -> None:
+    frontier = PriorityFrontier()
+    frontier.push("https://example.com/deep", depth=3)
+    frontier.push("https://example.com/shallow", depth=1)
+
+    assert [entry.url for entry in frontier] == ["https://example.com/shallow", "https://example.com/deep"]
+    assert frontier.pop().depth == 1
+
+
+def test_fifo_frontier_keeps_discovery_order() -> None:
+    frontier = make_frontier("fifo")
+    frontier.push("https://example.com/news")
+    frontier.push("https://example.com/contacts")
+
+    assert isinstance(frontier, FifoFrontier)
+    assert [frontier.pop().url, frontier.pop().url] == ["https://example.com/news", "https://example.com/contacts"]
@@ -1,8 +1,112 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import monotonic
+
+import httpx
+import pytest
+
 from contacts_parser.core.config import settings
-from contacts_parser.infra.http import get_session
+from contacts_parser.infra.client import request_data, request_data_async
+from contacts_parser.infra.http import connection_stats, get_adapter, get_session
+from contacts_parser.parser.errors import NoContentParserError, PermanentParserError, TransientParserError
 
 
 def test_get_session_sets_user_agent() -> None:
     session = get_session()
 
     assert session.headers["User-Agent"] == settings.http_user_agent
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"<p>ok</p>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def test_thread_sessions_share_kept_alive_connections() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    before = connection_stats()["threads"]
+
+    try:
+        request_data(get_session(), url, 1.0)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(get_session).result()
+            executor.submit(request_data, other, url, 1.0).result()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    after = connection_stats()["threads"]
+    assert other is not get_session()
+    assert other.get_adapter(url) is get_adapter()
+    assert after["requests"] - before["requests"] == 2
+    assert after["connections"] - before["connections"] == 1
+
+
+@pytest.mark.parametrize(
+    ("status", "error"),
+    [(404, NoContentParserError), (503, TransientParserError), (400, PermanentParserError)],
+)
+def test_request_data_async_maps_status_codes(status: int, error: type[Exception]) -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(status))
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await request_data_async(client, "https://example.com/", 1.0)
+
+    with pytest.raises(error):
+        asyncio.run(fetch())
+
+
+def _fetch(transport: httpx.MockTransport) -> None:
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await request_data_async(client, "https://example.com/", 1.0)
+
+    asyncio.run(fetch())
+
+
+def test_request_data_async_rejects_non_html_content_type() -> None:
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=b"%PDF")
+    )
+
+    with pytest.raises(NoContentParserError, match="content type"):
+        _fetch(transport)
+
+
+def test_request_data_async_caps_body_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "http_max_body_bytes", 10)
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"Content-Type": "text/html"}, content=b"<p>" + b"x" * 100)
+    )
+
+    with pytest.raises(NoContentParserError, match="Body"):
+        _fetch(transport)
+
+
+def test_read_deadline_stops_trickled_body(monkeypatch: pytest.MonkeyPatch, trickling_url: str) -> None:
+    monkeypatch.setattr(settings, "http_read_deadline_seconds", 1.0)
+
+    async def fetch_async() -> None:
+        async with httpx.AsyncClient() as client:
+            await request_data_async(client, trickling_url, 5.0)
+
+    for fetch in (lambda: request_data(get_session(), trickling_url, 5.0), lambda: asyncio.run(fetch_async())):
+        started = monotonic()
+        with pytest.raises(TransientParserError, match="deadline"):
+            fetch()
+        assert monotonic() - started < 2.0
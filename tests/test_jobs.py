@@ -0,0 +1,81 @@
+from threading import Event
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from contacts_parser.api import main as main_module
+from contacts_parser.api.jobs import JobManager, JobQueueFullError
+from contacts_parser.api.main import app
+from contacts_parser.parser import parser as parser_module
+
+
+def test_job_streams_contacts_and_finishes(monkeypatch) -> None:
+    monkeypatch.setattr(
+        parser_module,
+        "request_data",
+        lambda session, url, timeout, headers=None, metrics=None, cancel=None: SimpleNamespace(
+            status_code=200, content=b"Mail: info@example.com", headers={}
+        ),
+    )
+    manager = JobManager(max_workers=1, max_queue=0)
+
+    job = manager.submit("https://example.com/")
+    events = list(manager.stream(job.id, poll_seconds=0.05))
+
+    assert {"type": "email", "value": "info@example.com", "page": "https://example.com/"} in events
+    assert events[-1]["status"] == "finished"
+    assert manager.get(job.id).pages_parsed == 1
+    assert manager.get(job.id).emails == ["info@example.com"]
+
+
+def test_job_manager_rejects_when_queue_is_full(monkeypatch) -> None:
+    release = Event()
+
+    def blocking_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        release.wait(5)
+        return SimpleNamespace(status_code=200, content=b"", headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", blocking_request_data)
+    manager = JobManager(max_workers=1, max_queue=1)
+
+    manager.submit("https://one.example/")
+    manager.submit("https://two.example/")
+    with pytest.raises(JobQueueFullError):
+        manager.submit("https://three.example/")
+
+    release.set()
+    # Jobs still running must finish while the fake fetch is installed
+    manager.shutdown(wait=True)
+
+
+def test_get_unknown_job_returns_404() -> None:
+    client = TestClient(app)
+
+    assert client.get("/jobs/missing").status_code == 404
+    assert client.get("/jobs/missing/stream").status_code == 404
+
+
+def test_job_honours_deadline_seconds(monkeypatch) -> None:
+    def slow_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> None:
+        cancel.sleep(30)
+
+    monkeypatch.setattr(parser_module, "request_data", slow_request_data)
+    manager = JobManager(max_workers=1, max_queue=0)
+
+    job = manager.submit("https://example.com/", deadline_seconds=0.1)
+    events = list(manager.stream(job.id, poll_seconds=0.05))
+
+    assert events[-1]["status"] == "finished"
+    assert events[-1]["truncated"] is True
+    assert manager.get(job.id).truncated
+
+
+def test_app_shutdown_drops_queued_jobs(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(main_module, "jobs", SimpleNamespace(shutdown=lambda wait: calls.append(wait)))
+
+    with TestClient(app):
+        assert calls == []
+
+    assert calls == [False]
@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from contacts_parser.api.main import app
+from contacts_parser.infra.client import request_data_async
+from contacts_parser.infra.metrics import CrawlMetrics, MetricsRegistry
+
+
+def test_request_data_async_records_status_bytes_and_stages() -> None:
+    metrics = CrawlMetrics()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"Content-Type": "text/html"}, content=b"<p>hello</p>")
+    )
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await request_data_async(client, "https://metrics.example/", 1.0, metrics=metrics)
+
+    asyncio.run(fetch())
+
+    snapshot = metrics.as_dict()
+    assert snapshot["status_codes"] == {"200": 1}
+    assert snapshot["bytes_downloaded"] == len(b"<p>hello</p>")
+    assert snapshot["stages"]["connect"]["calls"] == 1
+    assert snapshot["stages"]["download"]["calls"] == 1
+
+
+def test_registry_renders_prometheus_totals() -> None:
+    metrics = CrawlMetrics()
+    metrics.observe("parse", 0.25)
+    metrics.record_status(404)
+    metrics.record_retry()
+    registry = MetricsRegistry()
+    registry.merge(metrics, pages=3)
+    registry.merge(metrics, pages=2)
+
+    text = registry.render()
+
+    assert "contacts_parser_crawls_total 2" in text
+    assert "contacts_parser_pages_total 5" in text
+    assert 'contacts_parser_stage_seconds_total{stage="parse"} 0.5' in text
+    assert 'contacts_parser_responses_total{status="404"} 2' in text
+    assert "contacts_parser_retries_total 2" in text
+
+
+def test_metrics_endpoint() -> None:
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert "# TYPE contacts_parser_crawls_total counter" in response.text
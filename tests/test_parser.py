@@ -1,5 +1,16 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
 from bs4 import BeautifulSoup
 
+from contacts_parser.core.config import settings
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.backends import HtmlBackend
+from contacts_parser.parser.errors import NoContentParserError
+from contacts_parser.parser.extractor import ExtractedPage
+from contacts_parser.parser.models import CrawlState, ParserResult
 from contacts_parser.parser.parser import Parser
 
 
@@ -15,11 +26,139 @@ def test_find_all_links_filters_and_normalizes_links() -> None:
         </body>
     </html>
     """
-    parser._pages[parser._init_url] = BeautifulSoup(html, "html.parser")
-
-    links = parser.find_all_links(parser._init_url)
+    links = parser.find_all_links(BeautifulSoup(html, "html.parser"))
 
     assert set(links) == {
         "https://example.com/about",
         "https://example.com/contact?ref=nav",
     }
+
+
+def test_arun_crawls_same_site_pages() -> None:
+    pages = {
+        "/": '<a href="https://example.com/contacts">Contacts</a>',
+        "/contacts": '<a href="mailto:info@example.com">Mail</a> +7 (999) 123-45-67',
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path not in pages:
+            return httpx.Response(404)
+        return httpx.Response(200, text=pages[request.url.path])
+
+    parser = Parser("https://example.com/")
+
+    async def crawl() -> ParserResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await parser.arun(client)
+
+    result = asyncio.run(crawl())
+
+    assert result.pages_parsed == 2
+    assert {page.url for page in result.pages} == {"https://example.com/", "https://example.com/contacts"}
+    assert parser.get_pages() == {}
+    assert result.emails == ["info@example.com"]
+    assert "+79991234567" in result.phones
+
+
+def test_arun_honours_max_workers() -> None:
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        links = "".join(f'<a href="https://example.com/p{n}">p</a>' for n in range(6))
+        return httpx.Response(200, text=links if request.url.path == "/" else "")
+
+    async def crawl() -> ParserResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await Parser("https://example.com/", max_workers=2).arun(client)
+
+    assert asyncio.run(crawl()).pages_parsed == 7
+    assert peak == 2
+
+
+def test_arun_keeps_the_event_loop_responsive_while_parsing() -> None:
+    def slow_extract(content: bytes | str) -> ExtractedPage:
+        time.sleep(0.3)
+        return ExtractedPage(text=["Mail: info@example.com"])
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="<p>page</p>"))
+    parser = Parser("https://example.com/")
+    parser._backend = HtmlBackend("slow", slow_extract)
+    gaps: list[float] = []
+
+    async def tick() -> None:
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(0.01)
+            gaps.append(time.monotonic() - last)
+            last = time.monotonic()
+
+    async def crawl() -> ParserResult:
+        ticker = asyncio.create_task(tick())
+        try:
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await parser.arun(client)
+        finally:
+            ticker.cancel()
+
+    result = asyncio.run(crawl())
+
+    assert result.emails == ["info@example.com"]
+    assert max(gaps) < 0.15
+
+
+def test_incremental_run_reuses_unchanged_pages_and_reports_diff(monkeypatch) -> None:
+    pages = {
+        "https://example.com/": b'<a href="https://example.com/contacts">Contacts</a> old@example.com',
+        "https://example.com/contacts": b"Mail: info@example.com",
+    }
+    monkeypatch.setattr(
+        parser_module,
+        "request_data",
+        lambda session, url, timeout, headers=None, metrics=None, cancel=None: SimpleNamespace(
+            status_code=200, content=pages[url], headers={}
+        ),
+    )
+    first = Parser("https://example.com/", prior_state=CrawlState()).run()
+
+    pages["https://example.com/"] = b'<a href="https://example.com/contacts">Contacts</a> new@example.com'
+    second = Parser("https://example.com/", prior_state=CrawlState.from_dict(first.state.to_dict())).run()
+
+    unchanged = {page.url: page.unchanged for page in second.pages}
+    assert unchanged == {"https://example.com/": False, "https://example.com/contacts": True}
+    assert second.diff.emails_added == ["new@example.com"]
+    assert second.diff.emails_removed == ["old@example.com"]
+
+
+def test_truncated_incremental_run_keeps_unreached_pages(monkeypatch) -> None:
+    pages = {
+        "https://example.com/": b'<a href="https://example.com/contacts">Contacts</a> home@example.com',
+        "https://example.com/contacts": b"Mail: info@example.com",
+    }
+
+    def fake_request_data(session, url, timeout, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        if url not in pages:
+            raise NoContentParserError("HTTP 404")
+        return SimpleNamespace(status_code=200, content=pages[url], headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+    first = Parser("https://example.com/", prior_state=CrawlState()).run()
+
+    monkeypatch.setattr(settings, "max_pages_deep", 1)
+    second = Parser("https://example.com/", prior_state=CrawlState.from_dict(first.state.to_dict())).run()
+
+    assert second.pages_parsed == 1
+    assert second.diff.emails_removed == []
+    assert set(second.state.pages) == {"https://example.com/", "https://example.com/contacts"}
+
+    monkeypatch.setattr(settings, "max_pages_deep", 1000)
+    del pages["https://example.com/contacts"]
+    third = Parser("https://example.com/", prior_state=second.state).run()
+
+    assert third.diff.emails_added == []
+    assert third.diff.emails_removed == ["info@example.com"]
+    assert set(third.state.pages) == {"https://example.com/"}
@@ -0,0 +1,47 @@
+import pytest
+
+from contacts_parser.core.config import settings
+from contacts_parser.infra.politeness import HostScheduler, parse_retry_after
+
+
+def test_reserve_spaces_requests_per_host_only() -> None:
+    scheduler = HostScheduler(min_delay=1.0, max_delay=10.0)
+
+    assert scheduler.reserve("https://example.com/a") == 0
+    assert scheduler.reserve("https://example.com/b") == pytest.approx(1.0, abs=0.05)
+    assert scheduler.reserve("https://other.com/") == 0
+
+
+def test_defer_and_adaptive_delay() -> None:
+    scheduler = HostScheduler(min_delay=0.0, max_delay=5.0)
+
+    scheduler.defer("https://example.com/", 60)
+    assert scheduler.reserve("https://example.com/") == pytest.approx(5.0, abs=0.05)
+
+    scheduler.record_failure("https://other.com/")
+    scheduler.record_failure("https://other.com/")
+    raised = scheduler.delay_for("https://other.com/")
+    scheduler.record_success("https://other.com/")
+
+    assert raised > 0
+    assert scheduler.delay_for("https://other.com/") < raised
+
+
+def test_concurrent_failures_back_off_once_and_recover_queued_slots(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "http_backoff_seconds", 1.0)
+    scheduler = HostScheduler(min_delay=0.0, max_delay=30.0)
+
+    for _ in range(10):
+        scheduler.record_failure("https://example.com/")
+    assert scheduler.delay_for("https://example.com/") == 1.0
+
+    for _ in range(4):
+        scheduler.reserve("https://example.com/")
+    scheduler.record_success("https://example.com/")
+
+    assert scheduler.reserve("https://example.com/") < 2.5
+
+
+@pytest.mark.parametrize(("value", "expected"), [("120", 120.0), (None, None), ("soon", None)])
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    assert parse_retry_after(value) == expected
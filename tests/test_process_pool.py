@@ -0,0 +1,106 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from threading import Timer
+from time import monotonic
+from types import SimpleNamespace
+
+from contacts_parser.core.config import settings
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.parser import Parser
+from contacts_parser.parser.process_pool import get_process_pool, parse_content, shutdown_process_pool
+
+PAGES = {
+    "https://example.com/": (
+        b'<a href="https://example.com/kontakty">\xd0\x9a\xd0\xbe\xd0\xbd\xd1\x82\xd0\xb0\xd0\xba\xd1\x82\xd1\x8b</a>'
+        b'<a href="mailto:info@example.com">Mail</a><img src="/logo.png">'
+    ),
+    "https://example.com/kontakty": b"Call us: +7 (999) 123-45-67",
+}
+
+
+def test_parse_content_returns_compact_result() -> None:
+    parsed = parse_content(PAGES["https://example.com/"], "bs4")
+
+    assert parsed.emails == ["info@example.com"]
+    assert parsed.hrefs == ["https://example.com/kontakty"]
+    assert parsed.anchors == [("https://example.com/kontakty", "Контакты")]
+
+
+def test_parser_offloads_parsing_to_process_pool(monkeypatch) -> None:
+    def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        return SimpleNamespace(status_code=200, content=PAGES[url], headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+    monkeypatch.setattr(settings, "parser_processes", 2)
+    get_process_pool.cache_clear()
+    try:
+        result = Parser("https://example.com/").run()
+    finally:
+        shutdown_process_pool()
+
+    assert result.pages_parsed == 2
+    assert result.emails == ["info@example.com"]
+    assert "+79991234567" in result.phones
+
+
+class StuckPool:
+    """Stands in for a pool whose workers never answer, or that is already broken"""
+
+    def __init__(self, broken: bool = False) -> None:
+        self.broken = broken
+        self.futures: list[Future] = []
+
+    def submit(self, fn, *args) -> Future:
+        if self.broken:
+            raise BrokenProcessPool("A child process terminated abruptly")
+        self.futures.append(Future())
+        return self.futures[-1]
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        pass
+
+
+def _serve_pages(monkeypatch) -> None:
+    def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        return SimpleNamespace(status_code=200, content=PAGES[url], headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+    monkeypatch.setattr(settings, "parser_processes", 2)
+
+
+def test_parse_content_skips_blocks_seen_in_the_worker() -> None:
+    page = b"<main>Page %d</main><footer>Mail: footer@example.com, call +7 (999) 123-45-67</footer>"
+
+    first = parse_content(page % 1, "bs4", skip_known_blocks=True)
+    second = parse_content(page % 2, "bs4", skip_known_blocks=True)
+
+    assert second.emails == first.emails == ["footer@example.com"]
+    assert second.phones == first.phones
+    assert second.skipped_chars > 0
+    assert second.scanned_chars < first.scanned_chars
+
+
+def test_broken_pool_falls_back_to_inline_parsing(monkeypatch) -> None:
+    _serve_pages(monkeypatch)
+    monkeypatch.setattr(parser_module, "get_process_pool", lambda: StuckPool(broken=True))
+
+    result = Parser("https://example.com/").run()
+
+    assert result.pages_parsed == 2
+    assert result.emails == ["info@example.com"]
+    assert "+79991234567" in result.phones
+
+
+def test_cancel_stops_waiting_on_a_parse_worker(monkeypatch) -> None:
+    _serve_pages(monkeypatch)
+    pool = StuckPool()
+    monkeypatch.setattr(parser_module, "get_process_pool", lambda: pool)
+    parser = Parser("https://example.com/")
+    Timer(0.1, parser.cancel).start()
+
+    started = monotonic()
+    result = parser.run()
+
+    assert result.truncated
+    assert monotonic() - started < 1.0
+    assert all(future.cancelled() for future in pool.futures)
@@ -0,0 +1,65 @@
+from threading import Thread
+from types import SimpleNamespace
+
+from contacts_parser.infra.queue import SqliteTaskQueue
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.distributed import CrawlWorker, enqueue_seeds
+
+
+def test_enqueue_seeds_dedups_domains() -> None:
+    queue = SqliteTaskQueue(":memory:")
+
+    added = enqueue_seeds(queue, ["https://a.example/", "https://a.example/contacts", "", "https://b.example/"])
+
+    assert added == 2
+    assert enqueue_seeds(queue, ["https://b.example/about"]) == 0
+    assert queue.counts()["queued"] == 2
+
+
+def test_expired_lease_moves_to_another_worker() -> None:
+    queue = SqliteTaskQueue(":memory:", max_attempts=2)
+    queue.put("https://a.example", "https://a.example/")
+
+    first = queue.lease("worker-1", visibility=-1)
+    second = queue.lease("worker-2", visibility=60)
+
+    assert second.id == first.id and second.attempts == 2
+    assert not queue.complete(first, "worker-1", {"emails": []})
+    assert queue.complete(second, "worker-2", {"emails": ["a@a.example"]})
+    assert [task.result for task in queue.finished()] == [{"emails": ["a@a.example"]}]
+
+
+def test_lease_gives_up_after_max_attempts() -> None:
+    queue = SqliteTaskQueue(":memory:", max_attempts=1)
+    queue.put("https://a.example", "https://a.example/")
+
+    assert queue.lease("worker-1", visibility=-1) is not None
+    assert queue.lease("worker-2") is None
+    assert queue.counts()["failed"] == 1
+
+
+def test_workers_crawl_each_domain_once(monkeypatch, tmp_path) -> None:
+    crawled = []
+
+    def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None):
+        crawled.append(url)
+        return SimpleNamespace(status_code=200, content=b"Mail: info@example.com", headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+    path = tmp_path / "queue.sqlite3"
+    seeds = [f"https://site{i}.example/" for i in range(6)]
+    enqueue_seeds(SqliteTaskQueue(path), seeds)
+
+    workers = [
+        Thread(target=CrawlWorker(SqliteTaskQueue(path), worker_id=f"w{n}", checkpoint_dir=tmp_path).run)
+        for n in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    finished = list(SqliteTaskQueue(path).finished())
+    assert sorted(crawled) == seeds
+    assert {task.status for task in finished} == {"done"}
+    assert all(task.result["emails"] == ["info@example.com"] for task in finished)
@@ -0,0 +1,71 @@
+import pytest
+
+from contacts_parser.core.config import settings
+from contacts_parser.infra.retry import CircuitBreaker, CircuitBreakers, RetryPolicy
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.errors import PermanentParserError
+from contacts_parser.parser.parser import Parser
+
+
+def test_retry_policy_full_jitter_and_budget() -> None:
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0, budget=2)
+
+    assert all(0 <= policy.backoff(attempt) <= 4.0 for attempt in range(10))
+    assert policy.try_acquire()
+    assert policy.try_acquire()
+    assert not policy.try_acquire()
+    assert policy.retries == 2
+
+
+def test_circuit_breaker_opens_and_recovers() -> None:
+    breaker = CircuitBreaker(threshold=0.5, window=4, min_calls=4, cooldown=0)
+
+    breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+
+
+def test_unsettled_half_open_trial_is_released() -> None:
+    breaker = CircuitBreaker(threshold=0.5, window=2, min_calls=2, cooldown=0)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.allow()
+    breaker.release()
+
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_permanent_error_closes_half_open_breaker(monkeypatch) -> None:
+    def not_found(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> None:
+        raise PermanentParserError("HTTP 400")
+
+    monkeypatch.setattr(parser_module, "request_data", not_found)
+    monkeypatch.setattr(settings, "breaker_cooldown_seconds", 0.0)
+    parser = Parser("https://example.com/")
+    breaker = parser._breakers.get("https://example.com/")
+    for _ in range(settings.breaker_window):
+        breaker.record_failure()
+    assert breaker.state == "open"
+
+    with pytest.raises(PermanentParserError):
+        parser.parse_page("https://example.com/missing")
+
+    assert breaker.state == "closed"
+
+
+def test_circuit_breakers_are_keyed_by_host() -> None:
+    breakers = CircuitBreakers()
+
+    assert breakers.get("https://example.com/a") is breakers.get("https://example.com/b")
+    assert breakers.states() == {"example.com": "closed"}
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from contacts_parser.infra.store import ResultStore
+from contacts_parser.parser import parser as parser_module
+from contacts_parser.parser.parser import Parser
+
+
+def test_result_store_dedups_contacts_across_domains() -> None:
+    store = ResultStore(":memory:")
+    first, last = datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    store.add("https://www.a.example/", ["Info@A.example"], ["+79991234567", "89991234567"], last)
+    store.add("https://b.example/contacts", [], ["+7 (999) 123-45-67"], first)
+    store.add("https://a.example/", [], ["8 999 123 45 67"], first)
+
+    hits = store.domains_for("8 (999) 123-45-67")
+    assert [hit.domain for hit in hits] == ["a.example", "b.example"]
+    assert (hits[0].first_seen, hits[0].last_seen) == (first, last)
+    assert store.contacts_for("www.a.example") == {"emails": ["info@a.example"], "phones": ["+79991234567"]}
+    assert store._conn.execute("SELECT COUNT(*) FROM contacts WHERE kind = 'phone'").fetchone() == (1,)
+
+
+def test_result_store_batches_writes() -> None:
+    store = ResultStore(":memory:", batch_size=2)
+
+    store.add("https://a.example/", ["a@a.example"], [])
+    assert store._conn.execute("SELECT COUNT(*) FROM domain_contacts").fetchone() == (0,)
+    store.add("https://b.example/", ["b@b.example"], [])
+    assert store._conn.execute("SELECT COUNT(*) FROM domain_contacts").fetchone() == (2,)
+
+
+def test_parser_saves_result_to_store(monkeypatch) -> None:
+    store = ResultStore(":memory:")
+
+    def fake_request_data(session, url: str, timeout: float, headers=None, metrics=None, cancel=None) -> SimpleNamespace:
+        return SimpleNamespace(status_code=200, content=b"Mail: info@example.com, tel 8 999 123-45-67", headers={})
+
+    monkeypatch.setattr(parser_module, "request_data", fake_request_data)
+
+    Parser("https://example.com/", store=store).run()
+
+    assert [hit.domain for hit in store.domains_for("info@example.com")] == ["example.com"]
+    assert store.contacts_for("example.com")["phones"] == ["+79991234567"]
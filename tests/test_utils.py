@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
 
-from contacts_parser.parser.utils import grab_contacts
+from contacts_parser.parser.extractor import extract_from_html, extract_from_soup
+from contacts_parser.parser.utils import contacts_from_extracted, extract_contacts_batch, grab_contacts, phone_variants
 
 
 def test_grab_contacts_extracts_emails_and_phones() -> None:
@@ -25,3 +26,44 @@ def test_grab_contacts_extracts_emails_and_phones() -> None:
         "79991234567",
         "89991234567",
     }
+
+
+def test_extract_from_html_matches_soup_walk() -> None:
+    html = """
+    <html>
+        <head><script>var x = "ignored@example.com";</script></head>
+        <body>
+            <a href="mailto:info@example.com?subject=hi">Email</a>
+            <a href="tel:+7 (999) 123-45-67">Phone</a>
+            <img src="https://example.com/logo.png" />
+            <p>Support: support@example.com</p>
+        </body>
+    </html>
+    """
+
+    from_callbacks = extract_from_html(html)
+    from_soup = extract_from_soup(BeautifulSoup(html, "html.parser"))
+
+    assert from_callbacks.hrefs == from_soup.hrefs
+    assert from_callbacks.srcs == from_soup.srcs
+    assert from_callbacks.mailto == ["mailto:info@example.com?subject=hi"]
+    assert from_callbacks.tel == ["tel:+7 (999) 123-45-67"]
+    assert set(contacts_from_extracted(from_callbacks)["emails"]) == set(contacts_from_extracted(from_soup)["emails"])
+    assert "ignored@example.com" not in "".join(from_callbacks.text)
+
+
+def test_extract_contacts_batch_keeps_texts_apart() -> None:
+    texts = [
+        "Sales: sales@example.com, 8 (999) 123-45-67",
+        "",
+        "Support +7 912 000-11-22 and 495 1234567",
+        "no contacts, just 123 numbers 4567",
+    ]
+
+    contacts = extract_contacts_batch(texts)
+
+    assert [c.emails for c in contacts] == [{"sales@example.com"}, set(), set(), set()]
+    assert contacts[0].phones == {"+79991234567"}
+    assert contacts[2].phones == {"+79120001122", "+74951234567"}
+    assert not contacts[1].phones and not contacts[3].phones
+    assert phone_variants("+79991234567") == ("+79991234567", "79991234567", "89991234567")
@@ -1,7 +1,7 @@
 import pytest
 
 from contacts_parser.parser.errors import PermanentParserError
-from contacts_parser.parser.validators import parse_base_url, validate_and_normalize_url
+from contacts_parser.parser.validators import is_asset_url, parse_base_url, validate_and_normalize_url
 
 
 def test_validate_and_normalize_url_normalizes_www_and_path() -> None:
@@ -24,3 +24,16 @@ def test_validate_and_normalize_url_requires_netloc(url: str) -> None:
 
 def test_parse_base_url_strips_path() -> None:
     assert parse_base_url("https://example.com/sub/page") == "https://example.com/"
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://example.com/files/price.PDF", True),
+        ("https://example.com/img/logo.png?v=2", True),
+        ("https://example.com/kontakty", False),
+        ("https://example.com/about.html", False),
+    ],
+)
+def test_is_asset_url(url: str, expected: bool) -> None:
+    assert is_asset_url(url) is expected
@@ -0,0 +1,21 @@
+from contacts_parser.parser.visited import BloomFilter, FingerprintSet
+
+
+def test_fingerprint_set_is_exact() -> None:
+    visited = FingerprintSet()
+    visited.add("https://example.com/a")
+
+    assert "https://example.com/a" in visited
+    assert "https://example.com/b" not in visited
+    assert len(visited) == 1
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    urls = [f"https://example.com/page-{i}" for i in range(10_000)]
+    for url in urls:
+        bloom.add(url)
+
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://example.com/other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 300